@@ -0,0 +1,171 @@
+"""Benchmarks of the hot paths of genomenotebook on synthetic genomes of increasing size.
+
+    python benchmarks/run_benchmarks.py                       # run and compare with benchmarks/baselines.json
+    python benchmarks/run_benchmarks.py --sizes 1000 1000000  # choose the numbers of features
+    python benchmarks/run_benchmarks.py --save                # store the results as the new baselines
+
+Timings are the best of --repeat runs (benchmarks taking more than a second run once). 
+`import genomenotebook` is timed in fresh interpreters.
+The process exits with status 1 if a benchmark is slower than its baseline by more than --tolerance, 
+if the html output grew by more than 1%, or if importing genomenotebook loaded a module that should be imported lazily.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import write_synthetic_genome
+
+from genomenotebook.utils import parse_gff, parse_genbank, add_z_order, render_cache
+from genomenotebook.glyphs import get_feature_patches, get_default_glyphs
+from genomenotebook.browser import GenomeBrowser
+from genomenotebook.plot import GenomePlot
+
+default_sizes = [1_000, 10_000, 100_000]
+default_baseline = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# maximum number of features for each benchmark, larger sizes are skipped
+max_features = {
+    "parse_gff": None,
+    "parse_genbank": 100_000, # Biopython parsing is slow
+    "get_feature_patches": None,
+    "add_z_order": None,
+    "collect_elements": None,
+    "save_html": 100_000,
+    "save_html_cached": 100_000,
+}
+
+noise_floor = 0.01 # differences smaller than this number of seconds are not considered as regressions
+
+# modules that are only imported when they are used (parsing, export or display), not by `import genomenotebook`
+lazy_modules = ["Bio", "selenium", "svgutils", "chromedriver_binary", "IPython", "pysam", "pyBigWig"]
+
+import_script = f"""
+import json, sys, time
+t0 = time.perf_counter()
+import genomenotebook
+seconds = time.perf_counter() - t0
+print(json.dumps({{"seconds": seconds, "eager_modules": [m for m in {lazy_modules!r} if m in sys.modules]}}))
+"""
+
+
+def timed(func, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = func()
+        best = min(best, time.perf_counter() - t0)
+        if best > 1: # slow benchmarks are not repeated
+            break
+    return best, out
+
+
+def import_time(repeat):
+    """Times `import genomenotebook` in fresh interpreters and lists the lazy modules that were imported"""
+    runs = [json.loads(subprocess.run([sys.executable, "-c", import_script], capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeat)]
+    return {"seconds": min(run["seconds"] for run in runs), "eager_modules": runs[0]["eager_modules"]}
+
+
+def run_size(n, repeat, directory):
+    """Runs all the benchmarks on a synthetic genome with n features and returns {benchmark: metrics}"""
+    enabled = {name: cap is None or n <= cap for name, cap in max_features.items()}
+    paths = write_synthetic_genome(os.path.join(directory, str(n)), n, sequence=enabled["parse_genbank"])
+    results = {}
+
+    seconds, dfs = timed(lambda: parse_gff(paths["gff"], seq_id=paths["seq_id"]), repeat)
+    features = dfs[0]
+    results["parse_gff"] = {"seconds": seconds, "rows": len(features)}
+
+    if enabled["parse_genbank"]:
+        seconds, _ = timed(lambda: parse_genbank(paths["genbank"]), repeat)
+        results["parse_genbank"] = {"seconds": seconds}
+
+    glyphs = get_default_glyphs()
+    seconds, patches = timed(lambda: get_feature_patches(features, 0, paths["length"], glyphs_dict=glyphs, attributes=None), repeat)
+    results["get_feature_patches"] = {"seconds": seconds, "rows": len(patches)}
+
+    if enabled["add_z_order"]:
+        seconds, _ = timed(lambda: add_z_order(features.copy()), repeat)
+        results["add_z_order"] = {"seconds": seconds}
+
+    browser = GenomeBrowser(features=features.copy(), show_seq=False)
+    seconds, _ = timed(lambda: GenomePlot(browser)._collect_elements(), repeat)
+    results["collect_elements"] = {"seconds": seconds}
+
+    if enabled["save_html"]:
+        fname = os.path.join(directory, f"synth_{n}.html")
+        # the render cache is cleared so that each run builds and serializes the plot
+        seconds, _ = timed(lambda: (render_cache.clear(), browser.save_html(fname)), repeat)
+        results["save_html"] = {"seconds": seconds, "bytes": os.path.getsize(fname)}
+
+    if enabled["save_html_cached"]:
+        browser.save_html(fname)
+        seconds, _ = timed(lambda: browser.save_html(fname), repeat)
+        results["save_html_cached"] = {"seconds": seconds}
+
+    return results
+
+
+def compare(results, baselines, tolerance):
+    """Prints the results next to the baselines and returns the list of regressions"""
+    regressions = []
+    print(f"{'benchmark':<22}{'features':>10}{'seconds':>10}{'baseline':>10}{'ratio':>8}{'bytes':>14}")
+    for name, by_size in results.items():
+        for n, metrics in by_size.items():
+            base = baselines.get(name, {}).get(n, {})
+            ratio = metrics["seconds"] / base["seconds"] if base.get("seconds") else float("nan")
+            print(f"{name:<22}{n:>10}{metrics['seconds']:>10.3f}{base.get('seconds', float('nan')):>10.3f}{ratio:>8.2f}{metrics.get('bytes', ''):>14}")
+            if base.get("seconds") is not None and metrics["seconds"] > base["seconds"]*(1+tolerance) and metrics["seconds"] - base["seconds"] > noise_floor:
+                regressions.append(f"{name} ({n} features) took {metrics['seconds']:.3f}s, baseline {base['seconds']:.3f}s")
+            if base.get("bytes") is not None and metrics["bytes"] > base["bytes"]*1.01:
+                regressions.append(f"{name} ({n} features) wrote {metrics['bytes']} bytes, baseline {base['bytes']} bytes")
+            if len(metrics.get("eager_modules", [])) > 0:
+                regressions.append(f"{name} imported {', '.join(metrics['eager_modules'])}, which should only be imported when used")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes, help="numbers of features of the synthetic genomes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs of each benchmark, the best time is kept")
+    parser.add_argument("--baseline", default=default_baseline, help="path to the json file of baselines")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown before reporting a regression")
+    parser.add_argument("--save", action="store_true", help="store the results in the baseline file")
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    results = {"import": {"all": import_time(args.repeat)}}
+    with tempfile.TemporaryDirectory() as directory:
+        for n in args.sizes:
+            for name, metrics in run_size(n, args.repeat, directory).items():
+                results.setdefault(name, {})[str(n)] = metrics
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as handle:
+            baselines = json.load(handle)["benchmarks"]
+    regressions = compare(results, baselines, args.tolerance)
+
+    if args.save:
+        for name, by_size in results.items():
+            baselines.setdefault(name, {}).update(by_size)
+        with open(args.baseline, "w") as handle:
+            json.dump({"machine": {"python": platform.python_version(), "platform": platform.platform()},
+                       "benchmarks": baselines}, handle, indent=1, sort_keys=True)
+        print(f"Baselines saved in {args.baseline}")
+    elif len(regressions) > 0:
+        print("\nRegressions:\n" + "\n".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Generates synthetic genomes (GFF, FASTA, GenBank and bedGraph files) of arbitrary size for the benchmarks"""
+
+import numpy as np
+import pandas as pd
+import os
+
+from Bio import SeqIO
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from Bio.SeqFeature import SeqFeature, FeatureLocation
+
+from typing import Tuple
+
+feature_types = ["CDS", "CDS", "CDS", "tRNA", "ncRNA", "repeat_region"] # CDS are three times more frequent than other types
+
+
+def synthetic_features(n_features: int, # number of features to generate
+                       seq_id: str = "synth_1", # id of the synthetic sequence
+                       spacing: int = 500, # average distance between the start of consecutive features
+                       seed: int = 0, # seed of the random number generator
+                      )->Tuple[int, pd.DataFrame]:
+    """Returns the length of the genome and a DataFrame with the columns of a GFF file, where attributes is the GFF attribute string.
+    Feature lengths are drawn so that neighbouring features regularly overlap."""
+    rng = np.random.default_rng(seed)
+    lefts = np.sort(rng.integers(1, n_features*spacing, n_features))
+    rights = lefts + rng.integers(60, 3*spacing, n_features)
+    ix = np.arange(n_features)
+    locus_tags = np.char.add("SYN_", np.char.zfill(ix.astype(str), 7))
+    attributes = ("ID=" + pd.Series(locus_tags) + ";gene=g" + pd.Series(ix.astype(str))
+                  + ";locus_tag=" + pd.Series(locus_tags) + ";product=synthetic protein " + pd.Series(ix.astype(str)))
+    features = pd.DataFrame({"seq_id": seq_id,
+                             "source": "synthetic",
+                             "type": rng.choice(feature_types, n_features),
+                             "start": lefts,
+                             "end": rights,
+                             "score": ".",
+                             "strand": rng.choice(["+", "-"], n_features),
+                             "phase": ".",
+                             "attributes": attributes.values})
+    return int(rights.max()) + spacing, features
+
+
+def synthetic_sequence(length: int, seed: int = 0)->str:
+    rng = np.random.default_rng(seed)
+    return np.frombuffer(b"ACGT", dtype=np.uint8)[rng.integers(0, 4, length)].tobytes().decode()
+
+
+def write_gff(path: str, features: pd.DataFrame):
+    with open(path, "w") as handle:
+        handle.write("##gff-version 3\n")
+        features.to_csv(handle, sep="\t", header=False, index=False)
+
+
+def write_fasta(path: str, seq_id: str, seq: str):
+    SeqIO.write(SeqRecord(Seq(seq), id=seq_id, description=""), path, "fasta")
+
+
+def write_genbank(path: str, seq_id: str, seq: str, features: pd.DataFrame):
+    rec = SeqRecord(Seq(seq), id=seq_id, name=seq_id, description="synthetic genome",
+                    annotations={"molecule_type": "DNA"})
+    for f in features.itertuples():
+        qualifiers = dict(kv.split("=") for kv in f.attributes.split(";"))
+        rec.features.append(SeqFeature(FeatureLocation(int(f.start)-1, int(f.end), strand=1 if f.strand=="+" else -1),
+                                       type=f.type, qualifiers={k: [v] for k, v in qualifiers.items()}))
+    SeqIO.write(rec, path, "genbank")
+
+
+def write_bedgraph(path: str, seq_id: str, length: int, step: int = 50, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    lefts = np.arange(0, length, step)
+    pd.DataFrame({"seq_id": seq_id, "left": lefts, "right": lefts + step,
+                  "value": rng.random(len(lefts)).round(3)}).to_csv(path, sep="\t", header=False, index=False)
+
+
+def write_synthetic_genome(directory: str, # directory where the files are written
+                           n_features: int, # number of features
+                           sequence: bool = True, # if False, the FASTA and GenBank files are not written
+                           seed: int = 0,
+                          )->dict:
+    """Writes a synthetic genome with n_features features and returns the paths of the files"""
+    os.makedirs(directory, exist_ok=True)
+    seq_id = "synth_1"
+    length, features = synthetic_features(n_features, seq_id=seq_id, seed=seed)
+    paths = {"seq_id": seq_id, "length": length,
+             "gff": os.path.join(directory, f"synth_{n_features}.gff"),
+             "bedgraph": os.path.join(directory, f"synth_{n_features}.bedgraph")}
+    write_gff(paths["gff"], features)
+    write_bedgraph(paths["bedgraph"], seq_id, length, seed=seed)
+    if sequence:
+        seq = synthetic_sequence(length, seed=seed)
+        paths["fasta"] = os.path.join(directory, f"synth_{n_features}.fasta")
+        paths["genbank"] = os.path.join(directory, f"synth_{n_features}.gb")
+        write_fasta(paths["fasta"], seq_id, seq)
+        write_genbank(paths["genbank"], seq_id, seq, features)
+    return paths
@@ -11,8 +11,4 @@ from .glyphs import (get_default_glyphs,
                     Glyph, 
                     default_attributes,
                     )
-from bokeh.io import output_notebook
-
 from . import javascript as _js
-
-output_notebook(hide_banner=True) 
\ No newline at end of file
@@ -15,20 +15,46 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser._get_sequence_from_fasta': ( 'API/browser.html#genomebrowser._get_sequence_from_fasta',
                                                                                                            'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser._load': ( 'API/browser.html#genomebrowser._load',
+                                                                                        'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser._overlapping_feature_names': ( 'API/browser.html#genomebrowser._overlapping_feature_names',
+                                                                                                             'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser._prepare_data': ( 'API/browser.html#genomebrowser._prepare_data',
                                                                                                 'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser._render_key': ( 'API/browser.html#genomebrowser._render_key',
+                                                                                              'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser._show_progressively': ( 'API/browser.html#genomebrowser._show_progressively',
+                                                                                                      'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_feature_data': ( 'API/browser.html#genomebrowser.add_feature_data',
+                                                                                                   'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_heatmap_track': ( 'API/browser.html#genomebrowser.add_heatmap_track',
+                                                                                                    'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_motif_track': ( 'API/browser.html#genomebrowser.add_motif_track',
+                                                                                                  'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_orf_track': ( 'API/browser.html#genomebrowser.add_orf_track',
+                                                                                                'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_sequence_track': ( 'API/browser.html#genomebrowser.add_sequence_track',
+                                                                                                     'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.add_tooltip_data': ( 'API/browser.html#genomebrowser.add_tooltip_data',
                                                                                                    'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.add_track': ( 'API/browser.html#genomebrowser.add_track',
                                                                                             'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.add_variant_track': ( 'API/browser.html#genomebrowser.add_variant_track',
+                                                                                                    'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.highlight': ( 'API/browser.html#genomebrowser.highlight',
                                                                                             'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.loaded': ( 'API/browser.html#genomebrowser.loaded',
+                                                                                         'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.payload_report': ( 'API/browser.html#genomebrowser.payload_report',
+                                                                                                 'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.save': ( 'API/browser.html#genomebrowser.save',
                                                                                        'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.save_html': ( 'API/browser.html#genomebrowser.save_html',
                                                                                             'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowser.show': ( 'API/browser.html#genomebrowser.show',
                                                                                        'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeBrowser.wait': ( 'API/browser.html#genomebrowser.wait',
+                                                                                       'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowserModifier': ( 'API/browser.html#genomebrowsermodifier',
                                                                                           'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeBrowserModifier.__init__': ( 'API/browser.html#genomebrowsermodifier.__init__',
@@ -38,6 +64,8 @@ d = { 'settings': { 'branch': 'main',
                                         'genomenotebook.browser.GenomeStack': ('API/browser.html#genomestack', 'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeStack.__init__': ( 'API/browser.html#genomestack.__init__',
                                                                                          'genomenotebook/browser.py'),
+                                        'genomenotebook.browser.GenomeStack._render_key': ( 'API/browser.html#genomestack._render_key',
+                                                                                            'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeStack.from_genbank': ( 'API/browser.html#genomestack.from_genbank',
                                                                                              'genomenotebook/browser.py'),
                                         'genomenotebook.browser.GenomeStack.get_elements': ( 'API/browser.html#genomestack.get_elements',
@@ -72,15 +100,22 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.box_coordinates': ( 'API/glyphs.html#box_coordinates',
                                                                                   'genomenotebook/glyphs.py'),
+                                       'genomenotebook.glyphs.gene_model_coordinates': ( 'API/glyphs.html#gene_model_coordinates',
+                                                                                         'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_default_glyphs': ( 'API/glyphs.html#get_default_glyphs',
                                                                                      'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_feature_name': ( 'API/glyphs.html#get_feature_name',
                                                                                    'genomenotebook/glyphs.py'),
+                                       'genomenotebook.glyphs.get_feature_names': ( 'API/glyphs.html#get_feature_names',
+                                                                                    'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_feature_patches': ( 'API/glyphs.html#get_feature_patches',
                                                                                       'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_patch_coordinates': ( 'API/glyphs.html#get_patch_coordinates',
                                                                                         'genomenotebook/glyphs.py'),
+                                       'genomenotebook.glyphs.get_patch_index': ( 'API/glyphs.html#get_patch_index',
+                                                                                  'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_tooltip': ('API/glyphs.html#get_tooltip', 'genomenotebook/glyphs.py'),
+                                       'genomenotebook.glyphs.get_tooltips': ('API/glyphs.html#get_tooltips', 'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.get_y_range': ('API/glyphs.html#get_y_range', 'genomenotebook/glyphs.py'),
                                        'genomenotebook.glyphs.html_wordwrap': ( 'API/glyphs.html#html_wordwrap',
                                                                                 'genomenotebook/glyphs.py')},
@@ -92,38 +127,201 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._add_track': ( 'API/plot.html#genomeplot._add_track',
                                                                                     'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._apply_payload_budget': ( 'API/plot.html#genomeplot._apply_payload_budget',
+                                                                                               'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._collect_elements': ( 'API/plot.html#genomeplot._collect_elements',
                                                                                            'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._estimate_payload': ( 'API/plot.html#genomeplot._estimate_payload',
+                                                                                           'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._get_browser_elements': ( 'API/plot.html#genomeplot._get_browser_elements',
                                                                                                'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._get_loaded_range': ( 'API/plot.html#genomeplot._get_loaded_range',
+                                                                                           'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._get_main_fig': ( 'API/plot.html#genomeplot._get_main_fig',
                                                                                        'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._get_overview': ( 'API/plot.html#genomeplot._get_overview',
+                                                                                       'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._get_overview_levels': ( 'API/plot.html#genomeplot._get_overview_levels',
+                                                                                              'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._get_search_box': ( 'API/plot.html#genomeplot._get_search_box',
                                                                                          'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._get_sequence_div': ( 'API/plot.html#genomeplot._get_sequence_div',
                                                                                            'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._get_sequence_search': ( 'API/plot.html#genomeplot._get_sequence_search',
                                                                                               'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._get_track_fig': ( 'API/plot.html#genomeplot._get_track_fig',
+                                                                                        'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._get_x_range': ( 'API/plot.html#genomeplot._get_x_range',
+                                                                                      'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._loaded_fraction': ( 'API/plot.html#genomeplot._loaded_fraction',
+                                                                                          'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._set_init_pos': ( 'API/plot.html#genomeplot._set_init_pos',
                                                                                        'genomenotebook/plot.py'),
                                      'genomenotebook.plot.GenomePlot._set_js_callbacks': ( 'API/plot.html#genomeplot._set_js_callbacks',
-                                                                                           'genomenotebook/plot.py')},
+                                                                                           'genomenotebook/plot.py'),
+                                     'genomenotebook.plot.GenomePlot._set_live': ( 'API/plot.html#genomeplot._set_live',
+                                                                                   'genomenotebook/plot.py')},
             'genomenotebook.track': { 'genomenotebook.track.Track': ('API/track.html#track', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.__init__': ('API/track.html#track.__init__', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track._bounded_data': ( 'API/track.html#track._bounded_data',
+                                                                                    'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track._plotted_data': ( 'API/track.html#track._plotted_data',
+                                                                                    'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track._set_live': ('API/track.html#track._set_live', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.bar': ('API/track.html#track.bar', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.coverage': ('API/track.html#track.coverage', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.custom': ('API/track.html#track.custom', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.get_fig': ('API/track.html#track.get_fig', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.heatmap': ('API/track.html#track.heatmap', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.highlight': ('API/track.html#track.highlight', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.line': ('API/track.html#track.line', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.motifs': ('API/track.html#track.motifs', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.orfs': ('API/track.html#track.orfs', 'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.scatter': ('API/track.html#track.scatter', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.sequence_content': ( 'API/track.html#track.sequence_content',
+                                                                                       'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.set_figure_data_source': ( 'API/track.html#track.set_figure_data_source',
                                                                                              'genomenotebook/track.py'),
                                       'genomenotebook.track.Track.set_track_data_source': ( 'API/track.html#track.set_track_data_source',
-                                                                                            'genomenotebook/track.py')},
-            'genomenotebook.utils': { 'genomenotebook.utils.EmptyDataFrame': ('API/utils.html#emptydataframe', 'genomenotebook/utils.py'),
+                                                                                            'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.signal': ('API/track.html#track.signal', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.stream': ('API/track.html#track.stream', 'genomenotebook/track.py'),
+                                      'genomenotebook.track.Track.variants': ('API/track.html#track.variants', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._bounded_bins': ('API/track.html#_bounded_bins', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._bounded_image': ('API/track.html#_bounded_image', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._downsample': ('API/track.html#_downsample', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._entry_payload': ('API/track.html#_entry_payload', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._image_window': ('API/track.html#_image_window', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._interval_index': ('API/track.html#_interval_index', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._is_point_source': ( 'API/track.html#_is_point_source',
+                                                                                 'genomenotebook/track.py'),
+                                      'genomenotebook.track._sample_axis': ('API/track.html#_sample_axis', 'genomenotebook/track.py'),
+                                      'genomenotebook.track._windowed_intervals': ( 'API/track.html#_windowed_intervals',
+                                                                                    'genomenotebook/track.py')},
+            'genomenotebook.utils': { 'genomenotebook.utils.AhoCorasick': ('API/utils.html#ahocorasick', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AhoCorasick.__init__': ( 'API/utils.html#ahocorasick.__init__',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AhoCorasick.find': ( 'API/utils.html#ahocorasick.find',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow': ('API/utils.html#attributerow', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.__getitem__': ( 'API/utils.html#attributerow.__getitem__',
+                                                                                         'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.__init__': ( 'API/utils.html#attributerow.__init__',
+                                                                                      'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.__iter__': ( 'API/utils.html#attributerow.__iter__',
+                                                                                      'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.__len__': ( 'API/utils.html#attributerow.__len__',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.__repr__': ( 'API/utils.html#attributerow.__repr__',
+                                                                                      'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeRow.copy': ( 'API/utils.html#attributerow.copy',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore': ('API/utils.html#attributestore', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.__init__': ( 'API/utils.html#attributestore.__init__',
+                                                                                        'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.__len__': ( 'API/utils.html#attributestore.__len__',
+                                                                                       'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.copy': ( 'API/utils.html#attributestore.copy',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.from_matches': ( 'API/utils.html#attributestore.from_matches',
+                                                                                            'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.from_records': ( 'API/utils.html#attributestore.from_records',
+                                                                                            'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.get': ( 'API/utils.html#attributestore.get',
+                                                                                   'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.keys': ( 'API/utils.html#attributestore.keys',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.rank': ( 'API/utils.html#attributestore.rank',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.ranks_of': ( 'API/utils.html#attributestore.ranks_of',
+                                                                                        'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.rows': ( 'API/utils.html#attributestore.rows',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.set': ( 'API/utils.html#attributestore.set',
+                                                                                   'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.AttributeStore.update': ( 'API/utils.html#attributestore.update',
+                                                                                      'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.EmptyDataFrame': ('API/utils.html#emptydataframe', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex': ('API/utils.html#intervalindex', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex.__init__': ( 'API/utils.html#intervalindex.__init__',
+                                                                                       'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex.__len__': ( 'API/utils.html#intervalindex.__len__',
+                                                                                      'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex.query': ( 'API/utils.html#intervalindex.query',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex.query_many': ( 'API/utils.html#intervalindex.query_many',
+                                                                                         'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.IntervalIndex.take': ( 'API/utils.html#intervalindex.take',
+                                                                                   'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery': ('API/utils.html#regionquery', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.__init__': ( 'API/utils.html#regionquery.__init__',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery._load_features': ( 'API/utils.html#regionquery._load_features',
+                                                                                           'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery._load_sequence': ( 'API/utils.html#regionquery._load_sequence',
+                                                                                           'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.features': ( 'API/utils.html#regionquery.features',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.query': ( 'API/utils.html#regionquery.query',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.query_features': ( 'API/utils.html#regionquery.query_features',
+                                                                                           'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.seq_ids': ( 'API/utils.html#regionquery.seq_ids',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RegionQuery.sequence': ( 'API/utils.html#regionquery.sequence',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache': ('API/utils.html#rendercache', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache.__init__': ( 'API/utils.html#rendercache.__init__',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache.clear': ( 'API/utils.html#rendercache.clear',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache.get': ('API/utils.html#rendercache.get', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache.nbytes': ( 'API/utils.html#rendercache.nbytes',
+                                                                                   'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.RenderCache.put': ('API/utils.html#rendercache.put', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.StageProfiler': ('API/utils.html#stageprofiler', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.StageProfiler.__init__': ( 'API/utils.html#stageprofiler.__init__',
+                                                                                       'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.StageProfiler.reset': ( 'API/utils.html#stageprofiler.reset',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.StageProfiler.stage': ( 'API/utils.html#stageprofiler.stage',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.StageProfiler.to_df': ( 'API/utils.html#stageprofiler.to_df',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._Uncacheable': ('API/utils.html#_uncacheable', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._base_counts': ('API/utils.html#_base_counts', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._bin_means': ('API/utils.html#_bin_means', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._code_dtype': ('API/utils.html#_code_dtype', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._codon_lookup': ('API/utils.html#_codon_lookup', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._codon_numbers': ('API/utils.html#_codon_numbers', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._content_from_counts': ( 'API/utils.html#_content_from_counts',
+                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._count_header_lines': ( 'API/utils.html#_count_header_lines',
+                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._estimate_column_bytes': ( 'API/utils.html#_estimate_column_bytes',
+                                                                                       'genomenotebook/utils.py'),
                                       'genomenotebook.utils._gb_show': ('API/utils.html#_gb_show', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._genotype_codes': ('API/utils.html#_genotype_codes', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._hash_update': ('API/utils.html#_hash_update', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._is_installed': ('API/utils.html#_is_installed', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._iter_tabular': ('API/utils.html#_iter_tabular', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._model_hierarchy': ( 'API/utils.html#_model_hierarchy',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._notebook_content': ( 'API/utils.html#_notebook_content',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._publish_notebook_content': ( 'API/utils.html#_publish_notebook_content',
+                                                                                          'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._raster_grid': ('API/utils.html#_raster_grid', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._read_bigwig': ('API/utils.html#_read_bigwig', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._reduce_events': ('API/utils.html#_reduce_events', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils._save': ('API/utils.html#_save', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils._save_html': ('API/utils.html#_save_html', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._shared_store': ('API/utils.html#_shared_store', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._split_blocks': ('API/utils.html#_split_blocks', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._tabix_index': ('API/utils.html#_tabix_index', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._vcf_header_lines': ( 'API/utils.html#_vcf_header_lines',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils._wig_chunk': ('API/utils.html#_wig_chunk', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.add_extension': ('API/utils.html#add_extension', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.add_z_order': ('API/utils.html#add_z_order', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.attributes_to_columns': ( 'API/utils.html#attributes_to_columns',
@@ -132,26 +330,66 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'genomenotebook/utils.py'),
                                       'genomenotebook.utils.available_feature_types': ( 'API/utils.html#available_feature_types',
                                                                                         'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.content_hash': ('API/utils.html#content_hash', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.content_pyramid': ('API/utils.html#content_pyramid', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.default_open_gz': ('API/utils.html#default_open_gz', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.density_pyramid': ('API/utils.html#density_pyramid', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.download_file': ('API/utils.html#download_file', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.estimate_payload': ( 'API/utils.html#estimate_payload',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.expand_iupac': ('API/utils.html#expand_iupac', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.extract_all_attributes': ( 'API/utils.html#extract_all_attributes',
                                                                                        'genomenotebook/utils.py'),
                                       'genomenotebook.utils.extract_attribute': ( 'API/utils.html#extract_attribute',
                                                                                   'genomenotebook/utils.py'),
                                       'genomenotebook.utils.extract_attributes': ( 'API/utils.html#extract_attributes',
                                                                                    'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.feature_density': ('API/utils.html#feature_density', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.find_motifs': ('API/utils.html#find_motifs', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.find_orfs': ('API/utils.html#find_orfs', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.find_runs': ('API/utils.html#find_runs', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.gene_models': ('API/utils.html#gene_models', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.get_attribute_values': ( 'API/utils.html#get_attribute_values',
+                                                                                     'genomenotebook/utils.py'),
                                       'genomenotebook.utils.get_attributes': ('API/utils.html#get_attributes', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.get_cds_name': ('API/utils.html#get_cds_name', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.get_cds_unique_name': ( 'API/utils.html#get_cds_unique_name',
                                                                                     'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.gff_attribute_store': ( 'API/utils.html#gff_attribute_store',
+                                                                                    'genomenotebook/utils.py'),
                                       'genomenotebook.utils.in_wsl': ('API/utils.html#in_wsl', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.index_by_id': ('API/utils.html#index_by_id', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.inspect_feature_types': ( 'API/utils.html#inspect_feature_types',
                                                                                       'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.interval_coverage': ( 'API/utils.html#interval_coverage',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.interval_join': ('API/utils.html#interval_join', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.is_gzipped_file': ('API/utils.html#is_gzipped_file', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.iter_bed': ('API/utils.html#iter_bed', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.iter_bedgraph': ('API/utils.html#iter_bedgraph', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.iter_vcf': ('API/utils.html#iter_vcf', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.iter_wig': ('API/utils.html#iter_wig', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.matrix_pyramid': ('API/utils.html#matrix_pyramid', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.merge_intervals': ('API/utils.html#merge_intervals', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.parse_fasta': ('API/utils.html#parse_fasta', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.parse_genbank': ('API/utils.html#parse_genbank', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.parse_gff': ('API/utils.html#parse_gff', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.parse_recs': ('API/utils.html#parse_recs', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.raster_pyramid': ('API/utils.html#raster_pyramid', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.rasterize_points': ( 'API/utils.html#rasterize_points',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.read_arrow_track': ( 'API/utils.html#read_arrow_track',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.read_track_file': ('API/utils.html#read_track_file', 'genomenotebook/utils.py'),
                                       'genomenotebook.utils.regions_overlap': ('API/utils.html#regions_overlap', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.reverse_complement': ( 'API/utils.html#reverse_complement',
+                                                                                   'genomenotebook/utils.py'),
                                       'genomenotebook.utils.seqRecord_to_df': ('API/utils.html#seqrecord_to_df', 'genomenotebook/utils.py'),
-                                      'genomenotebook.utils.set_positions': ('API/utils.html#set_positions', 'genomenotebook/utils.py')}}}
+                                      'genomenotebook.utils.sequence_content': ( 'API/utils.html#sequence_content',
+                                                                                 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.set_positions': ('API/utils.html#set_positions', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.update_attributes': ( 'API/utils.html#update_attributes',
+                                                                                  'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.vcf_samples': ('API/utils.html#vcf_samples', 'genomenotebook/utils.py'),
+                                      'genomenotebook.utils.with_gene_models': ( 'API/utils.html#with_gene_models',
+                                                                                 'genomenotebook/utils.py')}}}
@@ -8,14 +8,25 @@ __all__ = ['GenomeBrowser', 'GenomeBrowserModifier', 'HighlightModifier', 'Genom
 # %% ../nbs/API/00_browser.ipynb 4
 from fastcore.basics import *
 
-from .track import Track
+from .track import Track, _windowed_intervals
 
 from genomenotebook.utils import (
     parse_gff,
     parse_fasta,
     parse_genbank,
     add_z_order,
+    with_gene_models,
+    interval_join,
+    IntervalIndex,
+    StageProfiler,
+    get_attribute_values,
+    update_attributes,
+    vcf_samples,
+    content_hash,
+    render_cache,
     _save_html,
+    _notebook_content,
+    _publish_notebook_content,
     _gb_show,
     _save
 )
@@ -27,20 +38,21 @@ from genomenotebook.plot import (
 from genomenotebook.glyphs import (
     get_feature_patches, 
     get_default_glyphs,
+    get_feature_names,
+    get_patch_index,
     _format_attribute
 )
 
 from bokeh.models import (
     ColumnDataSource,
     HoverTool, 
-    Quad
+    Quad,
+    Label,
+    NumeralTickFormatter
 )
-
-from bokeh.io import output_notebook
-
-output_notebook(hide_banner=True) #|hide_line
-
-import Bio
+from bokeh.plotting import figure
+from bokeh.layouts import column
+from bokeh.io import push_notebook
 
 import numpy as np
 import pandas as pd
@@ -49,11 +61,10 @@ import os
 from typing import Union, List, Dict, Optional
 from collections.abc import Mapping
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
-try: #for wsl and/or conda
-    import chromedriver_binary
-except:
-    pass
+if TYPE_CHECKING: # Biopython is only imported when parsing fasta or genbank files
+    import Bio.Seq
 
 # %% ../nbs/API/00_browser.ipynb 5
 class GenomeBrowser:
@@ -87,9 +98,14 @@ class GenomeBrowser:
                  show_labels: bool = True, # if False, then don't show feature labels
                  feature_height: float = 0.15, #fraction of the annotation track height occupied by the features
                  features:pd.DataFrame = None, # DataFrame with columns: ["seq_id", "source", "type", "start", "end", "score", "strand", "phase", "attributes"], where "attributes" is a dict of attributes.
-                 seq:Bio.Seq.Seq = None, # keeps the Biopython sequence object
+                 seq:"Bio.Seq.Seq" = None, # keeps the Biopython sequence object
                  color_attribute: str = None, # feature attribute to be used as patch color
                  z_stack: bool = False, #if true features that overlap will be stacked on top of each other
+                 profile: bool = False, #if true the duration, number of rows and payload size of each stage of construction and rendering are recorded in GenomeBrowser.profiler
+                 max_payload: int = 10**8, #maximum estimated size in bytes of the data embedded in the plot. Above it, tooltips are dropped, then tracks are downsampled and coarsened and then the bounds are reduced around init_pos. If None, the size is not limited
+                 gene_models: str = None, #"expanded" to draw each transcript as one gene model, or "collapsed" to draw one model per gene. Models are built from the ID and Parent attributes of the features
+                 overview: bool = False, #if true a minimap of the feature density along the whole region is shown above the browser, its selection controls the browser view
+                 background: bool = False, #if true the files are parsed and the glyphs prepared on a background thread so that the kernel stays usable, show() displays the frame right away and fills it in when the data is ready
                  **kwargs, #additional keyword arguments are passed as is to bokeh.plotting.figure
                  ):
         
@@ -124,6 +140,14 @@ class GenomeBrowser:
         self.seq = seq
         self.color_attribute = color_attribute
         self.z_stack = z_stack
+        self.profiler = StageProfiler(enabled=profile)
+        self.max_payload = max_payload
+        self.min_track_points = 1000 # tracks are not downsampled below this number of points
+        self.overview = overview
+        if gene_models not in (None, "expanded", "collapsed"):
+            raise ValueError(f"gene_models must be None, 'expanded' or 'collapsed', not {gene_models}")
+        self.gene_models = gene_models
+        self.overview_height = 80 # height of the overview
         self.kwargs=kwargs
         
         
@@ -154,22 +178,48 @@ class GenomeBrowser:
                 self.glyphs[feature_type].name_attr = feature_name_dic[feature_type]
     
 
+        if sum(1 for x in [gff_path, gb_path, features] if x is not None) != 1:
+            raise ValueError("Exactly one of gff_path, gb_path, or features must be provided")
+        self.tracks = [] # non-gene tracks, such as scatter plots, bar plots, etc.
+        self.modifiers = [] # modifiers
+
+        self._loading = None # future of the background loading
+        if background:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(1, thread_name_prefix="genomenotebook")
+            self._loading = executor.submit(self._load)
+            executor.shutdown(wait=False) # the thread exits once the data is loaded
+        else:
+            self._load()
+
+    @property
+    def loaded(self)->bool:
+        """False while the data of a browser created with background=True is being loaded"""
+        return self._loading is None or self._loading.done()
+
+    def _load(self):
+        """Parses the annotations and the sequence and prepares the glyphs"""
+
         ### Load sequence and sequence annotations ###
 
         # TODO: it would be nice to make sequence loading even more lazy, so that bounds and feature selection are not applied until render time,
         # which would allow users to swap out different features and change settings without creating a new GenomeBrowser object.
         # right now it's kind of confusing which properties are mutable and which are not.
         
-        if sum(1 for x in [gff_path, gb_path, features] if x is not None) != 1:
-            raise ValueError("Exactly one of gff_path, gb_path, or features must be provided")
-        elif gff_path:
+        if self.gff_path:
             self._get_gff_features()
-        elif gb_path:
+        elif self.gb_path:
             self._get_genbank_features()
         else: # features supplied as a pandas dataframe
             if not self.seq_id:
                 self.seq_id = self.features.loc[0,"seq_id"]
             
+        if self.gene_models is not None:
+            with self.profiler.stage("gene_models", rows=len(self.features)) as record:
+                self.features = with_gene_models(self.features, 
+                                                 collapse=self.gene_models=="collapsed", 
+                                                 feature_types=self.feature_types)
+                record["rows"] = len(self.features)
 
         if self.seq is None:
             self.seq_len = self.features.right.max()
@@ -186,30 +236,40 @@ class GenomeBrowser:
 
         ### initialize visualization ###
         if len(self.features)>0:
-            if z_stack:
-                add_z_order(self.features)
+            if self.z_stack:
+                with self.profiler.stage("add_z_order", rows=len(self.features)):
+                    add_z_order(self.features)
+            self.feature_index = IntervalIndex(self.features["left"].values, self.features["right"].values)
             self._prepare_data()
-        self.tracks = [] # non-gene tracks, such as scatter plots, bar plots, etc.
-        self.modifiers = [] # modifiers
     
     def _get_gff_features(self):
         #if seq_id is not provided parse_gff will take the first contig in the file
-        self.features = parse_gff(self.gff_path,
-                        seq_id=self.seq_id,
-                        bounds=self.bounds,
-                        feature_types=self.feature_types,
-                        attributes=self.attributes
-                        )[0]
+        with self.profiler.stage("parse_gff") as record:
+            feature_types, attributes = self.feature_types, self.attributes
+            if self.gene_models is not None:
+                # all the types are parsed to build the models, and the attributes linking the features are kept
+                feature_types = None
+                if attributes is not None:
+                    attributes = {k: v if v is None else list(v)+["ID", "Parent"] for k, v in attributes.items()}
+            self.features = parse_gff(self.gff_path,
+                            seq_id=self.seq_id,
+                            bounds=self.bounds,
+                            feature_types=feature_types,
+                            attributes=attributes
+                            )[0]
+            record["rows"] = len(self.features)
         self.seq_id = self.seq_id if self.seq_id else self.features.loc[0,"seq_id"]
         self._get_sequence_from_fasta()
 
     def _get_genbank_features(self):
-        self.seq, self.features = parse_genbank(self.gb_path,
-                        seq_id=self.seq_id,
-                        bounds=self.bounds,
-                        feature_types=self.feature_types,
-                        attributes=self.attributes
-                        )
+        with self.profiler.stage("parse_genbank") as record:
+            self.seq, self.features = parse_genbank(self.gb_path,
+                            seq_id=self.seq_id,
+                            bounds=self.bounds,
+                            feature_types=self.feature_types,
+                            attributes=self.attributes
+                            )
+            record["rows"] = len(self.features[0])
         self.seq = self.seq[0]
         self.features = self.features[0]
         self.seq_id = self.seq_id if self.seq_id else self.features.loc[0,"seq_id"]
@@ -223,7 +283,9 @@ class GenomeBrowser:
         #else seq_len is the right of the last feature
         if self.fasta_path != None:
             try:
-                self.seq = parse_fasta(self.fasta_path, self.seq_id)
+                with self.profiler.stage("parse_fasta") as record:
+                    self.seq = parse_fasta(self.fasta_path, self.seq_id)
+                    record["bytes"] = len(self.seq)
             except:
                 warnings.warn(f"genome file {self.fasta_path} cannot be parsed as a fasta file")
                 self.show_seq = False #if a sequence is not provided or cannot be parsed then show_seq set to False
@@ -232,26 +294,108 @@ class GenomeBrowser:
 
 
     def _prepare_data(self):
-        self.patches = get_feature_patches(self.features, 
-                                            self.bounds[0], 
-                                            self.bounds[1],
-                                            glyphs_dict=self.glyphs,
-                                            attributes=self.attributes,
-                                            feature_height = self.feature_height,
-                                            label_vertical_offset =self.label_vertical_offset,
-                                            label_justify=self.label_justify,
-                                            color_attribute = self.color_attribute
-                                            )
+        with self.profiler.stage("get_feature_patches") as record:
+            self.patches = get_feature_patches(self.features, 
+                                                self.bounds[0], 
+                                                self.bounds[1],
+                                                glyphs_dict=self.glyphs,
+                                                attributes=self.attributes,
+                                                feature_height = self.feature_height,
+                                                label_vertical_offset =self.label_vertical_offset,
+                                                label_justify=self.label_justify,
+                                                color_attribute = self.color_attribute,
+                                                index = self.feature_index
+                                                )
+            self.patch_index = get_patch_index(self.patches)
+            record["rows"] = len(self.patches)
 
 # %% ../nbs/API/00_browser.ipynb 16
 @patch
-def show(self:GenomeBrowser):
+def wait(self:GenomeBrowser, 
+         timeout: float = None, #maximum number of seconds to wait, if None wait until the data is loaded
+        )->GenomeBrowser:
+    """Waits until the data of a browser created with background=True is loaded and returns the browser. 
+    Errors raised while loading are raised here."""
+    if self._loading is not None:
+        self._loading.result(timeout)
+    return self
+
+# attributes that do not change the plot: the profiler, the loading future, indexes derived from the data and the bokeh models of the last rendering of the tracks
+_render_key_exclude = ["profiler", "_loading", "feature_index", "patch_index", "loaded_sources", "_plot_bounds", "_max_points", "_coarsening", "_tooltips", "_live", "_pyramid_levels", "_raster_images"]
+
+@patch
+def _render_key(self:GenomeBrowser, *context)->Optional[str]:
+    """Key of the plot of the browser in render_cache: a hash of its content and configuration, and of context. 
+    None if the cache is disabled or if the browser contains objects that cannot be hashed."""
+    if render_cache.max_bytes == 0:
+        return None
+    import bokeh
+    return content_hash([bokeh.__version__, context, self], exclude=_render_key_exclude)
+
+@patch
+def show(self:GenomeBrowser,
+         live: bool = False, #if True, the plot stays connected to the notebook so that the rows added with Track.stream are pushed to it
+        ):
     """
         Shows the plot in an interactive Jupyter notebook
     """
-    plot = GenomePlot(self)
-    plot._collect_elements()
-    _gb_show(plot.elements)
+    if not self.loaded:
+        self._show_progressively(live)
+        return
+    if live: # live plots are not cached, their data sources are updated after they are shown
+        plot = GenomePlot(self)
+        plot._collect_elements()
+        handle = _gb_show(plot.elements, notebook_handle=True)
+        plot._set_live(handle)
+        return
+    key = self._render_key("show")
+    content = render_cache.get(key)
+    if content is None:
+        plot = GenomePlot(self)
+        plot._collect_elements()
+        with self.profiler.stage("serialize") as record:
+            content = _notebook_content(plot.elements)
+            record["bytes"] = len(content[0])
+        render_cache.put(key, content)
+    with self.profiler.stage("bokeh_show"):
+        _publish_notebook_content(*content)
+
+@patch
+def _show_progressively(self:GenomeBrowser, 
+                        live: bool = False, #if True, the plot is connected to the tracks so that Track.stream updates it
+                       ):
+    """Shows an empty frame with the position axis while the data is loaded in the background, 
+    then replaces it with the plot once the data is ready"""
+    bounds = self.bounds if self.bounds is not None else (0, 1)
+    frame = figure(tools="", height=self.height, x_range=bounds, y_range=(0, 1), **self.kwargs)
+    frame.frame_width = self.width
+    frame.xaxis[0].formatter = NumeralTickFormatter(format="0,0")
+    frame.xgrid.visible = False
+    frame.ygrid.visible = False
+    frame.yaxis.visible = False
+    message = Label(x=10, y=self.height//2, x_units="screen", y_units="screen", text="Loading annotations...", text_color="gray")
+    frame.add_layout(message)
+    layout = column(frame)
+    handle = _gb_show([layout], notebook_handle=True)
+
+    def replace_frame(loading):
+        if loading.exception() is not None:
+            message.text = f"Loading failed: {loading.exception()}"
+        else:
+            plot = GenomePlot(self)
+            plot._collect_elements()
+            layout.children = plot.elements
+            if live:
+                plot._set_live(handle)
+        push_notebook(handle=handle)
+    self._loading.add_done_callback(replace_frame)
+
+# %% ../nbs/API/00_browser.ipynb 17
+@patch
+def payload_report(self:GenomeBrowser)->pd.DataFrame:
+    """Returns the estimated size in bytes of each component of the plot (glyphs, tooltips, sequence, tracks and highlights) 
+    before (estimated_bytes) and after (bytes) the reductions applied to fit in max_payload"""
+    return GenomePlot(self).payload_report
 
 # %% ../nbs/API/00_browser.ipynb 26
 @patch
@@ -261,13 +405,86 @@ def add_track(self: GenomeBrowser,
              **kwargs,
              ) -> Track:
     """Adds a track to the GenomeBrowser. Ensures that the x_range are shared and figure widths are identical."""
+    if self.bounds is None or self.seq_id is None: # they are set by the background loading
+        self.wait()
     t = Track(height=height, 
               tools=tools,
+              bounds=self.bounds,
+              seq_id=self.seq_id,
               **kwargs)
     self.tracks.append(t)
     return t
     
 
+@patch
+def add_sequence_track(self: GenomeBrowser,
+                       y: str = "gc", #gc, gc_skew, cumulative_skew or n (fraction of undetermined bases)
+                       height: int = 100, #size of the track
+                       **kwargs, #arguments passed to Track.sequence_content
+                      ) -> Track:
+    """Adds a track showing the GC content, GC skew, cumulative GC skew or fraction of N of the sequence of the browser"""
+    self.wait()
+    if self.seq is None:
+        raise ValueError("sequence tracks require the sequence, provide a fasta_path or a genbank file with a sequence")
+    track = self.add_track(height=height)
+    track.sequence_content(self.seq, y=y, start=self.bounds[0], **kwargs)
+    return track
+
+@patch
+def add_orf_track(self: GenomeBrowser,
+                  height: int = 150, #size of the track
+                  **kwargs, #arguments passed to Track.orfs
+                 ) -> Track:
+    """Adds a track showing the open reading frames and, when zoomed in, the translation of the six frames of the sequence of the browser"""
+    self.wait()
+    if self.seq is None:
+        raise ValueError("ORF tracks require the sequence, provide a fasta_path or a genbank file with a sequence")
+    track = self.add_track(height=height)
+    track.orfs(self.seq, start=self.bounds[0], **kwargs)
+    return track
+
+@patch
+def add_variant_track(self: GenomeBrowser,
+                      vcf_path: str, #path to a VCF file (also accepts gzip and bgzip files)
+                      height: int = None, #size of the track, defaults to 20 pixels per sample
+                      **kwargs, #arguments passed to Track.variants
+                     ) -> Track:
+    """Adds a track showing the variants of a VCF file on the sequence displayed, one row per sample"""
+    if height is None:
+        samples = kwargs.get("samples") or vcf_samples(vcf_path)
+        height = max(20*len(samples), 40) + 30
+    track = self.add_track(height=height)
+    track.variants(vcf_path, **kwargs)
+    return track
+
+@patch
+def add_motif_track(self: GenomeBrowser,
+                    motifs: Union[List[str], dict], #motifs (which can contain IUPAC codes), or dictionary of motifs by name
+                    height: int = 60, #size of the track
+                    **kwargs, #arguments passed to Track.motifs
+                   ) -> Track:
+    """Adds a track highlighting all the occurrences of a set of motifs in the sequence of the browser"""
+    self.wait()
+    if self.seq is None:
+        raise ValueError("motif tracks require the sequence, provide a fasta_path or a genbank file with a sequence")
+    track = self.add_track(height=height)
+    track.motifs(self.seq, motifs, start=self.bounds[0], **kwargs)
+    return track
+
+@patch
+def add_heatmap_track(self: GenomeBrowser,
+                      data: pd.DataFrame, #pandas DataFrame with one row per position and one column per sample
+                      height: int = None, #size of the track, defaults to 10 pixels per sample
+                      **kwargs, #arguments passed to Track.heatmap
+                     ) -> Track:
+    """Adds a track showing a matrix of values (e.g. the coverage of many samples) as a heatmap with one row per sample"""
+    if height is None:
+        samples = kwargs.get("samples") or [c for c in data.columns if c != kwargs.get("pos", "pos") and pd.api.types.is_numeric_dtype(data[c])]
+        height = max(10*len(samples), 40) + 30
+    track = self.add_track(height=height)
+    track.heatmap(data, **kwargs)
+    return track
+
 # %% ../nbs/API/00_browser.ipynb 29
 class GenomeBrowserModifier():
     def __init__(self, gene_track:bool = True, data_tracks:bool = False):
@@ -291,9 +508,11 @@ class HighlightModifier(GenomeBrowserModifier):
         alpha: str = 0.2, #transparency
         hover_data: List = None, #list of additional column names to be shown when hovering over the data
         highlight_tracks: bool = False, #whether to highlight just the annotation track or also the other tracks
+        merge: bool = True, #if True, regions less than a pixel apart are drawn as a single region when zoomed out
         **kwargs, #enables to pass keyword arguments used by the Bokeh function
         ):
 
+        self.merge = merge
         self.left_col = left_col
         self.right_col = right_col
         self.color_col = color_col
@@ -307,7 +526,7 @@ class HighlightModifier(GenomeBrowserModifier):
             self.data = data.copy() # copy the dataframe because we modify it below, and users might not expect their input to be modified.
         
         if self.color_col not in self.data.columns:
-            self.data[self.color_col] = 'green'
+            self.data[self.color_col] = color
         
         if alpha_col not in self.data.columns:
             self.data[self.alpha_col] = alpha
@@ -331,8 +550,15 @@ class HighlightModifier(GenomeBrowserModifier):
         
         super().__init__(gene_track=True, data_tracks=highlight_tracks)
         
-    def render(self, fig, track_mode=False, track_properties=None):
-        highlight_source = ColumnDataSource(self.data[[self.left_col,self.right_col,self.color_col,self.alpha_col]+self.hover_data])
+    def render(self, fig, track_mode=False, track_properties=None, loaded_range=None):
+        """Adds the highlights to fig. If loaded_range is given, only the regions around the window are loaded 
+        and the entry to be updated by the x_range dispatcher of the GenomePlot is returned."""
+        columns = [self.color_col,self.alpha_col]+self.hover_data
+        if loaded_range is None:
+            highlight_source, entry = ColumnDataSource(self.data[[self.left_col,self.right_col]+columns]), None
+        else:
+            highlight_source, entry = _windowed_intervals(self.data, self.left_col, self.right_col, columns, 
+                                                          fig, loaded_range, merge=self.merge)
 
         bottom = 0
         top = 1
@@ -355,6 +581,7 @@ class HighlightModifier(GenomeBrowserModifier):
         tooltips=[(f"{self.left_col} - {self.right_col}",f"@{self.left_col} - @{self.right_col}")]+[(f"{attr}",f"@{attr}") for attr in self.hover_data]
         fig.add_tools(HoverTool(renderers=[renderer],
                                         tooltips=tooltips))
+        return entry
     # if highlight_tracks:
     #     for t in self.tracks:
     #         t.highlight(data=data,left=left,right=right,color=color,alpha=alpha,hover_data=hover_data,**kwargs)
@@ -375,11 +602,35 @@ def highlight(self:GenomeBrowser,
         alpha: str = 0.2, #transparency
         hover_data: List = None, #list of additional column names to be shown when hovering over the data
 #        highlight_tracks: bool = False, #whether to highlight just the annotation track or also the other tracks
+        merge: bool = True, #if True, regions less than a pixel apart are drawn as a single region when zoomed out
+        show_features: bool = False, #if True, the names of the features overlapping each region are shown when hovering over it
         **kwargs, #enables to pass keyword arguments used by the Bokeh function
         ):
-    modifier = HighlightModifier(data, left_col, right_col, color_col, alpha_col, left, right, color, alpha, hover_data, **kwargs)
+    modifier = HighlightModifier(data, left_col, right_col, color_col, alpha_col, left, right, color, alpha, hover_data, merge=merge, **kwargs)
+    if show_features:
+        modifier.data["features"] = self._overlapping_feature_names(modifier.data, left_col, right_col)
+        modifier.hover_data.append("features")
     self.modifiers.append(modifier)
 
+@patch
+def _overlapping_feature_names(self:GenomeBrowser,
+        data: pd.DataFrame, #regions
+        left_col: str = "left", #name of the column containing the start positions of the regions
+        right_col: str = "right", #name of the column containing the end positions of the regions
+        )->np.ndarray:
+    """Returns, for each region of data, the comma separated names of the features it overlaps"""
+    self.wait()
+    names = np.full(len(data), "", dtype=object)
+    if len(self.features) == 0 or len(data) == 0:
+        return names
+    pairs = interval_join(data, self.features, left_cols=(left_col, right_col))
+    feature_names = get_feature_names(self.features.iloc[np.unique(pairs.right_ix)], self.glyphs)
+    pairs["name"] = pd.Series(feature_names, index=np.unique(pairs.right_ix)).reindex(pairs.right_ix).values
+    pairs = pairs[pairs.name != ""]
+    joined = pairs.groupby("left_ix")["name"].agg(", ".join)
+    names[joined.index.values] = joined.values
+    return names
+
 # %% ../nbs/API/00_browser.ipynb 36
 @patch
 def add_tooltip_data(self:GenomeBrowser,
@@ -388,18 +639,73 @@ def add_tooltip_data(self:GenomeBrowser,
                     feature_type: str = None, #specify the feature type if the data applies only a to specific feature_type  
                     ):
 
+    self.wait()
     flt=(self.patches.type == feature_type) | (feature_type is None)
-    assert(len(self.patches.loc[flt])==len(values))
-    for i,p in self.patches.loc[flt].iterrows():
-        self.patches.loc[i,"attributes"] += "<br>"+_format_attribute(name,values[i])
+    values=list(values) # values are matched to the patches by position, not by index label
+    assert(flt.sum()==len(values))
+    self.patches.loc[flt,"attributes"] = self.patches.loc[flt,"attributes"] + ["<br>"+_format_attribute(name,v) for v in values]
+
+# %% ../nbs/API/00_browser.ipynb 37
+@patch
+def add_feature_data(self:GenomeBrowser,
+                     data: pd.DataFrame, #DataFrame with one row per feature and one column per value to add
+                     key: str = "locus_tag", #feature attribute used to match the features with the rows of data
+                     on: str = None, #name of the column of data that contains the keys. If None, the column named after key is used
+                     columns: List[str] = None, #columns of data to add to the features. If None, all the columns except on are added
+                     feature_type: str = None, #specify the feature type if the data applies only to a specific feature_type
+                     ):
+    """Joins the columns of data onto the features attributes using the feature attribute key. 
+    The added values are shown in the tooltips and can be used as color_attribute. 
+    The patches are rebuilt, so values added beforehand with add_tooltip_data are discarded."""
+    self.wait()
+    on = key if on is None else on
+    if on not in data.columns:
+        raise ValueError(f"`on` ({on}) must be in data")
+    if columns is None:
+        columns = [c for c in data.columns if c != on]
+    elif type(columns) is str:
+        columns = [columns]
+    if data[on].duplicated().any():
+        raise ValueError(f"the values of the column {on} must be unique")
+
+    keys = get_attribute_values(self.features.attributes, key)
+    if feature_type is not None:
+        keys[(self.features.type != feature_type).values] = None
+    values = data.set_index(on)[columns].astype(object).reindex(keys) # object dtype keeps integers as integers when keys are missing
+    if not values.notna().any(axis=None):
+        warnings.warn(f"none of the values in {on} matched the {key} attribute of the features")
+
+    self.features["attributes"] = update_attributes(self.features.attributes, values.reset_index(drop=True))
+
+    # make sure the new attributes are displayed when the tooltips are restricted to a list of attributes
+    if self.attributes is not None:
+        for ft in (list(self.attributes) if feature_type is None else [feature_type]):
+            if self.attributes.get(ft) is not None:
+                self.attributes[ft] = self.attributes[ft] + [c for c in columns if c not in self.attributes[ft]]
+
+    if len(self.features)>0:
+        self._prepare_data()
 
 
 # %% ../nbs/API/00_browser.ipynb 39
 @patch
 def save_html(self:GenomeBrowser, fname:str, title:str="Genome Plot"):
+    self.wait()
+    key = self._render_key("save_html", title)
+    content = render_cache.get(key)
+    if content is not None:
+        with self.profiler.stage("save_html") as record, open(fname, "wb") as handle:
+            handle.write(content[0])
+            record["bytes"] = len(content[0])
+        return
     plot = GenomePlot(self)
     plot._collect_elements()
-    _save_html(plot.elements, fname, title)
+    with self.profiler.stage("save_html") as record:
+        _save_html(plot.elements, fname, title)
+        record["bytes"] = os.path.getsize(fname)
+    if key is not None and os.path.getsize(fname) <= render_cache.max_bytes:
+        with open(fname, "rb") as handle:
+            render_cache.put(key, (handle.read(),))
 
 # %% ../nbs/API/00_browser.ipynb 40
 @patch
@@ -420,12 +726,14 @@ def save(self:GenomeBrowser,
         output_backend = "svg"
     
     plot = GenomePlot(self, output_backend)
-    heights = [self.height]
+    heights = [self.overview_height] if self.overview else []
+    heights.append(self.height)
     for track in self.tracks:
         heights.append(track.height)
     
     plot._collect_elements()
-    _save(plot.elements, heights, self.width, fname, title)
+    with self.profiler.stage("export"):
+        _save(plot.elements, heights, self.width, fname, title)
 
 
 
@@ -485,18 +793,37 @@ class GenomeStack():
     def get_heights(self):
         heights = []
         for browser in self.browsers:
+            if browser.overview:
+                heights.append(browser.overview_height)
             heights.append(browser.height)
             for track in browser.tracks:
                 heights.append(track.height)
         return heights
     
+    def _render_key(self, *context)->Optional[str]:
+        """Key of the plot of the stack in render_cache, None if one of the browsers cannot be cached"""
+        keys = [browser._render_key(*context) for browser in self.browsers]
+        return None if None in keys else content_hash(["stack", keys])
+
     def show(self):
-        elements = self.get_elements()
-        _gb_show(elements)
+        key = self._render_key("show")
+        content = render_cache.get(key)
+        if content is None:
+            content = _notebook_content(self.get_elements())
+            render_cache.put(key, content)
+        _publish_notebook_content(*content)
         
     def save_html(self, fname:str, title:str="Genome Plot"):
-        elements = self.get_elements()
-        save_html(elements, fname, title)
+        key = self._render_key("save_html", title)
+        content = render_cache.get(key)
+        if content is None:
+            _save_html(self.get_elements(), fname, title)
+            with open(fname, "rb") as handle:
+                content = (handle.read(),)
+            render_cache.put(key, content)
+        else:
+            with open(fname, "wb") as handle:
+                handle.write(content[0])
    
     def save(self, 
              fname:str,
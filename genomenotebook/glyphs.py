@@ -4,8 +4,9 @@
 
 # %% auto 0
 __all__ = ['default_types', 'default_attributes', 'Y_RANGE', 'default_glyphs', 'get_y_range', 'arrow_coordinates',
-           'box_coordinates', 'Glyph', 'get_default_glyphs', 'get_patch_coordinates', 'html_wordwrap', 'get_tooltip',
-           'get_feature_name', 'get_feature_patches']
+           'box_coordinates', 'gene_model_coordinates', 'Glyph', 'get_default_glyphs', 'get_patch_coordinates',
+           'html_wordwrap', 'get_tooltip', 'get_tooltips', 'get_feature_name', 'get_feature_names',
+           'get_feature_patches', 'get_patch_index']
 
 # %% ../nbs/API/02_glyphs.ipynb 5
 import numpy as np
@@ -19,6 +20,10 @@ from .data import get_example_data_dir
 from genomenotebook.utils import (
     parse_gff,
     parse_genbank,
+    get_attribute_values,
+    _shared_store,
+    AttributeRow,
+    IntervalIndex,
 )
 
 import os
@@ -29,6 +34,7 @@ import re
 
 # %% ../nbs/API/02_glyphs.ipynb 6
 from collections import defaultdict
+import itertools
 
 # %% ../nbs/API/02_glyphs.ipynb 7
 default_types=["CDS", "repeat_region", "ncRNA", "rRNA", "tRNA"]
@@ -89,6 +95,50 @@ def box_coordinates(feature,
     return xs, ys, min(xs)
 
 # %% ../nbs/API/02_glyphs.ipynb 12
+def gene_model_coordinates(feature, 
+                           height: float = 1, #relative height of the feature (between 0 and 1)
+                           feature_height: float = 0.15, #fraction of the annotation track occupied by the feature glyphs
+                           arrow: bool = True, #if True the model ends with an arrow pointing in the direction of the strand
+                           ):
+    """Coordinates of a single polygon drawing a gene model (see `gene_models`): CDS at full height, other exon blocks at half height 
+    and introns as a thin line joining them."""
+    exons, cds, left, strand = feature.exons, feature.cds, feature.left, feature.strand
+    edges = np.unique(np.concatenate([[left, feature.right], exons.ravel(), cds.ravel()]))
+    mids = (edges[:-1] + edges[1:]) / 2
+
+    def covered(blocks):
+        if len(blocks) == 0:
+            return np.zeros(len(mids), dtype=bool)
+        ix = np.searchsorted(blocks[:, 0], mids, side="right") - 1
+        return (ix >= 0) & (mids <= blocks[np.maximum(ix, 0), 1])
+
+    levels = np.where(covered(cds), 1, np.where(covered(exons), 0.5, 0.1))
+    # consecutive segments of the same height are drawn as one
+    keep = np.concatenate([[True], levels[1:] != levels[:-1]])
+    lefts, levels = edges[:-1][keep], levels[keep]
+    rights = np.append(lefts[1:], edges[-1])
+
+    offset = feature_height*(1-height)/2
+    y_min = 0.05+offset
+    y_max = 0.05+feature_height-offset
+    center, half = (y_max + y_min) / 2, (y_max - y_min) / 2
+    xs_top = list(np.column_stack([lefts, rights]).ravel())
+    ys_top = list(np.repeat(center + half*levels, 2))
+    xs_bottom, ys_bottom = xs_top[::-1], [2*center - y for y in ys_top[::-1]]
+    if arrow and strand == "+":
+        xs_top[-1] = xs_bottom[0] = rights[-1] - min(rights[-1] - lefts[-1], 100)
+        xs, ys = xs_top + [rights[-1]] + xs_bottom, ys_top + [center] + ys_bottom
+    elif arrow and strand == "-":
+        xs_top[0] = xs_bottom[-1] = lefts[0] + min(rights[0] - lefts[0], 100)
+        xs, ys = [lefts[0]] + xs_top + xs_bottom, [center] + ys_top + ys_bottom
+    else:
+        xs, ys = xs_top + xs_bottom, ys_top + ys_bottom
+    if "z_order" in feature:
+        z_offset = feature_height*feature["z_order"]
+        ys = [y+z_offset for y in ys]
+    return tuple(xs), tuple(ys), left
+
+# %% ../nbs/API/02_glyphs.ipynb 13
 class Glyph:
     def __init__(self,
                  glyph_type: str ="arrow", # type of the Glyph (arrow or box)
@@ -128,7 +178,11 @@ class Glyph:
         else:
             color_dic=defaultdict(lambda: self.colors[0])
 
-        return self.coordinates(feature, self.height, feature_height), color_dic[feature.strand], self.alpha
+        if isinstance(feature.get("exons"), np.ndarray): # gene models are drawn with their exons and CDS
+            coordinates = gene_model_coordinates(feature, self.height, feature_height, arrow=self.glyph_type=="arrow")
+        else:
+            coordinates = self.coordinates(feature, self.height, feature_height)
+        return coordinates, color_dic[feature.strand], self.alpha
     
     def copy(self):
         return copy.deepcopy(self)
@@ -140,7 +194,7 @@ class Glyph:
             r+=f"\t{attr}: {getattr(self, attr)}\n"
         return r
 
-# %% ../nbs/API/02_glyphs.ipynb 13
+# %% ../nbs/API/02_glyphs.ipynb 14
 def get_default_glyphs(arrow_colors=("purple","orange"), box_colors=("grey",)) -> dict:
     """Returns a dictionnary with:
 
@@ -158,7 +212,7 @@ def get_default_glyphs(arrow_colors=("purple","orange"), box_colors=("grey",)) -
 
 default_glyphs=get_default_glyphs()
 
-# %% ../nbs/API/02_glyphs.ipynb 15
+# %% ../nbs/API/02_glyphs.ipynb 16
 def get_patch_coordinates(feature, glyphs_dict, feature_height=0.15, color_attribute=None):
     glyph=glyphs_dict[feature.type]
     coordinate, color, alpha = glyph.get_patch(feature, feature_height=feature_height)
@@ -166,7 +220,7 @@ def get_patch_coordinates(feature, glyphs_dict, feature_height=0.15, color_attri
         color = feature.attributes.get(color_attribute, color) # get the color attribute, keep original color if not found.
     return coordinate, color, alpha
 
-# %% ../nbs/API/02_glyphs.ipynb 17
+# %% ../nbs/API/02_glyphs.ipynb 19
 def html_wordwrap(input_string: str, line_len=50, start=0):
     parts = re.split("(\W|,|;|\|)", input_string)
     out = list()
@@ -182,12 +236,12 @@ def html_wordwrap(input_string: str, line_len=50, start=0):
     return "".join(out)
     
 
-# %% ../nbs/API/02_glyphs.ipynb 18
+# %% ../nbs/API/02_glyphs.ipynb 20
 def _format_attribute(name, value, color="DodgerBlue", wrap=50):
         return f'<span style="color:{color}">{html.escape(name)}</span><span>: {html_wordwrap(html.escape(str(value)), wrap, len(name)+1)}</span>'
 
 
-# %% ../nbs/API/02_glyphs.ipynb 20
+# %% ../nbs/API/02_glyphs.ipynb 22
 def get_tooltip(feature, attributes, wrap=50):    
     row_type = feature["type"]
     tooltips = list()
@@ -207,7 +261,55 @@ def get_tooltip(feature, attributes, wrap=50):
                     tooltips.append(_format_attribute(attribute, feature['attributes'][attribute],wrap=wrap))
     return "<br>".join(tooltips)
 
-# %% ../nbs/API/02_glyphs.ipynb 23
+# %% ../nbs/API/02_glyphs.ipynb 25
+def get_tooltips(features: pd.DataFrame, #DataFrame of the features
+                 attributes: dict, #dictionary with feature type as keys and a list of attributes to display when hovering as values
+                 wrap: int = 50,
+                )->np.ndarray:
+    """Returns the tooltip of every feature, as `get_tooltip`. When the attributes are stored in an AttributeStore, 
+    each value is formatted once and the tooltips are assembled column by column."""
+    shared = _shared_store(features["attributes"])
+    if shared is None:
+        return np.array([get_tooltip(row, attributes, wrap) for _, row in features.iterrows()], dtype=object)
+    store, ix = shared
+    types = features["type"].values
+    tooltips = pd.Series(types).map(lambda t: f'<span style="color:FireBrick">{t}</span>').values.astype(object)
+    formatted = {}
+    # pieces of the tooltips, assembled at the end in the order of the attributes of each feature 
+    # (or of the attributes listed for its type)
+    piece_rows, piece_ranks, piece_keys, piece_texts = [], [], [], []
+    for row_type in pd.unique(types):
+        all_keys = attributes is None or (row_type in attributes and attributes[row_type] is None)
+        if all_keys:
+            keys = store.keys()
+        elif row_type in attributes:
+            keys = [k for k in attributes[row_type] if k in store.codes]
+        else:
+            continue
+        rows = np.flatnonzero(types == row_type)
+        for j, key in enumerate(keys):
+            codes = store.codes[key][ix[rows]]
+            present = codes >= 0
+            if present.any():
+                # only the values used by the features are formatted, once each
+                if key not in formatted:
+                    formatted[key] = np.full(len(store.values[key]), None, dtype=object)
+                used = np.unique(codes[present])
+                used = used[pd.isna(formatted[key][used])]
+                formatted[key][used] = ["<br>"+_format_attribute(key, v, wrap=wrap) for v in store.values[key][used]]
+                piece_rows.append(rows[present])
+                piece_ranks.append(store.ranks_of(key, ix[rows[present]]) if all_keys else np.zeros(present.sum(), dtype=np.int64))
+                piece_keys.append(np.full(present.sum(), j))
+                piece_texts.append(formatted[key][codes[present]])
+    if len(piece_rows) > 0:
+        rows = np.concatenate(piece_rows)
+        order = np.lexsort((np.concatenate(piece_keys), np.concatenate(piece_ranks), rows))
+        rows, texts = rows[order], np.concatenate(piece_texts)[order]
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        tooltips[rows[starts]] += np.add.reduceat(texts, starts)
+    return tooltips
+
+# %% ../nbs/API/02_glyphs.ipynb 27
 def get_feature_name(row, glyphs_dict):
     """ For each row of features DataFrame uses the Glyph object provided in the glyphs_dict to know which attribute to use as the name"""
     if glyphs_dict[row.type].show_name:
@@ -219,7 +321,30 @@ def get_feature_name(row, glyphs_dict):
     return ""
 
 
-# %% ../nbs/API/02_glyphs.ipynb 27
+# %% ../nbs/API/02_glyphs.ipynb 31
+def get_feature_names(features: pd.DataFrame, #DataFrame of the features
+                      glyphs_dict: dict, #a dictionary of glyphs to use for each feature type
+                     )->np.ndarray:
+    """Returns the name of every feature, as `get_feature_name`, looking up the name attribute of each feature type at once when the attributes are stored in an AttributeStore"""
+    shared = _shared_store(features["attributes"])
+    if shared is None:
+        return np.array([get_feature_name(row, glyphs_dict) for _, row in features.iterrows()], dtype=object)
+    store, ix = shared
+    types = features["type"].values
+    names = np.full(len(features), "", dtype=object)
+    for row_type in pd.unique(types):
+        glyph = glyphs_dict[row_type]
+        if not glyph.show_name:
+            continue
+        rows = np.flatnonzero(types == row_type)
+        values = store.get(glyph.name_attr)[ix[rows]]
+        # features without the name attribute are named after their first attribute
+        for k in np.flatnonzero(pd.isna(values)):
+            values[k] = next(iter(AttributeRow(store, ix[rows[k]]).values()), None)
+        names[rows] = np.where(pd.isna(values), "", values)
+    return names
+
+# %% ../nbs/API/02_glyphs.ipynb 33
 def get_feature_patches(features: pd.DataFrame, #DataFrame of the features 
                         left: int, #left limit
                         right: int, #right limit
@@ -228,27 +353,30 @@ def get_feature_patches(features: pd.DataFrame, #DataFrame of the features
                         feature_height: float = 0.15, #fraction of the annotation track height occupied by the features
                         label_vertical_offset: float = 0.05,
                         label_justify: str = "center",
-                        color_attribute: str =  None
+                        color_attribute: str =  None,
+                        index: IntervalIndex = None, #IntervalIndex of the features, used to find the features between left and right without scanning the whole table
                        )->pd.DataFrame:
-    features=features.loc[(features["right"] > left) & (features["left"] < right)]
+    if index is None:
+        features=features.loc[(features["right"] > left) & (features["left"] < right)]
+    else:
+        features=features.iloc[np.sort(index.query(left, right))]
 
     if len(features)>0:
         coordinates, colors, alphas = zip(*features.apply(get_patch_coordinates,
                                                           glyphs_dict=glyphs_dict,
                                                           feature_height=feature_height,
-                                                          axis=1, 
-                                                          color_attribute=color_attribute))
+                                                          axis=1))
         xs, ys, xbox_mins = zip(*coordinates)
+        if color_attribute is not None:
+            attribute_colors = get_attribute_values(features["attributes"], color_attribute)
+            colors = np.where(pd.isna(attribute_colors), np.array(colors, dtype=object), attribute_colors) # keep the glyph color when the attribute is not found
     else:
-        colors = []
-        xs, ys = [], []
+        colors, alphas = [], []
+        xs, ys, xbox_mins = [], [], []
     
-    names=list(features.apply(get_feature_name,glyphs_dict=glyphs_dict, axis=1)
-               )
+    names=list(get_feature_names(features, glyphs_dict))
     
-    tooltips=list(features.apply(lambda row: get_tooltip(row, attributes),
-                             axis=1)
-                 )
+    tooltips=list(get_tooltips(features, attributes))
 
     feature_patches=dict(names=names,
              xs=list(xs),
@@ -270,3 +398,14 @@ def get_feature_patches(features: pd.DataFrame, #DataFrame of the features
         feature_patches["label_x"] = feature_patches["xbox_min"]
     
     return feature_patches
+
+# %% ../nbs/API/02_glyphs.ipynb 35
+def get_patch_index(patches: pd.DataFrame, #DataFrame of the patches returned by get_feature_patches
+                   )->IntervalIndex:
+    """Returns an IntervalIndex of the x extent of each patch, to find the patches overlapping a window"""
+    lengths = patches["xs"].map(len).values
+    if len(lengths) == 0:
+        return IntervalIndex(np.zeros(0), np.zeros(0))
+    xs = np.array(list(itertools.chain.from_iterable(patches["xs"].values))) # integer coordinates stay integers
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return IntervalIndex(np.minimum.reduceat(xs, offsets), np.maximum.reduceat(xs, offsets))
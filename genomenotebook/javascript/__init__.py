@@ -3,10 +3,9 @@ from .js_callback_code import (
     _get_js_code,
 )
 
-x_range_change_callback_code=_get_js_code("x_range_change_callback_code.js")
+x_range_dispatcher_code=_get_js_code("x_range_dispatcher_code.js")
 search_callback_code=_get_js_code("search_callback_code.js")
 sequence_search_code=_get_js_code("sequence_search_code.js")
-track_callback_code=_get_js_code("track_callback_code.js")
 next_button_code=_get_js_code("next_button_code.js")
 previous_button_code=_get_js_code("previous_button_code.js")
-glyph_update_callback_code=_get_js_code("glyph_update_callback_code.js")
\ No newline at end of file
+overview_callback_code=_get_js_code("overview_callback_code.js")
\ No newline at end of file
@@ -0,0 +1,57 @@
+// Callback attached to the x_range of the overview of a GenomePlot.
+// levels holds the feature density at several resolutions, from the finest to the coarsest.
+// The finest level with at most max_bins bins in the visible window is loaded in source,
+// together with one window width on each side, so that the number of glyphs never exceeds about 3*max_bins.
+
+function firstIndexAbove(arr, value) {
+    // binary search of the first index i such that arr[i] > value (arr must be sorted)
+    let lo = 0;
+    let hi = arr.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (arr[mid] > value) {
+            hi = mid;
+        } else {
+            lo = mid + 1;
+        }
+    }
+    return lo;
+}
+
+function update() {
+    source.frame_requested = false;
+    const x_size = x_range.end - x_range.start;
+    let level = levels[levels.length - 1];
+    for (const candidate of levels) {
+        if (x_size / candidate.bin_size <= max_bins) {
+            level = candidate;
+            break;
+        }
+    }
+    const n_bins = level.data.left.length;
+    if (source.bin_size === level.bin_size
+        && (source.ix_start === 0 || level.data.left[source.ix_start] <= x_range.start - x_size)
+        && (source.ix_stop === n_bins || level.data.right[source.ix_stop - 1] >= x_range.end + x_size)) {
+        return; // the loaded bins already cover the window and its margins
+    }
+    // load twice the required margin so that small moves do not trigger an update
+    const load_start = Math.max(firstIndexAbove(level.data.right, x_range.start - 2*x_size) - 1, 0);
+    const load_stop = Math.min(firstIndexAbove(level.data.left, x_range.end + 2*x_size) + 1, n_bins);
+    const data = {};
+    for (const attr in level.data) {
+        data[attr] = level.data[attr].slice(load_start, load_stop);
+    }
+    source.bin_size = level.bin_size;
+    source.ix_start = load_start;
+    source.ix_stop = load_stop;
+    source.data = data;
+}
+
+if (!source.frame_requested) {
+    source.frame_requested = true;
+    if (typeof requestAnimationFrame === "function") {
+        requestAnimationFrame(update);
+    } else {
+        setTimeout(update, 16);
+    }
+}
@@ -3,16 +3,16 @@ let searchString = cb_obj.value.toUpperCase();
 let pos = null;
 
 //looking for the position of a gene
-for (let attr in all_glyphs) {
-  const firstElement = all_glyphs[attr][0];
+for (let attr in all_glyphs.data) {
+  const firstElement = all_glyphs.data[attr][0];
   if (typeof firstElement !== 'string') {
     continue; // Skip the loop iteration if the first element is not a string
   }
 
-  let ix = all_glyphs[attr].findIndex((element) => element.toUpperCase() === searchString);
+  let ix = all_glyphs.data[attr].findIndex((element) => element.toUpperCase() === searchString);
 
   if (ix !== -1) {
-    pos = all_glyphs['xs'][ix][0];
+    pos = all_glyphs.data['xs'][ix][0];
     break;
   }
 }
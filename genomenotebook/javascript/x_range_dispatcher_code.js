@@ -0,0 +1,267 @@
+// Single callback attached to the x_range of a GenomePlot.
+// Range changes are coalesced into one update per animation frame, which refreshes the sequence div,
+// the annotation glyphs and the data of every track and highlight.
+
+function firstIndexAbove(arr, value) {
+    // binary search of the first index i such that arr[i] > value (arr must be sorted)
+    let lo = 0;
+    let hi = arr.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (arr[mid] > value) {
+            hi = mid;
+        } else {
+            lo = mid + 1;
+        }
+    }
+    return lo;
+}
+
+function isStale(range_source) {
+    //If getting close to the edge of the loaded data, then reload it on the current position
+    return x_range.start < range_source.data.start[0] + 2000 || x_range.end > range_source.data.end[0] - 2000;
+}
+
+function setLoadedRange(range_source) {
+    const max_loading_range = range_source.data['range'][0];
+    range_source.data['start'][0] = x_range.start - max_loading_range;
+    range_source.data['end'][0] = x_range.end + max_loading_range;
+    range_source.change.emit();
+}
+
+function updateSequence() {
+    if (!sequence.show) {
+        return; // the sequence is only sent for the translation of the six frames
+    }
+    var x_size = x_range.end - x_range.start;
+
+    // show the sequence when zoomed in enough
+    var letterSpace = 9.6*x_size;
+    if (letterSpace < div.width && x_range.end>x_range.start) {
+        /*for some weird reasons after a search sometimes x_range.end is smaller than x_range.start
+        which causes unwanted behaviour*/
+
+        var seq = sequence.seq.substring(Math.floor(x_range.start)-sequence.bounds[0], Math.floor(x_range.end)-sequence.bounds[0]);
+
+        var spaceBetweenBases=div.width/x_size;
+
+        // Build the html once and assign it to the div in a single change
+        var text = "";
+        for (let i = 0; i < seq.length; i++) {
+            text+='<span style="width:' + spaceBetweenBases + 'px; display: inline-block; overflow: hidden">'+seq[i]+'</span>'
+        }
+        div.text = text;
+
+        var start_floatingPart = x_range.start % 1;
+
+        var pad_left=parseInt(spaceBetweenBases*(1-start_floatingPart));
+        div.styles.padding_left = pad_left+"px";
+    } else if (div.text !== "") {
+        div.text="";
+    }
+}
+
+function updateGlyphs() {
+    if (!isStale(loaded_range)) {
+        return;
+    }
+    const max_glyph_loading_range = loaded_range.data['range'][0];
+    // all_glyphs are sorted by left position and right_max is the running maximum of the right positions
+    const ix_start = firstIndexAbove(glyph_index.right_max, x_range.start - max_glyph_loading_range);
+    const ix_stop = firstIndexAbove(glyph_index.left, x_range.end + max_glyph_loading_range);
+
+    for (let attr in all_glyphs.data) {
+        glyph_source.data[attr] = all_glyphs.data[attr].slice(ix_start, ix_stop);
+    }
+    glyph_source.change.emit();
+    setLoadedRange(loaded_range);
+}
+
+const complement = {A: "T", C: "G", G: "C", T: "A"};
+const base_numbers = {T: 0, C: 1, A: 2, G: 3};
+
+function translateCodon(codon, code) {
+    const number = 16*base_numbers[codon[0]] + 4*base_numbers[codon[1]] + base_numbers[codon[2]];
+    return Number.isNaN(number) ? "X" : code[number];
+}
+
+function updateTranslation(translation) {
+    // translates the codons of the six frames in the window, only when zoomed in enough to read the amino acids
+    const source = translation.source;
+    if (x_range.end - x_range.start > translation.max_window || sequence.seq.length === 0) {
+        if (source.data.x.length > 0) {
+            source.data = {x: [], y: [], text: []};
+        }
+        return;
+    }
+    const offset = sequence.bounds[0];
+    const first = Math.max(Math.floor(x_range.start) - 2, offset);
+    const last = Math.min(Math.ceil(x_range.end) + 2, offset + sequence.seq.length);
+    const x = [], y = [], text = [];
+    for (let p = first; p + 3 <= last; p++) {
+        // the codons of frame k start at positions p with p % 3 == k-1, on both strands
+        const codon = sequence.seq.substring(p - offset, p - offset + 3);
+        const reverse = complement[codon[2]] + complement[codon[1]] + complement[codon[0]];
+        x.push(p + 1.5, p + 1.5);
+        y.push(translation.rows[p % 3], translation.rows[3 + p % 3]);
+        text.push(translateCodon(codon, translation.code), translateCodon(reverse, translation.code));
+    }
+    source.data = {x: x, y: y, text: text};
+}
+
+function updateImage(image, range_source, stale) {
+    // images (heatmaps, rasterized points) are binned at several resolutions: the bins of the chosen level around the window are copied in the source
+    const x_size = x_range.end - x_range.start;
+    let level = 0;
+    for (let i = 1; i < image.levels.length; i++) {
+        if (x_size >= image.levels[i].min_window) {
+            level = i;
+        }
+    }
+    if (!stale && level === image.source.level) {
+        return;
+    }
+    const max_loading_range = range_source.data['range'][0];
+    const binned = image.levels[level];
+    const [n_rows, n_bins] = binned.image.shape;
+    const ix_start = Math.min(Math.max(Math.floor((x_range.start - max_loading_range - binned.start) / binned.bin_size), 0), n_bins - 1);
+    const ix_stop = Math.max(Math.min(Math.ceil((x_range.end + max_loading_range - binned.start) / binned.bin_size), n_bins), ix_start + 1);
+    const width = ix_stop - ix_start;
+    // new array of the same type (uint8 or float32) holding the columns ix_start to ix_stop of every row.
+    // The rows are copied from plain typed array views, as subarray would call the constructor of the ndarray with other arguments
+    const data = new binned.image.constructor(n_rows * width, [n_rows, width]);
+    const TypedArray = Object.getPrototypeOf(binned.image.constructor);
+    const bytes = binned.image.BYTES_PER_ELEMENT;
+    for (let row = 0; row < n_rows; row++) {
+        data.set(new TypedArray(binned.image.buffer, binned.image.byteOffset + (row * n_bins + ix_start) * bytes, width), row * width);
+    }
+    image.source.data = {image: [data], x: [binned.start + ix_start * binned.bin_size], dw: [width * binned.bin_size], 
+                         y: [image.y], dh: [image.dh]};
+    image.source.level = level;
+}
+
+function updateRaster(track, stale) {
+    // dense scatter tracks are drawn from images binned at several resolutions (see raster_pyramid) while the window holds more than max_points points,
+    // the points of the window are counted by binary search on the sorted positions. Tracks whose points are not sent are always drawn from the images.
+    // Returns true when the track is rasterized
+    const raster = track.raster;
+    const xs = track.all_data.data[track.pos];
+    if (raster.points && firstIndexAbove(xs, x_range.end) - firstIndexAbove(xs, x_range.start) <= raster.max_points) {
+        if (raster.rasterized) {
+            raster.image.source.data = {image: [], x: [], y: [], dw: [], dh: []};
+            raster.image.source.level = null;
+            raster.rasterized = false;
+        }
+        return false;
+    }
+    const previous = raster.image.source.data.image[0];
+    updateImage(raster.image, track.loaded_range, stale || !raster.rasterized);
+    const image = raster.image.source.data.image[0];
+    if (raster.agg === "count" && image !== previous) {
+        // the counts grow with the size of the bins
+        let max_count = 0;
+        for (let p = 0; p < image.length; p++) {
+            if (image[p] > max_count) {
+                max_count = image[p];
+            }
+        }
+        raster.mapper.high = Math.max(max_count, 2);
+    }
+    if (!raster.rasterized) {
+        for (let attr in track.loaded_data.data) {
+            track.loaded_data.data[attr] = track.all_data.data[attr].slice(0, 0);
+        }
+        track.loaded_data.change.emit();
+        raster.rasterized = true;
+    }
+    return true;
+}
+
+function updateTracks() {
+    // several sources of a track share the same loaded range, so staleness is checked before any update
+    const stale = new Set(tracks.filter((track) => track.loaded_range != null && isStale(track.loaded_range)).map((track) => track.loaded_range));
+    const x_size = x_range.end - x_range.start;
+    for (const track of tracks) {
+        if (track.translation != null) {
+            updateTranslation(track.translation);
+            continue;
+        }
+        if (track.image != null) {
+            updateImage(track.image, track.loaded_range, stale.has(track.loaded_range));
+            continue;
+        }
+        // tracks can have coarser versions of their data (merged highlights, binned sequence content), 
+        // sorted by the minimum window size from which they are shown
+        let level = -1;
+        if (track.levels != null) {
+            for (let i = 0; i < track.levels.length; i++) {
+                if (x_size >= track.levels[i].min_window) {
+                    level = i;
+                }
+            }
+        }
+        // the points are reloaded when a rasterized track falls below its threshold
+        const was_rasterized = track.raster != null && track.raster.rasterized;
+        if (track.raster != null && updateRaster(track, stale.has(track.loaded_range))) {
+            continue;
+        }
+        const switched = was_rasterized || track.modified === true || level !== (track.loaded_data.level != null ? track.loaded_data.level : -1);
+        if (!stale.has(track.loaded_range) && !switched) {
+            continue;
+        }
+        const max_loading_range = track.loaded_range.data['range'][0];
+        const source = level >= 0 ? track.levels[level] : track;
+        const all_data = source.all_data;
+        let ix_start, ix_stop;
+        if (track.index != null) {
+            // intervals are sorted by left position and right_max is the running maximum of the right positions
+            ix_start = firstIndexAbove(source.index.right_max, x_range.start - max_loading_range);
+            ix_stop = firstIndexAbove(source.index.left, x_range.end + max_loading_range);
+        } else {
+            const positions = all_data.data[track.pos];
+            // keep one point on each side of the window so that lines continue up to the edges
+            ix_start = Math.max(firstIndexAbove(positions, x_range.start - max_loading_range) - 1, 0);
+            ix_stop = Math.min(firstIndexAbove(positions, x_range.end + max_loading_range) + 1, positions.length);
+        }
+
+        for (let attr in all_data.data) {
+            track.loaded_data.data[attr] = all_data.data[attr].slice(ix_start, ix_stop);
+        }
+        track.loaded_data.level = level;
+        track.loaded_data.change.emit();
+        track.modified = false;
+    }
+    for (const range_source of stale) {
+        setLoadedRange(range_source);
+    }
+}
+
+function update() {
+    loaded_range.frame_requested = false;
+    updateSequence();
+    updateGlyphs();
+    updateTracks();
+}
+
+// the RangeTool of the overview can select a window larger than max_interval, which is only enforced by the zoom tools
+if (x_range.max_interval != null && x_range.end - x_range.start > x_range.max_interval) {
+    x_range.end = x_range.start + x_range.max_interval;
+}
+
+// the callback is also triggered when rows are streamed to the data of a track (see Track.stream)
+if (typeof cb_obj !== "undefined" && cb_obj != null) {
+    for (const track of tracks) {
+        if (track.all_data === cb_obj) {
+            track.modified = true;
+        }
+    }
+}
+
+if (!loaded_range.frame_requested) {
+    loaded_range.frame_requested = true;
+    if (typeof requestAnimationFrame === "function") {
+        requestAnimationFrame(update);
+    } else {
+        setTimeout(update, 16);
+    }
+}
@@ -13,18 +13,21 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from genomenotebook.browser import GenomeBrowser
+
+from genomenotebook.utils import estimate_payload, density_pyramid
+from genomenotebook.track import _is_point_source, _entry_payload
     
 from genomenotebook.javascript import (
-    x_range_change_callback_code,
-    glyph_update_callback_code,
+    x_range_dispatcher_code,
     search_callback_code,
     sequence_search_code,
     next_button_code,
-    previous_button_code
+    previous_button_code,
+    overview_callback_code,
 )
 
 from bokeh.plotting import figure
-from bokeh.models.tools import BoxZoomTool
+from bokeh.models.tools import BoxZoomTool, RangeTool
 from bokeh.models.glyphs import Patches
 from bokeh.models import (
     CustomJS,
@@ -47,6 +50,8 @@ from bokeh.plotting import show as bk_show
 from bokeh.layouts import column, row
 from bokeh.plotting import save as bk_save #Need to rename the bokeh show function so that there is no confusion with GenomeBrowser.show
 
+import numpy as np
+import pandas as pd
 import os
 import warnings
 
@@ -65,13 +70,31 @@ class GenomePlot():
         else:
             self.browser = browsers
             self.child_browsers = []
+        for browser in [self.browser]+self.child_browsers:
+            browser.wait() # browsers created with background=True may still be loading
 
 
         self.output_backend = output_backend
+        self.profiler = self.browser.profiler
         self.elements = []
         self.tracks = []
         self.track_figs = []
+        self._track_sources = [] # data sources of the tracks updated by the x_range dispatcher
+
+        # data plotted, which can be reduced by _apply_payload_budget without modifying the browser
+        self.bounds = self.browser.bounds
+        self.patches = self.browser.patches
+        self._patch_index = self.browser.patch_index # IntervalIndex of the x extent of the patches
+        self.seq = self.browser.seq
+        self._track_max_points = {} # maximum number of points of each track, by track id
+        self._track_coarsening = {} # number of finest resolutions of the binned data of each track that are dropped, by track id
+        self._track_tooltips = True # False when the columns only shown in the tooltips of the tracks are dropped
+        self._overview_levels = None # (bounds, density levels) of the overview, computed on demand
         
+        self._set_init_pos()
+        with self.profiler.stage("payload_budget") as record:
+            self._apply_payload_budget()
+            record["bytes"] = int(self.payload_report.bytes.sum())
         self._get_main_fig()
 
         for browser in self.child_browsers:
@@ -79,33 +102,44 @@ class GenomePlot():
 
 
 
-    def _add_track(self, track):
-        fig = track.get_fig(
-                x_range=self.x_range, 
+    def _get_track_fig(self, track, x_range):
+        """Renders a track in a new figure with the reductions applied to fit in max_payload"""
+        return track.get_fig(
+                x_range=x_range, 
                 width=self.browser.width, 
-                bounds=self.browser.bounds,
+                bounds=self.bounds,
                 max_glyph_loading_range=self.browser.max_glyph_loading_range,
-                output_backend=self.output_backend
+                output_backend=self.output_backend,
+                max_points=self._track_max_points.get(id(track)),
+                coarsening=self._track_coarsening.get(id(track), 0),
+                tooltips=self._track_tooltips,
             )
+
+    def _add_track(self, track):
+        fig = self._get_track_fig(track, self.main_fig.x_range)
         self.elements.append(fig)
         self.track_figs.append(fig)
         self.tracks.append(track)
+        self._track_sources.extend(track.loaded_sources)
         
-    def _get_main_fig(self):
-        self._set_init_pos()
-        if self.browser.init_win>self.browser.max_interval:
-            warnings.warn("You requested an initial window larger than max_interval. Change max_interval to plot a larger window (this might overload your memory)")
-        self.init_win = min(min(self.browser.init_win,self.browser.bounds[1]-self.browser.bounds[0]),self.browser.max_interval)
+    def _get_x_range(self)->Range1d:
+        """Range of the initial window around init_pos, within the bounds"""
+        self.init_win = min(min(self.browser.init_win,self.bounds[1]-self.bounds[0]),self.browser.max_interval)
 
         semi_win = self.init_win / 2
             
-        self.x_range = Range1d(
-            max(self.browser.bounds[0],self.init_pos - semi_win), min(self.browser.bounds[1],self.init_pos + semi_win), 
-            bounds=self.browser.bounds, 
+        return Range1d(
+            max(self.bounds[0],self.init_pos - semi_win), min(self.bounds[1],self.init_pos + semi_win), 
+            bounds=self.bounds, 
             max_interval=self.browser.max_interval,
             min_interval=30
         )
 
+    def _get_main_fig(self):
+        if self.browser.init_win>self.browser.max_interval:
+            warnings.warn("You requested an initial window larger than max_interval. Change max_interval to plot a larger window (this might overload your memory)")
+        self.x_range = self._get_x_range()
+
         self.main_fig = figure(
             tools = "xwheel_zoom, xpan, save, reset",
             active_scroll = "xwheel_zoom",
@@ -139,6 +173,13 @@ class GenomePlot():
             self.init_pos = sum(self.browser.bounds)//2
 
 # %% ../nbs/API/03_plot.ipynb 8
+@patch
+def _get_loaded_range(self:GenomePlot)->ColumnDataSource:
+    """Range of positions loaded around the initial window, the x_range dispatcher reloads the data of its sources when it becomes stale"""
+    return ColumnDataSource({"start":[self.x_range.start-self.browser.max_glyph_loading_range],
+                             "end":[self.x_range.end+self.browser.max_glyph_loading_range], 
+                             "range":[self.browser.max_glyph_loading_range]})
+
 @patch
 def _add_annotations(self:GenomePlot):
     """
@@ -146,19 +187,14 @@ def _add_annotations(self:GenomePlot):
     """
     
     #Filter initial glyphs by position
-    feature_patches = self.browser.patches.loc[(
-        self.browser.patches['xs'].apply(
-            lambda x: max(x)>self.x_range.start-self.browser.max_glyph_loading_range)) & (
-        self.browser.patches['xs'].apply(
-            lambda x: min(x)<self.x_range.end+self.browser.max_glyph_loading_range)
-        )].copy()
+    feature_patches = self.patches.iloc[np.sort(self._patch_index.query(
+        self.x_range.start-self.browser.max_glyph_loading_range,
+        self.x_range.end+self.browser.max_glyph_loading_range))].copy()
     
     self._glyph_source = ColumnDataSource(feature_patches.to_dict(orient="list"))
     
     #Information about the range currently plotted
-    self._loaded_range = ColumnDataSource({"start":[self.x_range.start-self.browser.max_glyph_loading_range],
-                                            "end":[self.x_range.end+self.browser.max_glyph_loading_range], 
-                                            "range":[self.browser.max_glyph_loading_range]})
+    self._loaded_range = self._get_loaded_range()
     
     glyph_renderer = self.main_fig.add_glyph(
         self._glyph_source, Patches(xs="xs", ys="ys", fill_color="color", fill_alpha="alpha")
@@ -184,12 +220,130 @@ def _add_annotations(self:GenomePlot):
         )
 
         self.main_fig.add_layout(labels)
-    self.main_fig.add_tools(
-        HoverTool(
-            renderers=[glyph_renderer],
-            tooltips="<div>@attributes</div>",
+    if "attributes" in self.patches.columns: # tooltips can be dropped by _apply_payload_budget
+        self.main_fig.add_tools(
+            HoverTool(
+                renderers=[glyph_renderer],
+                tooltips="<div>@attributes</div>",
+            )
         )
-    )
+
+# %% ../nbs/API/03_plot.ipynb 9
+@patch
+def _loaded_fraction(self:GenomePlot, positions)->float:
+    """Fraction of the positions that are loaded around the initial window"""
+    if len(positions) == 0:
+        return 0
+    semi_win = self.browser.init_win/2 + self.browser.max_glyph_loading_range
+    positions = np.asarray(positions)
+    return ((positions > self.init_pos-semi_win) & (positions < self.init_pos+semi_win)).mean()
+
+@patch
+def _estimate_payload(self:GenomePlot)->pd.DataFrame:
+    """Estimates the size in bytes of each component of the plot once serialized. 
+    Glyphs and highlights are counted twice: once for all the data and once for the data loaded around the initial window.
+    Tracks are rendered in scratch figures and the data of their entries in Track.loaded_sources is measured."""
+    loaded = 1 + self._loaded_fraction(self.patches["pos"])
+    # the patches are passed to the ColumnDataSources as lists, which are serialized in JSON 
+    glyph_columns = {c: self.patches[c].values.astype(object) for c in self.patches.columns if c != "attributes"}
+    components = {
+        "glyphs": estimate_payload(glyph_columns)*loaded + 22*len(self.patches), # glyph_index
+        "tooltips": estimate_payload({"attributes": self.patches["attributes"].values})*loaded if "attributes" in self.patches.columns else 0,
+        # the sequence is passed to the x_range callback, to the sequence search callback and to the translation of the ORF tracks
+        "sequence": (estimate_payload(str(self.seq))*(1+self.browser.search*self.browser.show_seq) 
+                     if self.seq is not None and (self.browser.show_seq or any(track._translated for track in self.browser.tracks)) else 0),
+    }
+    if self.browser.overview:
+        # the levels are passed to the overview callback as arrays and the coarsest level is also loaded in the overview source
+        levels = self._get_overview_levels()
+        components["overview"] = sum(estimate_payload({c: level[c].values for c in level.columns}) for _, level in levels + levels[-1:])
+    x_range = self._get_x_range()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore") # the warnings of the tracks are raised when they are rendered in the plot
+        for i, track in enumerate(self.browser.tracks):
+            self._get_track_fig(track, x_range)
+            components[f"track {i}"] = sum(_entry_payload(entry) for entry in track.loaded_sources)
+    # highlights are sent once in full and once for the regions loaded around the initial window, for each figure they are rendered in
+    components["highlights"] = sum(
+        estimate_payload(modifier.data) * (1 + self._loaded_fraction(modifier.data[modifier.left_col]))
+        * (modifier.gene_track + modifier.data_tracks*len(self.browser.tracks))
+        for modifier in self.browser.modifiers if hasattr(modifier, "data"))
+    return pd.DataFrame({"component": list(components), "bytes": np.array(list(components.values()), dtype=int)})
+
+@patch
+def _apply_payload_budget(self:GenomePlot):
+    """Estimates the payload of the plot. If it exceeds GenomeBrowser.max_payload, tooltips are dropped, 
+    then the points of the rasterized tracks are dropped, the points of the other tracks are downsampled, the finest resolutions of the binned data and images of the tracks are dropped and finally the bounds are reduced around the initial position.
+    The estimates before and after these steps are stored in GenomePlot.payload_report."""
+    budget = self.browser.max_payload
+    initial = self._estimate_payload()
+    report = initial
+    actions = []
+    tracks = self.browser.tracks
+    if budget is not None and report.bytes.sum() > budget and ("attributes" in self.patches.columns or any(track._tooltip_data for track in tracks)):
+        # the tooltips of the features and the columns only shown in the tooltips of the tracks (e.g. the ids and alleles of variants)
+        if "attributes" in self.patches.columns:
+            self.patches = self.patches.drop(columns="attributes")
+        self._track_tooltips = False
+        actions.append("tooltips dropped")
+        report = self._estimate_payload()
+
+    if budget is not None and report.bytes.sum() > budget:
+        # rasterized tracks are drawn from their images at every zoom level when their points are dropped
+        rasterized = [i for i, track in enumerate(tracks) if track._raster and 
+                      any(len(entry["all_data"].data[entry["pos"]]) > 0 for entry in track.loaded_sources if "raster" in entry)]
+        for i in rasterized:
+            self._track_max_points[id(tracks[i])] = 0
+            actions.append(f"points of track {i} dropped")
+        if len(rasterized) > 0:
+            report = self._estimate_payload()
+
+    track_bytes = report.set_index("component").bytes
+    point_bytes = sum(track_bytes[f"track {i}"] for i, track in enumerate(tracks) if track.data is not None and not track._raster)
+    if budget is not None and report.bytes.sum() > budget and point_bytes > 0:
+        # the points of all the tracks are reduced by the same factor, keeping at least min_track_points points per track
+        factor = max(1 - (report.bytes.sum()-budget)/point_bytes, 0)
+        for i, track in enumerate(tracks):
+            if track.data is not None and not track._raster and len(track.data) > self.browser.min_track_points:
+                self._track_max_points[id(track)] = max(int(len(track.data)*factor), self.browser.min_track_points)
+                actions.append(f"track {i} downsampled to {self._track_max_points[id(track)]} points")
+        report = self._estimate_payload()
+
+    # the finest resolution of the binned data of all the tracks is dropped until the plot fits, keeping the coarsest resolution
+    while budget is not None and report.bytes.sum() > budget:
+        coarsened = [track for track in tracks if self._track_coarsening.get(id(track), 0) < track._pyramid_levels - 1]
+        if len(coarsened) == 0:
+            break
+        for track in coarsened:
+            self._track_coarsening[id(track)] = self._track_coarsening.get(id(track), 0) + 1
+        report = self._estimate_payload()
+    for i, track in enumerate(tracks):
+        if self._track_coarsening.get(id(track), 0) > 0:
+            n_levels = self._track_coarsening[id(track)]
+            actions.append(f"{n_levels} finest resolution{'s' if n_levels > 1 else ''} of track {i} dropped")
+
+    if budget is not None and report.bytes.sum() > budget:
+        # all the components are roughly proportional to the size of the region plotted
+        width = self.bounds[1] - self.bounds[0]
+        new_width = max(int(width*budget/report.bytes.sum()), min(self.browser.init_win, width))
+        left = int(min(max(self.init_pos - new_width//2, self.bounds[0]), self.bounds[1] - new_width))
+        bounds = (left, left + new_width)
+        if bounds != tuple(self.bounds):
+            positions = np.sort(self._patch_index.query(bounds[0], bounds[1]))
+            self.patches = self.patches.iloc[positions]
+            self._patch_index = self._patch_index.take(positions)
+            if self.seq is not None:
+                self.seq = self.seq[bounds[0]-self.bounds[0]:bounds[1]-self.bounds[0]]
+            self.bounds = bounds
+            actions.append(f"bounds reduced to {bounds}")
+            report = self._estimate_payload()
+
+    self.payload_report = pd.DataFrame({"component": initial.component, 
+                                        "estimated_bytes": initial.bytes, 
+                                        "bytes": initial[["component"]].merge(report, how="left").bytes.fillna(0).astype(int)})
+    if len(actions) > 0:
+        warnings.warn(f"The estimated size of the plot ({initial.bytes.sum()/2**20:.1f} MB) exceeds max_payload ({budget/2**20:.1f} MB): "
+                      + ", ".join(actions) + f". The estimated size is now {report.bytes.sum()/2**20:.1f} MB.")
 
 # %% ../nbs/API/03_plot.ipynb 10
 @patch
@@ -212,50 +366,127 @@ def _get_sequence_div(self:GenomePlot):
                         styles = sty,
                         )
 
+# %% ../nbs/API/03_plot.ipynb 11
+@patch
+def _get_overview_levels(self:GenomePlot)->list:
+    """Density of the features at several resolutions, from bins of max_interval/width bp (the finest resolution needed when
+    the overview is zoomed in as much as the browser can be zoomed out) to bins covering the bounds with at most width bins."""
+    if self._overview_levels is None or self._overview_levels[0] != tuple(self.bounds):
+        features = self.browser.features
+        feature_types = [t for t in pd.unique(features["type"]) if t in self.browser.feature_types]
+        max_bins = self.browser.width
+        min_bin_size = int(np.ceil(min(self.browser.max_interval, self.bounds[1]-self.bounds[0]) / max_bins))
+        levels = density_pyramid(features, self.bounds, min_bin_size, max_bins=max_bins, feature_types=feature_types)
+        # single precision is enough for plotting and halves the payload
+        levels = [(bin_size, level.astype({c: np.float32 for c in level.columns if c.startswith("cov_")}).astype(
+                   {c: np.int32 for c in level.columns if not c.startswith("cov_")})) for bin_size, level in levels]
+        self._overview_levels = (tuple(self.bounds), levels)
+    return self._overview_levels[1]
+
+@patch
+def _get_overview(self:GenomePlot):
+    """Minimap of the coverage of each feature type along the bounds. The region shown in the browser is selected with a RangeTool.
+    Only the bins of one resolution level around the overview window are loaded, so the number of glyphs stays below a few thousands."""
+    with self.profiler.stage("overview") as record:
+        levels = self._get_overview_levels()
+        level_bin_size, level = levels[-1]
+        record["rows"] = sum(len(level) for _, level in levels)
+        self._overview_source = ColumnDataSource(level)
+        overview_range = Range1d(self.bounds[0], self.bounds[1], bounds=self.bounds,
+                                 min_interval=min(self.browser.max_interval, self.bounds[1]-self.bounds[0]))
+        self.overview_fig = figure(
+            tools="xwheel_zoom, xpan, reset",
+            active_scroll="xwheel_zoom",
+            height=self.browser.overview_height,
+            x_range=overview_range,
+            output_backend=self.output_backend,
+        )
+        self.overview_fig.frame_width = self.browser.width
+        self.overview_fig.xaxis[0].formatter = NumeralTickFormatter(format="0,0")
+        self.overview_fig.yaxis.visible = False
+        self.overview_fig.xgrid.visible = False
+        self.overview_fig.ygrid.visible = False
+        self.overview_fig.toolbar_location = None
+
+        feature_types = [c[len("n_"):] for c in level.columns if c.startswith("n_")]
+        renderers = []
+        for feature_type in feature_types:
+            glyph = self.browser.glyphs.get(feature_type)
+            color = glyph.colors[0] if glyph is not None else "grey"
+            renderers.append(self.overview_fig.step(x="left", y=f"cov_{feature_type}", mode="after",
+                                                    source=self._overview_source, color=color))
+        if len(renderers) > 0:
+            self.overview_fig.add_tools(HoverTool(renderers=renderers[:1], mode="vline",
+                                                  tooltips=[("region", "@left{0,0}-@right{0,0}")] 
+                                                  + [(feature_type, f"@n_{feature_type}") for feature_type in feature_types]))
+
+        self.overview_fig.add_tools(RangeTool(x_range=self.main_fig.x_range))
+
+        overview_callback = CustomJS(
+            args={
+                "x_range": overview_range,
+                "source": self._overview_source,
+                "levels": [{"bin_size": bin_size, "data": {c: level[c].values for c in level.columns}} for bin_size, level in levels],
+                "max_bins": self.browser.width,
+            },
+            code=overview_callback_code
+        )
+        overview_range.js_on_change('start', overview_callback)
+        overview_range.js_on_change('end', overview_callback)
+    return self.overview_fig
+
 # %% ../nbs/API/03_plot.ipynb 12
 @patch
 def _set_js_callbacks(self:GenomePlot):
         ## Adding the ability to display the sequence when zooming in
         self.sequence_dic = {
-            'seq': str(self.browser.seq).upper() if self.browser.show_seq else "",
-            'bounds':self.browser.bounds,
+            'seq': str(self.seq).upper() if self.browser.show_seq else "",
+            'bounds':self.bounds,
+            'show': self.browser.show_seq,
         }
 
-        self._xcb = CustomJS(
+        # the glyphs are sorted by left position so that the callback can find the glyphs to load with a binary search
+        all_glyphs = self.patches.iloc[self._patch_index.order]
+        self._all_glyphs = ColumnDataSource(all_glyphs.to_dict(orient="list"))
+        glyph_index = {
+            "left": self._patch_index.left,
+            "right_max": self._patch_index.right_max,
+        }
+
+        # A single callback updates the sequence, the glyphs and the tracks once per animation frame
+        self._x_range_dispatcher = CustomJS(
             args={
                 "x_range": self.main_fig.x_range,
                 "sequence": self.sequence_dic,
-                "all_glyphs":self.browser.patches.to_dict(orient="list"),
+                "all_glyphs": self._all_glyphs,
+                "glyph_index": glyph_index,
                 "glyph_source": self._glyph_source,
                 "div": self._div,
                 "loaded_range":self._loaded_range,
+                "tracks": [],
             },
-            code=x_range_change_callback_code
-        )
-        
-        self._glyph_update_callback = CustomJS(
-            args={
-                "x_range": self.main_fig.x_range,
-                "all_glyphs":self.browser.patches.to_dict(orient="list"),
-                "glyph_source": self._glyph_source,
-                "loaded_range":self._loaded_range,
-            },
-            code=glyph_update_callback_code
+            code=x_range_dispatcher_code
         )
 
-        self.main_fig.x_range.js_on_change('start', self._xcb, self._glyph_update_callback)
+        self.main_fig.x_range.js_on_change('start', self._x_range_dispatcher)
+        self.main_fig.x_range.js_on_change('end', self._x_range_dispatcher)
 
 # %% ../nbs/API/03_plot.ipynb 14
 @patch
 def _get_browser_elements(self:GenomePlot):
-        self._add_annotations() 
+        with self.profiler.stage("add_annotations") as record:
+            self._add_annotations() 
+            record["rows"] = len(self._glyph_source.data["xs"])
         self._get_sequence_div()
-        self._set_js_callbacks()
+        with self.profiler.stage("set_js_callbacks", rows=len(self.patches)):
+            self._set_js_callbacks()
 
         if self.browser.show_seq:
             self.elements = [self.main_fig,self._div]
         else:
             self.elements = [self.main_fig]
+        if self.browser.overview:
+            self.elements.insert(0, self._get_overview())
 
 # %% ../nbs/API/03_plot.ipynb 16
 @patch
@@ -265,7 +496,7 @@ def _get_search_box(self:GenomePlot):
         #for attr in self.patches.columns:
         #    if not attr in ["xs","ys","color","pos"]:
         #        completions.update(map(str,set(self.patches[attr])))
-        completions.update(map(str,set(self.browser.patches["names"])))
+        completions.update(map(str,set(self.patches["names"])))
         
         search_input = AutocompleteInput(completions=list(completions), placeholder="search by name")
         #search_input = TextInput()
@@ -274,15 +505,15 @@ def _get_search_box(self:GenomePlot):
             args={
                 "x_range": self.x_range,
                 "glyph_source": self._glyph_source,
-                "bounds": self.browser.bounds,
-                "all_glyphs": self.browser.patches.to_dict(orient="list"),
+                "bounds": self.bounds,
+                "all_glyphs": self._all_glyphs,
                 "loaded_range": self._loaded_range,
                 "div": self._div,
             },
             code=search_callback_code
         )
 
-        search_input.js_on_change('value', call_back_search, self._xcb, self._glyph_update_callback)
+        search_input.js_on_change('value', call_back_search, self._x_range_dispatcher)
 
         return search_input
 
@@ -309,13 +540,13 @@ def _get_sequence_search(self:GenomePlot):
             args={
                 "x_range": self.x_range,
                 "sequence": self.sequence_dic,
-                "bounds": self.browser.bounds,
+                "bounds": self.bounds,
                 "search_span_source": search_span_source,
             },
             code=sequence_search_code
         )
 
-        seq_input.js_on_change('value',call_back_sequence_search, self._xcb, self._glyph_update_callback)
+        seq_input.js_on_change('value',call_back_sequence_search, self._x_range_dispatcher)
         
         sty=Styles(
                    margin_left="1px",
@@ -332,12 +563,12 @@ def _get_sequence_search(self:GenomePlot):
         nextButton_callback = CustomJS(
             args={
                 "x_range": self.x_range,
-                "bounds": self.browser.bounds,
+                "bounds": self.bounds,
                 "search_span_source": search_span_source,
             },
             code=next_button_code)
         
-        nextButton.js_on_event("button_click", nextButton_callback, self._xcb, self._glyph_update_callback)
+        nextButton.js_on_event("button_click", nextButton_callback, self._x_range_dispatcher)
         
         previousButton = Button(icon=TablerIcon("arrow-left"),
                                 label="",
@@ -348,12 +579,12 @@ def _get_sequence_search(self:GenomePlot):
         previousButton_callback = CustomJS(
             args={
                 "x_range": self.x_range,
-                "bounds": self.browser.bounds,
+                "bounds": self.bounds,
                 "search_span_source": search_span_source,
             },
             code=previous_button_code)
         
-        previousButton.js_on_event("button_click", previousButton_callback, self._xcb, self._glyph_update_callback)
+        previousButton.js_on_event("button_click", previousButton_callback, self._x_range_dispatcher)
 
         return row(seq_input, previousButton, nextButton)
 
@@ -361,21 +592,45 @@ def _get_sequence_search(self:GenomePlot):
 @patch
 def _collect_elements(self:GenomePlot):
     """collects and assembles all the main figure elements including the sequence div and search boxes"""
-    self._get_browser_elements()
-    elements = self.elements.copy()
-    if self.browser.search:
-        search_elements = [self._get_search_box()]
-        if self.browser.show_seq:
-            search_elements.append(self._get_sequence_search())
-        elements = [row(search_elements)]+elements
-
-    self.elements = elements
-    for track in self.browser.tracks:
-        self._add_track(track)
-
-    for modifier in self.browser.modifiers:
-        if modifier.gene_track:
-            modifier.render(self.main_fig)
-        if modifier.data_tracks:
-            for i, track in enumerate(self.tracks):
-                modifier.render(self.track_figs[i], True, track.__dict__)
+    with self.profiler.stage("collect_elements"):
+        self._get_browser_elements()
+        elements = self.elements.copy()
+        if self.browser.search:
+            with self.profiler.stage("search_widgets"):
+                search_elements = [self._get_search_box()]
+                if self.browser.show_seq:
+                    search_elements.append(self._get_sequence_search())
+            elements = [row(search_elements)]+elements
+
+        self.elements = elements
+        for track in self.browser.tracks:
+            with self.profiler.stage("add_track", rows=None if track.data is None else len(track.data)):
+                self._add_track(track)
+
+        with self.profiler.stage("modifiers", rows=len(self.browser.modifiers)):
+            for modifier in self.browser.modifiers:
+                # each rendering of a modifier has its own loaded range, updated by the x_range dispatcher
+                if modifier.gene_track:
+                    entry = modifier.render(self.main_fig, loaded_range=self._get_loaded_range())
+                    if entry is not None:
+                        self._track_sources.append(entry)
+                if modifier.data_tracks:
+                    for i, track in enumerate(self.tracks):
+                        entry = modifier.render(self.track_figs[i], True, track.__dict__, loaded_range=self._get_loaded_range())
+                        if entry is not None:
+                            self._track_sources.append(entry)
+        if self.seq is not None and any("translation" in entry for entry in self._track_sources):
+            self.sequence_dic["seq"] = str(self.seq).upper() # the six frames are translated from the sequence
+        self._x_range_dispatcher.args = dict(self._x_range_dispatcher.args, tracks=self._track_sources)
+        for entry in self._track_sources:
+            if _is_point_source(entry):
+                # rows added with Track.stream are loaded around the current window
+                entry["all_data"].js_on_change("streaming", self._x_range_dispatcher)
+                entry["all_data"].js_on_change("data", self._x_range_dispatcher)
+
+# %% ../nbs/API/03_plot.ipynb 21
+@patch
+def _set_live(self:GenomePlot, handle):
+    """Connects the tracks to their figures in the plot shown with the notebook handle, so that Track.stream can update them"""
+    for track, fig in zip(self.tracks, self.track_figs):
+        track._set_live(handle, fig)
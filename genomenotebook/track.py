@@ -8,34 +8,46 @@ __all__ = ['Track']
 # %% ../nbs/API/01_track.ipynb 4
 from fastcore.basics import *
 
-from bokeh.io import output_notebook #|hide_line
-output_notebook(hide_banner=True) #|hide_line
-
-
 from bokeh.plotting import figure
+from bokeh.transform import dodge
+from bokeh.palettes import Category10_10
 
 from bokeh.models import (
     Quad,
-    CustomJS,
+    Text,
     ColumnDataSource,
     NumeralTickFormatter,
     Range1d,
     HoverTool,
+    Rect,
+    FixedTicker,
+    LinearColorMapper,
+    LogColorMapper,
+    CustomJSHover,
 )
 
-from .javascript import track_callback_code
+from genomenotebook.utils import (
+    iter_bed,
+    interval_coverage,
+    read_track_file,
+    merge_intervals,
+    content_pyramid,
+    find_runs,
+    find_orfs,
+    standard_code,
+    iter_vcf,
+    find_motifs,
+    matrix_pyramid,
+    raster_pyramid,
+    read_arrow_track,
+    estimate_payload,
+)
 
 import pandas as pd
-
-
-try: #pyBigWig cannot be installed on Windows
-    import pyBigWig
-except ImportError:
-    pyBigWig = None
-    
+import numpy as np
 import warnings
 
-from typing import List, Callable
+from typing import List, Callable, Union
 
 
 
@@ -46,9 +58,13 @@ class Track:
                  ylim: tuple = None, #limits of the y axis. If not specified, ylim will be set automatically with the max and min of the data plotted with Track.line, Track.scatter or Track.bar
                  height: int = 200, #size of the track
                  tools: str = "xwheel_zoom, ywheel_zoom, pan, box_zoom, save, reset", #comma separated list of Bokeh tools that can be used to navigate the plot
+                 bounds: tuple = None, #bounds of the GenomeBrowser, data loaded from files is restricted to the bounds
+                 seq_id: str = None, #id of the sequence displayed by the GenomeBrowser, data loaded from files is restricted to this sequence
                  **kwargs,
                 ):        
         self.height = height
+        self.bounds = bounds
+        self.seq_id = seq_id
 
         #ensuring that the active_scroll tool is part of the tools list 
         if "xwheel_zoom" not in [t.strip() for t in tools.split(',')]:
@@ -59,12 +75,19 @@ class Track:
         self.data = None
 
         self.ylim = ylim
+        self._ylim_from_data = False # True when ylim is computed from the data, it then follows the data added with Track.stream
+        self._live = None # (notebook handle, figure, data sources) of the plot shown with GenomeBrowser.show(live=True)
+        self._translated = False # True when the track shows the translation of the six frames, computed from the sequence of the plot
+        self._pyramid_levels = 0 # number of resolutions of the binned data of the track (see Track.sequence_content, Track.heatmap and Track.scatter)
+        self._raster = False # True when the points of the track are aggregated in images (see Track.scatter)
+        self._raster_images = {} # (data, images) of the rasterized points by rendering settings
+        self._tooltip_data = False # True when columns are sent only for the tooltips of the track (see Track.highlight and Track.variants)
         self.bokeh_figure_args = kwargs
         self.render_methods = []
 
         self.bokeh_args = kwargs
 
-    def get_fig(self, x_range, width, bounds, max_glyph_loading_range, output_backend):
+    def get_fig(self, x_range, width, bounds, max_glyph_loading_range, output_backend, max_points=None, coarsening=0, tooltips=True):
         fig = figure(tools=self.tools,
                           active_scroll="xwheel_zoom",
                           height=self.height,
@@ -87,23 +110,60 @@ class Track:
 
 
 
-        #self.track_loaded_data = None
+        self.loaded_sources = [] # sources updated by the x_range dispatcher of the GenomePlot
+        self._plot_bounds = bounds
+        self._max_points = max_points # set by GenomePlot when the payload exceeds GenomeBrowser.max_payload
+        self._coarsening = coarsening # number of finest resolutions of the binned data dropped by GenomePlot when the payload exceeds GenomeBrowser.max_payload
+        self._tooltips = tooltips # False when the columns only shown in the tooltips are dropped by GenomePlot when the payload exceeds GenomeBrowser.max_payload
         for render_method in self.render_methods:
             render_method(self, fig, loaded_range)
 
         return fig
 
+# %% ../nbs/API/01_track.ipynb 11
+def _downsample(data:pd.DataFrame, y:str, max_points:int)->pd.DataFrame:
+    """Keeps the rows with the minimum and maximum values of y in max_points//2 bins of consecutive rows, so that peaks are preserved"""
+    n_bins = max(max_points//2, 1)
+    bins = np.arange(len(data))*n_bins//len(data)
+    grouped = pd.Series(np.nan_to_num(data[y].values.astype(float))).groupby(bins)
+    return data.iloc[np.union1d(grouped.idxmin().values, grouped.idxmax().values)]
+
+@patch
+def _bounded_data(self:Track, pos:str)->pd.DataFrame:
+    """Restricts the data to the bounds of the plot, keeping one point on each side"""
+    data = self.data
+    if self._plot_bounds is not None:
+        positions = data[pos].values
+        ix_start = max(np.searchsorted(positions, self._plot_bounds[0]) - 1, 0)
+        ix_stop = np.searchsorted(positions, self._plot_bounds[1], side="right") + 1
+        data = data.iloc[ix_start:ix_stop]
+    return data
+
+@patch
+def _plotted_data(self:Track, pos:str)->pd.DataFrame:
+    """Restricts the data to the bounds of the plot, keeping one point on each side, and downsamples it to the maximum number of points"""
+    data = self._bounded_data(pos)
+    if self._max_points is not None and len(data) > self._max_points:
+        data = _downsample(data, self.columns[0], self._max_points)
+    return data
+
 # %% ../nbs/API/01_track.ipynb 12
 @patch
 def set_track_data_source(self:Track, 
-                          data:pd.DataFrame, # data to be plotted
+                          data:Union[pd.DataFrame, str], # data to be plotted, or Parquet/Arrow data read with read_arrow_track
                           pos, 
                           columns:List[str], # columns to store as data
                          ):
     columns=[c for c in columns if c] #some arguments can be None => remove them
     self.columns = columns
     
-    data=data[[pos]+columns].sort_values(pos)
+    if not isinstance(data, pd.DataFrame):
+        data = read_arrow_track(data, pos, columns, seq_id=self.seq_id, bounds=self.bounds)
+    # the data is only copied when columns have to be dropped or the positions sorted
+    if list(data.columns) != [pos]+columns:
+        data=data[[pos]+columns]
+    if not data[pos].is_monotonic_increasing:
+        data=data.sort_values(pos)
     
     self.data=data
 
@@ -112,30 +172,41 @@ def set_track_data_source(self:Track,
         ymin = data[y].values.min()
         ymax = data[y].values.max()
         self.ylim = (ymin, ymax) 
+        self._ylim_from_data = True
 
 
 @patch
-def set_figure_data_source(self:Track, fig, pos, loaded_range):
-    all_data = ColumnDataSource(self.data)
-    data_subset = self.data.loc[(loaded_range.data["start"][0] < self.data[pos]
-                 ) & (
-                 self.data[pos] < loaded_range.data["end"][0])]
+def set_figure_data_source(self:Track, fig, pos, loaded_range, 
+                           raster:dict = None, # rasterization settings of the track (see Track.scatter), no point is loaded while it is rasterized
+                          ):
+    if raster is None:
+        data = self._plotted_data(pos)
+    else:
+        # the points of rasterized tracks are not downsampled, they are only sent when they fit in the payload
+        data = self._bounded_data(pos)
+        if not raster["points"]:
+            data = data.iloc[:0]
+    all_data = ColumnDataSource(data)
+    if raster is not None and raster["rasterized"]:
+        data_subset = data.iloc[:0]
+    else:
+        data_subset = data.loc[(loaded_range.data["start"][0] < data[pos]
+                     ) & (
+                     data[pos] < loaded_range.data["end"][0])]
     loaded_data = ColumnDataSource(data_subset)
     if len(data_subset)>10**5:
         warnings.warn("You are trying to plot more than 10^5 glyphs, this might overflow your memory. \
-        Consider using bounds or reducing the number of datapoints.")
+        Consider using bounds, reducing the number of datapoints or rasterizing the track.")
     
-    xcb = CustomJS(
-        args = {
-            "x_range": fig.x_range,
+    entry = {
             "pos": pos,
             "all_data":all_data,
             "loaded_data": loaded_data,
-            "track_loaded_range":loaded_range,
-        },
-            code = track_callback_code
-    )
-    fig.x_range.js_on_change('start', xcb)
+            "loaded_range":loaded_range,
+        }
+    if raster is not None:
+        entry["raster"] = raster
+    self.loaded_sources.append(entry)
     ymin, ymax = self.ylim
     fig.y_range=Range1d(ymin,ymax,
             bounds=(ymin,ymax))
@@ -147,7 +218,7 @@ def set_figure_data_source(self:Track, fig, pos, loaded_range):
 # %% ../nbs/API/01_track.ipynb 13
 @patch
 def line(self:Track,
-         data: pd.DataFrame, #pandas DataFrame containing the data
+         data: Union[pd.DataFrame, str], #pandas DataFrame containing the data, or a Parquet file or directory, pyarrow Table or Dataset (only the columns used and the rows within the bounds are read)
          pos: str, #name of the column containing the positions along the genome
          y: str, #name of the column containing the data to be plotted on the y-axis
          hover_data:List[str] = None, #list of column names to be shown when hovering over the data
@@ -177,11 +248,17 @@ from bokeh.transform import factor_cmap
 # %% ../nbs/API/01_track.ipynb 18
 @patch
 def scatter(self:Track,
-         data: pd.DataFrame, #pandas DataFrame containing the data
+         data: Union[pd.DataFrame, str], #pandas DataFrame containing the data, or a Parquet file or directory, pyarrow Table or Dataset (only the columns used and the rows within the bounds are read)
          pos: str, #name of the column containing the positions along the genome
          y: str, #name of the column containing the data to be plotted on the y-axis
          factors: str = None, #name of a column of values to be used as factors
          hover_data: List = None, #list of additional column names to be shown when hovering over the data
+         raster: bool = False, #if True, the points are aggregated in images binned at several resolutions when the window holds more than raster_threshold points
+         raster_threshold: int = 10**5, #maximum number of points in the window drawn as glyphs when raster is True
+         raster_points: int = 10**6, #maximum number of points within the bounds sent to the plot when raster is True, above it the track is only drawn as images
+         agg: str = "count", #aggregation of the points in each pixel of the image: "count", "mean" or "max" (of the values column)
+         values: str = None, #name of the column aggregated by "mean" and "max", defaults to y
+         palette: str = "Viridis256", #palette of the image
          **kwargs, #enables to pass keyword arguments used by the Bokeh function
         ):
     if hover_data is None:
@@ -192,22 +269,81 @@ def scatter(self:Track,
         hover_data = hover_data.copy()
     else:
         raise ValueError("hover_data must be None, str, or List")
+    if agg not in ("count", "mean", "max"):
+        raise ValueError(f"agg must be count, mean or max, not {agg}")
+    if values is None:
+        values = y
+
+    def render_raster(track, fig, loaded_range):
+        # the points are aggregated in images binned at several resolutions (see raster_pyramid), and the x_range dispatcher shows
+        # the images with about one bin per pixel while the window holds more than raster_threshold points.
+        # The points are only sent to the plot when they fit in raster_points and in the payload budget of the GenomePlot
+        points = track._bounded_data(pos)
+        positions = points[pos].values
+        width, height = fig.frame_width, max(track.height - 30, 1) # the x axis takes about 30 pixels
+        if track._plot_bounds is not None:
+            bounds = tuple(track._plot_bounds)
+        else:
+            bounds = (int(np.floor(positions[0])), int(positions[-1]) + 1) if len(positions) > 0 else (0, 1)
+        # the images are computed once for the estimate of the payload and the plot (see GenomePlot)
+        key = (y, values, agg, raster_threshold, bounds, width, height, tuple(track.ylim))
+        data, levels = track._raster_images.get(key, (None, None))
+        if data is not track.data:
+            # the finest bins are about one pixel wide in a window of raster_threshold points at the average density,
+            # and the images hold at most one pixel per point so that they are smaller than the points
+            min_bin_size = max(raster_threshold/width, height)*(bounds[1] - bounds[0])/max(len(positions), 1)
+            levels = raster_pyramid(positions, points[y].values, bounds, track.ylim, height, min_bin_size, 
+                                    values=points[values].values, agg=agg, max_bins=width)
+            track._raster_images = {k: v for k, v in track._raster_images.items() if v[0] is track.data} # images of previous data are dropped
+            track._raster_images[key] = (track.data, levels)
+        track._pyramid_levels = max(track._pyramid_levels, len(levels))
+        # the finest levels dropped by the payload budget are skipped, level i replaces level i-1 when the window holds width bins of level i
+        plotted = levels[min(track._coarsening, len(levels)-1):]
+        image_levels = [{"image": image, "start": bounds[0], "bin_size": size, "min_window": size*width if i > 0 else 0} 
+                        for i, (size, image) in enumerate(plotted)]
+
+        shipped = len(points) <= raster_points and (track._max_points is None or len(points) <= track._max_points)
+        window = (fig.x_range.start, fig.x_range.end)
+        n_window = np.searchsorted(positions, window[1], side="right") - np.searchsorted(positions, window[0], side="right")
+        rasterized = bool(n_window > raster_threshold or not shipped)
+        y0, dh = track.ylim[0], (track.ylim[1] - track.ylim[0]) or 1
+        source = ColumnDataSource({"image": [], "x": [], "y": [], "dw": [], "dh": []})
+        if rasterized:
+            source.data = {**_image_window(image_levels, fig.x_range, loaded_range), "y": [y0], "dh": [dh]}
+        if agg == "count":
+            image = source.data["image"][0] if rasterized else np.full(1, np.nan)
+            high = np.nanmax(image) if (~np.isnan(image)).any() else 2
+            mapper = LogColorMapper(palette=palette, low=1, high=max(high, 2), nan_color="rgba(0, 0, 0, 0)")
+        else:
+            aggregated = points[values].values
+            low, high = (np.nanmin(aggregated), np.nanmax(aggregated)) if len(aggregated) > 0 else (0, 1)
+            mapper = LinearColorMapper(palette=palette, low=low, high=high, nan_color="rgba(0, 0, 0, 0)")
+        raster_settings = {"image": {"source": source, "levels": image_levels, "y": y0, "dh": dh}, "agg": agg, "mapper": mapper,
+                           "max_points": raster_threshold, "points": shipped, "rasterized": rasterized}
+        renderer = fig.image(image="image", x="x", y="y", dw="dw", dh="dh", source=source, color_mapper=mapper)
+        fig.add_tools(HoverTool(renderers=[renderer], tooltips=[("position", "$x{0,0}"), (y, "$y"), (agg, "@image")]))
+        return raster_settings
 
     def render_method(track, fig, loaded_range):
-        loaded_data = track.set_figure_data_source(fig, pos, loaded_range)
+        raster_settings = render_raster(track, fig, loaded_range) if raster else None
+        loaded_data = track.set_figure_data_source(fig, pos, loaded_range, raster=raster_settings)
         if factors!=None:
-            color=factor_cmap(factors,"Category10_10",tuple(set(data[factors].values)))
+            color=factor_cmap(factors,"Category10_10",tuple(set(track.data[factors].values)))
             
-            fig.scatter(source=loaded_data, x=pos, y=y, color=color, legend_group=factors, **kwargs)
+            renderer = fig.scatter(source=loaded_data, x=pos, y=y, color=color, legend_group=factors, **kwargs)
             
             fig.legend.title = factors
             fig.legend.location = "top_left"
         else:
-            fig.scatter(source=loaded_data, x=pos, y=y, **kwargs)
-
-            
-
-    self.set_track_data_source(data, pos=pos, columns=[y,factors]+hover_data)
+            renderer = fig.scatter(source=loaded_data, x=pos, y=y, **kwargs)
+        if raster:
+            fig.tools[-1].renderers = [renderer] # the tooltips of the points are not shown over the image
+
+    columns = [y,factors]+hover_data
+    if raster and values not in columns:
+        columns.append(values)
+    self._raster = self._raster or raster
+    self.set_track_data_source(data, pos=pos, columns=columns)
     self.render_methods.append(render_method)
     
 
@@ -215,7 +351,7 @@ def scatter(self:Track,
 # %% ../nbs/API/01_track.ipynb 24
 @patch
 def bar(self:Track,
-         data: pd.DataFrame, #pandas DataFrame containing the data
+         data: Union[pd.DataFrame, str], #pandas DataFrame containing the data, or a Parquet file or directory, pyarrow Table or Dataset (only the columns used and the rows within the bounds are read)
          pos: str, #name of the column containing the positions along the genome
          y: str, #name of the column containing the data to be plotted on the y-axis
          factors: str = None, #name of a column of values to be used as factors
@@ -235,7 +371,7 @@ def bar(self:Track,
     def render_method(track, fig, loaded_range):
         loaded_data = track.set_figure_data_source(fig, pos, loaded_range)
         if factors!=None:
-            color=factor_cmap(factors,"Category10_3",tuple(set(data[factors].values)))
+            color=factor_cmap(factors,"Category10_3",tuple(set(track.data[factors].values)))
             
             fig.vbar(source=loaded_data, x=pos, top=y, color=color, legend_group=factors, **kwargs)
     
@@ -247,6 +383,48 @@ def bar(self:Track,
     self.set_track_data_source(data, pos, columns=[y,factors]+hover_data)
     self.render_methods.append(render_method)
 
+# %% ../nbs/API/01_track.ipynb 26
+@patch
+def coverage(self:Track,
+             intervals: Union[pd.DataFrame, str], #DataFrame of intervals or path to a BED file (also accepts gzip files)
+             left_col: str = "left", #name of the column containing the start positions of the intervals
+             right_col: str = "right", #name of the column containing the end positions of the intervals
+             bin_size: int = None, #if specified, the mean coverage is computed over bins of bin_size bp
+             chunksize: int = 10**6, #number of lines of the BED file read at once
+             **kwargs, #enables to pass keyword arguments used by the Bokeh function
+            ):
+    """Plots the coverage of a set of intervals (e.g. reads or peaks), computed within the bounds of the GenomeBrowser.
+    Intervals are half-open [left, right) as in BED files. BED files are streamed and only the intervals on the seq_id of the browser are used."""
+    if isinstance(intervals, str):
+        intervals = iter_bed(intervals, seq_id=self.seq_id, bounds=self.bounds, chunksize=chunksize)
+    
+    data = interval_coverage(intervals, left_col, right_col, bounds=self.bounds, bin_size=bin_size)
+
+    def render_method(track, fig, loaded_range):
+        loaded_data = track.set_figure_data_source(fig, "pos", loaded_range)
+        fig.step(source=loaded_data, x="pos", y="coverage", mode="after", **kwargs)
+
+    self.set_track_data_source(data, "pos", columns=["coverage"])
+    self.render_methods.append(render_method)
+
+# %% ../nbs/API/01_track.ipynb 27
+@patch
+def signal(self:Track,
+           path: str, #path to a bedGraph, WIG or bigWig file (bedGraph and WIG files can be gzipped)
+           glyph: str = "line", #line, scatter or bar
+           file_format: str = None, #bedgraph, wig or bigwig. If None, the format is guessed from the file extension
+           chunksize: int = 10**6, #number of lines read at once
+           **kwargs, #arguments passed to Track.line, Track.scatter or Track.bar
+          ):
+    """Plots the values stored in a bedGraph, WIG or bigWig file. The file is streamed and only the data on the seq_id and within the bounds of the GenomeBrowser is kept.
+    bigWig files, and bedGraph files indexed with tabix when pysam is installed, are read through their index."""
+    plot_functions = {"line": self.line, "scatter": self.scatter, "bar": self.bar}
+    if glyph not in plot_functions:
+        raise ValueError(f"glyph must be one of {list(plot_functions)}, not {glyph}")
+
+    data = read_track_file(path, seq_id=self.seq_id, bounds=self.bounds, file_format=file_format, chunksize=chunksize)
+    plot_functions[glyph](data, pos="pos", y="value", **kwargs)
+
 # %% ../nbs/API/01_track.ipynb 28
 @patch
 def custom(self:Track,
@@ -260,6 +438,59 @@ def custom(self:Track,
 
     self.render_methods.append(render_method)
 
+# %% ../nbs/API/01_track.ipynb 29
+def _interval_index(data:pd.DataFrame, left_col:str, right_col:str)->dict:
+    """Index used by the x_range dispatcher to find the intervals overlapping the window with a binary search (data must be sorted by left_col)"""
+    return {"left": data[left_col].values, "right_max": np.maximum.accumulate(data[right_col].values)}
+
+def _windowed_intervals(data:pd.DataFrame, # intervals to plot
+                        left_col:str, # name of the column containing the start positions of the intervals
+                        right_col:str, # name of the column containing the end positions of the intervals
+                        columns:List[str], # other columns plotted or shown in the tooltips
+                        fig, # figure in which the intervals are plotted
+                        loaded_range:ColumnDataSource, # range of positions loaded around the window, shared with the other sources of the figure
+                        merge:bool=True, # if True, intervals less than a pixel apart are merged when zoomed out
+                        bounds:tuple=None, # if not None, only the intervals that overlap the bounds are sent to the plot
+                       ):
+    """Returns the ColumnDataSource of the intervals loaded around the current window, and the entry that allows the x_range dispatcher to update it.
+    Like the annotation glyphs, the intervals are sorted by left position and sliced with a binary search when the loaded range becomes stale.
+    When merge is True, a merged copy of the intervals (separated by less than a quarter of a pixel when the browser is zoomed out to max_interval)
+    replaces them whenever the window is large enough for the merged intervals to be less than a pixel apart."""
+    data = data[[left_col, right_col]+columns]
+    if bounds is not None:
+        data = data.loc[(data[right_col].values > bounds[0]) & (data[left_col].values < bounds[1])]
+    data = data.sort_values(left_col, kind="stable")
+    entry = {
+        "pos": left_col,
+        "all_data": ColumnDataSource(data),
+        "index": _interval_index(data, left_col, right_col),
+        "loaded_range": loaded_range,
+    }
+    x_range = fig.x_range
+    window = (x_range.start - loaded_range.data["range"][0], x_range.end + loaded_range.data["range"][0])
+    loaded = data
+
+    max_interval = x_range.max_interval if x_range.max_interval is not None else x_range.end - x_range.start
+    max_gap = max_interval / fig.frame_width / 4
+    if merge and len(data) > 1:
+        # the hover columns are emptied in the merged intervals, the colors and alphas are kept
+        style_cols = [c for c in columns[:2] if c in data.columns]
+        merged = merge_intervals(data, left_col, right_col, max_gap=max_gap, by=style_cols).drop(columns="n")
+        if len(merged) < len(data):
+            for col in columns[len(style_cols):]:
+                merged[col] = ""
+            merged = merged[data.columns]
+            min_window = max_gap * fig.frame_width
+            entry["levels"] = [{"all_data": ColumnDataSource(merged), 
+                                "index": _interval_index(merged, left_col, right_col),
+                                "min_window": min_window}]
+            if x_range.end - x_range.start >= min_window:
+                loaded = merged
+
+    loaded = loaded.loc[(loaded[right_col].values > window[0]) & (loaded[left_col].values < window[1])]
+    entry["loaded_data"] = ColumnDataSource(loaded)
+    return entry["loaded_data"], entry
+
 # %% ../nbs/API/01_track.ipynb 30
 @patch
 def highlight(self:Track,
@@ -273,9 +504,10 @@ def highlight(self:Track,
     color = "green",
     alpha: str = 0.2, #transparency
     hover_data: List[str] = None, #list of additional column names to be shown when hovering over the data
+    merge: bool = True, #if True, regions less than a pixel apart are drawn as a single region when zoomed out
     **kwargs, #enables to pass keyword arguments used by the Bokeh function
     ):
-    
+    """Highlights regions of the track. Only the regions around the current window are loaded in the plot, so that large sets of regions can be displayed."""
     if hover_data is None:
         hover_data = list()
     elif type(hover_data) is str:
@@ -285,11 +517,6 @@ def highlight(self:Track,
     else:
         raise ValueError("hover_data must be None, str, or List")
 
-    if color_col not in self.data.columns:
-        data[color_col] = 'green'
-    if alpha_col not in self.data.columns:
-        data[alpha_col] = alpha
-
     if data is None:
         if left is None or right is None or color is None:
             raise ValueError("If `data` is not provided, then left, right, and color must be specified")
@@ -297,13 +524,17 @@ def highlight(self:Track,
     else:
         data = data.copy() # copy the dataframe because we modify it below, and users might not expect their input to be modified.
 
+    if color_col not in data.columns:
+        data[color_col] = color
+    if alpha_col not in data.columns:
+        data[alpha_col] = alpha
+    self._tooltip_data = self._tooltip_data or len(hover_data) > 0
+
     def render_method(track, fig, loaded_range):
-        if color not in data.columns:
-            data[color_col]='green'
-    
-        data[alpha_col]=alpha
-    
-        highlight_source = ColumnDataSource(data[[left_col,right_col,color_col,alpha_col]+hover_data])
+        shown = hover_data if track._tooltips else [] # the tooltip columns can be dropped by the payload budget
+        highlight_source, entry = _windowed_intervals(data, left_col, right_col, [color_col, alpha_col]+shown, 
+                                                      fig, loaded_range, merge=merge, bounds=track._plot_bounds)
+        track.loaded_sources.append(entry)
     
         if track.ylim is None:
             warnings.warn("When adding highlights to a track, ylim needs to be defined. \
@@ -317,7 +548,385 @@ def highlight(self:Track,
                **kwargs)
 
         renderer = fig.add_glyph(highlight_source, r)
-        tooltips=[(f"{left_col} - {right_col}",f"@{left_col} - @{right_col}")]+[(f"{attr}",f"@{attr}") for attr in hover_data]
+        tooltips=[(f"{left_col} - {right_col}",f"@{left_col} - @{right_col}")]+[(f"{attr}",f"@{attr}") for attr in shown]
         fig.add_tools(HoverTool(renderers=[renderer],
                                             tooltips=tooltips))
     self.render_methods.append(render_method)
+
+# %% ../nbs/API/01_track.ipynb 31
+def _bounded_bins(level:pd.DataFrame, bounds:tuple)->pd.DataFrame:
+    """Bins of a level (sorted by position, with the columns left and right) that overlap the bounds"""
+    if bounds is None:
+        return level
+    return level.iloc[np.searchsorted(level["right"].values, bounds[0], side="right"):np.searchsorted(level["left"].values, bounds[1])]
+
+@patch
+def sequence_content(self:Track,
+                     seq, #sequence of the region displayed (str or Bio.Seq.Seq), e.g. GenomeBrowser.seq
+                     y: str = "gc", #gc, gc_skew, cumulative_skew or n (fraction of undetermined bases), see `sequence_content` in utils
+                     start: int = None, #position of the first base of seq on the genome, defaults to the left bound of the browser
+                     bin_size: int = 100, #size of the bins of the finest level in bp
+                     max_points: int = 2000, #maximum number of bins loaded around the window, coarser bins are loaded when zooming out
+                     n_runs: bool = True, #if True the runs of N are highlighted
+                     **kwargs, #enables to pass keyword arguments used by the Bokeh function
+                    ):
+    """Plots the GC content, GC skew, cumulative GC skew or fraction of N of the sequence in bins. 
+    The bins are computed once at several resolutions, and the x_range dispatcher of the GenomePlot loads the finest resolution
+    that keeps at most max_points bins around the window, so that whole genome views stay light and zooming needs no recomputation."""
+    if y not in ("gc", "gc_skew", "cumulative_skew", "n"):
+        raise ValueError(f"y must be gc, gc_skew, cumulative_skew or n, not {y}")
+    if start is None:
+        start = self.bounds[0] if self.bounds is not None else 0
+    # narrow types halve the size of the levels embedded in the plot
+    levels = [(size, level[["pos", "left", "right", y]].astype({"left": np.int32, "right": np.int32, y: np.float32})) 
+              for size, level in content_pyramid(seq, bin_size, max_bins=max_points, start=start)]
+    if self.ylim is None:
+        values = levels[0][1][y].values
+        self.ylim = (0, 1) if y in ("gc", "n") else (np.nanmin(values), np.nanmax(values))
+    self._pyramid_levels = max(self._pyramid_levels, len(levels))
+
+    def render_method(track, fig, loaded_range):
+        max_loading_range = loaded_range.data["range"][0]
+        # the finest levels dropped by the payload budget are skipped and the bins are restricted to the bounds of the plot
+        plotted = [(size, _bounded_bins(level, track._plot_bounds)) for size, level in levels[min(track._coarsening, len(levels)-1):]]
+        # level i replaces level i-1 when the bins of level i-1 loaded around the window would exceed max_points
+        min_windows = [max(max_points*plotted[i-1][0] - 2*max_loading_range, 0) for i in range(1, len(plotted))]
+        x_size = fig.x_range.end - fig.x_range.start
+        current = sum(x_size >= w for w in min_windows)
+        data = plotted[current][1]
+        positions = data["pos"].values
+        ix_start = max(np.searchsorted(positions, loaded_range.data["start"][0]) - 1, 0)
+        ix_stop = np.searchsorted(positions, loaded_range.data["end"][0], side="right") + 1
+        loaded_data = ColumnDataSource(data.iloc[ix_start:ix_stop])
+        track.loaded_sources.append({
+            "pos": "pos",
+            "all_data": ColumnDataSource(plotted[0][1]),
+            "loaded_data": loaded_data,
+            "loaded_range": loaded_range,
+            "levels": [{"all_data": ColumnDataSource(level), "min_window": w} for (_, level), w in zip(plotted[1:], min_windows)],
+        })
+        fig.y_range = Range1d(track.ylim[0], track.ylim[1], bounds=track.ylim)
+        renderer = fig.line(source=loaded_data, x="pos", y=y, **kwargs)
+        fig.add_tools(HoverTool(renderers=[renderer], tooltips=[("left - right", "@left - @right"), (y, f"@{y}")]))
+
+    self.render_methods.append(render_method)
+    if n_runs:
+        runs = find_runs(seq, "N", start=start)
+        if len(runs) > 0:
+            self.highlight(runs, color="gray", hover_data=None)
+
+# %% ../nbs/API/01_track.ipynb 32
+_frame_rows = {"+1": 5, "+2": 4, "+3": 3, "-1": 2, "-2": 1, "-3": 0} # bottom of the row of each frame
+
+@patch
+def orfs(self:Track,
+         seq, #sequence of the region displayed (str or Bio.Seq.Seq), e.g. GenomeBrowser.seq
+         start: int = None, #position of the first base of seq on the genome, defaults to the left bound of the browser
+         min_length: int = 300, #minimum length of the ORFs in bp, shorter ORFs are not sent to the plot
+         start_codons: List[str] = ("ATG", "GTG", "TTG"), #codons starting the ORFs
+         genetic_code: str = standard_code, #amino acids of the 64 codons in TCAG order
+         translation: bool = True, #if True the amino acids of the six frames are shown when zoomed in enough to read them
+         colors: tuple = ("#1f77b4", "#ff7f0e"), #colors of the ORFs of the + and - strands
+         **kwargs, #enables to pass keyword arguments used by the Bokeh function
+        ):
+    """Plots the open reading frames of the six frames, one row per frame (+1, +2, +3, -1, -2, -3 from top to bottom).
+    ORFs are found with a vectorized codon lookup (see `find_orfs`) and loaded around the window like highlights. 
+    The translation of the six frames is computed by the browser from the sequence, only for the visible window."""
+    if start is None:
+        start = self.bounds[0] if self.bounds is not None else 0
+    data = find_orfs(seq, min_length=min_length, start=start, start_codons=start_codons, genetic_code=genetic_code)
+    data["bottom"] = data.frame.map(_frame_rows).astype(float) + 0.1
+    data["color"] = np.where(data.strand == "+", colors[0], colors[1])
+    if self.ylim is None:
+        self.ylim = (0, 6)
+    self._translated = translation
+
+    def render_method(track, fig, loaded_range):
+        orf_source, entry = _windowed_intervals(data, "left", "right", ["bottom", "color", "frame", "length"], 
+                                                fig, loaded_range, bounds=track._plot_bounds)
+        track.loaded_sources.append(entry)
+        fig.y_range = Range1d(track.ylim[0], track.ylim[1], bounds=track.ylim)
+        fig.yaxis.visible = False
+        renderer = fig.add_glyph(orf_source, Quad(left="left", right="right", bottom="bottom", top=dodge("bottom", 0.8),
+                                                  fill_color="color", line_alpha=0, **kwargs))
+        fig.add_tools(HoverTool(renderers=[renderer], tooltips=[("left - right", "@left - @right"), ("frame", "@frame"), ("length", "@length")]))
+        if translation:
+            # filled by the x_range dispatcher of the GenomePlot when zoomed in
+            letters = ColumnDataSource({"x": [], "y": [], "text": []})
+            fig.add_glyph(letters, Text(x="x", y="y", text="text", text_align="center", text_baseline="middle", text_font_size="10px"))
+            track.loaded_sources.append({"translation": {
+                "source": letters,
+                "code": genetic_code,
+                "rows": [_frame_rows[f] + 0.5 for f in ["+1", "+2", "+3", "-1", "-2", "-3"]],
+                "max_window": fig.frame_width*3/10, # about 10 pixels per amino acid
+            }})
+
+    self.render_methods.append(render_method)
+
+# %% ../nbs/API/01_track.ipynb 33
+_genotype_labels = ["missing", "hom ref", "het", "hom alt"] # genotype codes -1 to 2 returned by iter_vcf
+
+def _sample_axis(fig, samples:List[str]):
+    """Labels the rows of a figure with one row of height 1 per sample, the first sample at the top"""
+    n_rows = len(samples)
+    fig.yaxis.ticker = FixedTicker(ticks=[n_rows - i - 0.5 for i in range(n_rows)])
+    fig.yaxis.major_label_overrides = {n_rows - i - 0.5: sample for i, sample in enumerate(samples)}
+    fig.ygrid.visible = False
+
+@patch
+def variants(self:Track,
+             vcf_path: str, #path to a VCF file (also accepts gzip and bgzip files, a tabix index is used when present)
+             samples: List[str] = None, #samples shown, one row per sample from top to bottom. If None all the samples of the file are shown
+             colors: tuple = ("#d9d9d9", "#9ecae1", "#3182bd", "#08306b"), #colors of missing, homozygous reference, heterozygous and homozygous alternative genotypes
+             width: int = 3, #width of the variant glyphs in pixels
+             hover_data: List[str] = ("id", "ref", "alt", "qual", "filter"), #VCF columns shown when hovering over the variants
+             chunksize: int = 10**5, #number of lines of the VCF read at once
+             **kwargs, #enables to pass keyword arguments used by the Bokeh function
+            ):
+    """Plots the variants of a VCF file, with one row per sample colored by genotype (or a single row of sites when the VCF has no samples).
+    The file is streamed and restricted to the sequence and bounds of the browser while it is read, genotypes are stored as one byte per sample and site,
+    and only the sites around the window are loaded in the plot, so that files with many samples and sites stay responsive."""
+    chunks = list(iter_vcf(vcf_path, seq_id=self.seq_id, bounds=self.bounds, samples=samples, chunksize=chunksize))
+    if len(chunks) == 0:
+        warnings.warn(f"no variants of {vcf_path} in the region displayed")
+        return
+    data = pd.concat(chunks, ignore_index=True)
+    gt_cols = [c for c in data.columns if c.startswith("gt_")]
+    # narrow types halve the size of the sites embedded in the plot
+    data = data.astype({"left": np.int32, "right": np.int32, "qual": np.float32})
+    data["center"] = ((data["left"] + data["right"]) / 2).astype(np.float32)
+    data["id"] = data["id"].replace(".", "")
+    hover_data = [c for c in hover_data if c in data.columns]
+    n_rows = max(len(gt_cols), 1)
+    if self.ylim is None:
+        self.ylim = (0, n_rows)
+
+    self._tooltip_data = self._tooltip_data or len(hover_data) > 0
+
+    def render_method(track, fig, loaded_range):
+        shown = hover_data if track._tooltips else [] # the genotypes are kept when the tooltip columns are dropped
+        source, entry = _windowed_intervals(data, "left", "right", ["center"]+gt_cols+shown, fig, loaded_range, 
+                                            merge=False, bounds=track._plot_bounds)
+        track.loaded_sources.append(entry)
+        fig.y_range = Range1d(track.ylim[0], track.ylim[1], bounds=track.ylim)
+        _sample_axis(fig, [col[3:] for col in gt_cols])
+        mapper = LinearColorMapper(palette=list(colors), low=-1.5, high=2.5)
+        renderers = []
+        for i, col in enumerate(gt_cols or [None]):
+            # one glyph per sample sharing the source, so that genotypes are sent once as int8 columns
+            fill_color = colors[-1] if col is None else {"field": col, "transform": mapper}
+            renderers.append(fig.add_glyph(source, Rect(x="center", y=n_rows - i - 0.5, width=width, width_units="screen", height=0.8,
+                                                        fill_color=fill_color, line_alpha=0, **kwargs)))
+        tooltips = [("left - right", "@left - @right")] + [(attr, f"@{attr}") for attr in shown]
+        # genotype codes are only translated to labels when a tooltip is shown
+        genotype = CustomJSHover(args={"labels": _genotype_labels}, code="return labels[value + 1]")
+        for col, renderer in zip(gt_cols, renderers):
+            fig.add_tools(HoverTool(renderers=[renderer], tooltips=[("sample", col[3:]), ("genotype", f"@{col}{{custom}}")]+tooltips,
+                                    formatters={f"@{col}": genotype}))
+        if len(gt_cols) == 0:
+            fig.add_tools(HoverTool(renderers=renderers, tooltips=tooltips))
+
+    self.render_methods.append(render_method)
+
+# %% ../nbs/API/01_track.ipynb 34
+@patch
+def motifs(self:Track,
+           seq, #sequence of the region displayed (str or Bio.Seq.Seq), e.g. GenomeBrowser.seq
+           motifs: Union[List[str], dict], #motifs (which can contain IUPAC codes), or dictionary of motifs by name
+           start: int = None, #position of the first base of seq on the genome, defaults to the left bound of the browser
+           reverse_complement: bool = True, #if True the occurrences on the - strand are also shown
+           colors: Union[List[str], dict] = None, #colors of the motifs, as a list or a dictionary by motif name. Defaults to the Category10 palette
+           alpha: float = 0.6, #transparency
+           **kwargs, #arguments passed to Track.highlight
+          ):
+    """Highlights all the occurrences of a set of motifs in the sequence. The motifs are found in a single pass over the sequence (see `find_motifs`) 
+    and the occurrences are loaded around the window like highlights, so that hundreds of motifs can be shown on a whole genome."""
+    if start is None:
+        start = self.bounds[0] if self.bounds is not None else 0
+    hits = find_motifs(seq, motifs, start=start, reverse_complement=reverse_complement)
+    names = list(hits.motif.cat.categories)
+    if colors is None:
+        colors = [Category10_10[i % 10] for i in range(len(names))]
+    if not isinstance(colors, dict):
+        colors = dict(zip(names, colors))
+    hits["color"] = hits.motif.map(colors).astype(object)
+    hits["motif"] = hits.motif.astype(str)
+    if self.ylim is None:
+        self.ylim = (0, 1)
+    self.highlight(hits, alpha=alpha, hover_data=["motif", "strand", "match"], **kwargs)
+
+# %% ../nbs/API/01_track.ipynb 35
+def _bounded_image(image:np.ndarray, start:int, bin_size:int, bounds:tuple)->tuple:
+    """Columns of a binned image (column i covers [start + i*bin_size, start + (i+1)*bin_size)) that overlap the bounds.
+    Returns the start of the first column kept, the bin size and the columns"""
+    if bounds is None:
+        return start, bin_size, image
+    n_bins = image.shape[1]
+    ix_start = min(max(int((bounds[0] - start)//bin_size), 0), n_bins - 1)
+    ix_stop = max(min(int(np.ceil((bounds[1] - start)/bin_size)), n_bins), ix_start + 1)
+    return start + ix_start*bin_size, bin_size, np.ascontiguousarray(image[:, ix_start:ix_stop])
+
+def _image_window(levels:List[dict], x_range, loaded_range)->dict:
+    """Data of the source of an image binned at several resolutions (see Track.heatmap and Track.scatter): the bins loaded around the window 
+    of the coarsest level whose min_window fits in the window, like updateImage in the x_range dispatcher of the GenomePlot"""
+    x_size = x_range.end - x_range.start
+    level = levels[sum(x_size >= level["min_window"] for level in levels[1:])]
+    start, size, image = level["start"], level["bin_size"], level["image"]
+    ix_start = min(max(int((loaded_range.data["start"][0] - start)//size), 0), image.shape[1] - 1)
+    ix_stop = max(min(int(np.ceil((loaded_range.data["end"][0] - start)/size)), image.shape[1]), ix_start + 1)
+    return {"image": [np.ascontiguousarray(image[:, ix_start:ix_stop])], "x": [start + ix_start*size], "dw": [(ix_stop - ix_start)*size]}
+
+@patch
+def heatmap(self:Track,
+            data: pd.DataFrame, #pandas DataFrame with one row per position and one column per sample
+            pos: str = "pos", #name of the column containing the positions
+            samples: List[str] = None, #columns plotted, one row per sample from top to bottom. If None all the numeric columns except pos are plotted
+            bin_size: int = None, #size of the bins of the finest level in bp, defaults to the smallest distance between consecutive positions
+            max_bins: int = 2000, #maximum number of bins loaded around the window, coarser bins are loaded when zooming out
+            palette: str = "Viridis256", #name of a Bokeh palette or list of colors
+            low: float = None, #value mapped to the first color of the palette, defaults to the minimum of the data
+            high: float = None, #value mapped to the last color of the palette, defaults to the maximum of the data
+            dtype: str = "uint8", #"uint8" quantizes the values on 255 levels between low and high, "float32" keeps them
+            nan_color: str = "rgba(0, 0, 0, 0)", #color of the bins without values
+            **kwargs, #enables to pass keyword arguments used by the Bokeh function
+           ):
+    """Plots a matrix of values (e.g. the coverage of many samples) as a heatmap with one row per sample, drawn as a single image.
+    The values are averaged in bins at several resolutions (see `matrix_pyramid`) and the x_range dispatcher of the GenomePlot loads 
+    the finest resolution that keeps at most max_bins bins around the window, so that dozens of samples cost about as much as one track."""
+    if dtype not in ("uint8", "float32"):
+        raise ValueError(f"dtype must be uint8 or float32, not {dtype}")
+    if samples is None:
+        samples = [c for c in data.columns if c != pos and pd.api.types.is_numeric_dtype(data[c])]
+    data = data.sort_values(pos)
+    positions = data[pos].values
+    bounds = self.bounds if self.bounds is not None else (int(positions.min()), int(positions.max()) + 1)
+    if bin_size is None:
+        steps = np.diff(np.unique(positions))
+        bin_size = int(steps.min()) if len(steps) > 0 else 1
+    levels = matrix_pyramid(positions, data[samples].values, bounds, bin_size, max_bins=max_bins)
+    low = np.nanmin(levels[0][1]) if low is None else low
+    high = np.nanmax(levels[0][1]) if high is None else high
+    high = high if high > low else low + 1
+    images = []
+    for size, means in levels:
+        image = means.T[::-1] # the first sample is drawn in the top row
+        if dtype == "uint8":
+            # codes 0 to 254 map low to high and 255 marks missing values
+            codes = np.round(np.clip((image - low)/(high - low), 0, 1)*254)
+            image = np.where(np.isnan(image), 255, codes).astype(np.uint8)
+        images.append((size, np.ascontiguousarray(image)))
+    if self.ylim is None:
+        self.ylim = (0, len(samples))
+    self._pyramid_levels = max(self._pyramid_levels, len(images))
+
+    def render_method(track, fig, loaded_range):
+        max_loading_range = loaded_range.data["range"][0]
+        # the finest levels dropped by the payload budget are skipped and the bins are restricted to the bounds of the plot
+        plotted = [_bounded_image(image, bounds[0], size, track._plot_bounds) for size, image in images[min(track._coarsening, len(images)-1):]]
+        # level i replaces level i-1 when the bins of level i-1 loaded around the window would exceed max_bins
+        min_windows = [0] + [max(max_bins*plotted[i-1][1] - 2*max_loading_range, 0) for i in range(1, len(plotted))]
+        image_levels = [{"image": image, "start": start, "bin_size": size, "min_window": w} for (start, size, image), w in zip(plotted, min_windows)]
+        source = ColumnDataSource({**_image_window(image_levels, fig.x_range, loaded_range), "y": [0], "dh": [len(samples)]})
+        track.loaded_sources.append({
+            "loaded_range": loaded_range,
+            "image": {"source": source, "levels": image_levels, "y": 0, "dh": len(samples)},
+        })
+        fig.y_range = Range1d(track.ylim[0], track.ylim[1], bounds=track.ylim)
+        _sample_axis(fig, samples)
+        if dtype == "uint8":
+            mapper = LinearColorMapper(palette=palette, low=0, high=254, high_color=nan_color)
+            value = CustomJSHover(args={"low": low, "high": high}, 
+                                  code="return value == 255 ? 'NaN' : (low + value*(high - low)/254).toPrecision(3)")
+        else:
+            mapper = LinearColorMapper(palette=palette, low=low, high=high, nan_color=nan_color)
+            value = CustomJSHover(code="return Number.isNaN(value) ? 'NaN' : value.toPrecision(3)")
+        renderer = fig.image(image="image", x="x", y="y", dw="dw", dh="dh", source=source, color_mapper=mapper, **kwargs)
+        # the rows are drawn from the bottom, the sample of a row is looked up when the tooltip is shown
+        sample = CustomJSHover(args={"samples": samples[::-1]}, code="return samples[Math.floor(value)]")
+        fig.add_tools(HoverTool(renderers=[renderer], tooltips=[("position", "$x{0,0}"), ("sample", "$y{custom}"), ("value", "@image{custom}")],
+                                formatters={"$y": sample, "@image": value}))
+
+    self.render_methods.append(render_method)
+
+# %% ../nbs/API/01_track.ipynb 36
+def _entry_payload(entry)->int:
+    """Estimated size in bytes of an entry of Track.loaded_sources once serialized: the data of its sources, 
+    and the index, coarser levels and images passed to the x_range dispatcher of the GenomePlot"""
+    if isinstance(entry, ColumnDataSource):
+        return estimate_payload(entry.data)
+    if isinstance(entry, np.ndarray):
+        return estimate_payload({"": entry})
+    if isinstance(entry, dict):
+        return sum(_entry_payload(value) for value in entry.values())
+    if isinstance(entry, list):
+        return sum(_entry_payload(value) for value in entry)
+    return 0
+
+def _is_point_source(entry:dict)->bool:
+    """True for the sources of the points of Track.line, Track.scatter and Track.bar, which can be updated with Track.stream"""
+    return "all_data" in entry and "index" not in entry and "levels" not in entry and "raster" not in entry
+
+@patch
+def _set_live(self:Track, handle, fig):
+    """Keeps the notebook handle and the figure of a plot shown with GenomeBrowser.show(live=True), and the sources updated by Track.stream"""
+    self._live = (handle, fig, [entry for entry in self.loaded_sources if _is_point_source(entry)])
+
+@patch
+def stream(self:Track,
+           new_rows: Union[pd.DataFrame, dict], #rows to add, with the columns of the data plotted with Track.line, Track.scatter or Track.bar
+           rollover: int = None, #if specified, maximum number of rows kept, the rows with the smallest positions are dropped
+          ):
+    """Adds rows to the data of the track. If the plot is shown with `GenomeBrowser.show(live=True)`, the rows are pushed to it without rebuilding the figure: 
+    they are streamed when their positions follow the last position of the track, otherwise the data of the track is replaced. 
+    The points loaded around the current window and ylim (when it was computed from the data) are updated."""
+    if self.data is None:
+        raise ValueError("Track.stream adds rows to the data plotted with Track.line, Track.scatter or Track.bar, plot data before streaming")
+    pos = self.data.columns[0]
+    new_rows = pd.DataFrame(new_rows)
+    missing = [c for c in self.data.columns if c not in new_rows.columns]
+    if len(missing) > 0:
+        raise ValueError(f"Columns {missing} are missing from new_rows")
+    new_rows = new_rows[list(self.data.columns)]
+    if not new_rows[pos].is_monotonic_increasing:
+        new_rows = new_rows.sort_values(pos)
+    if len(new_rows) == 0:
+        return
+    appended = len(self.data) == 0 or new_rows[pos].values[0] >= self.data[pos].values[-1]
+    # the points sent to the plot are streamed only when they are not downsampled, before and after the new rows are added
+    downsampled = self._live is not None and self._max_points is not None and len(self._bounded_data(pos)) > self._max_points
+    n_rows = len(self.data)
+    data = pd.concat([self.data, new_rows], ignore_index=True)
+    if not appended:
+        data = data.sort_values(pos, kind="stable", ignore_index=True)
+    if rollover is not None and len(data) > rollover:
+        data = data.iloc[len(data) - rollover:]
+    self.data = data
+    if self._ylim_from_data:
+        y = self.columns[0]
+        self.ylim = (data[y].values.min(), data[y].values.max())
+
+    if self._live is None:
+        return
+    if self._raster:
+        warnings.warn("The images of rasterized tracks are computed when the plot is shown, show the plot again to plot the new rows")
+    handle, fig, sources = self._live
+    # the plotted points are restricted to the bounds of the plot and downsampled to its payload budget
+    plotted = self._plotted_data(pos)
+    downsampled = downsampled or (self._max_points is not None and len(plotted) < len(self._bounded_data(pos)))
+    streamed = plotted[plotted.index.values >= n_rows] # the rows are numbered in order of arrival by pd.concat
+    for entry in sources:
+        # the x_range dispatcher reloads the points around the window when the data of a source changes
+        source = entry["all_data"]
+        if appended and not downsampled:
+            # the source holds the previous plotted points: the new ones are appended, 
+            # and rollover keeps the points plotted after the oldest rows were dropped
+            if len(streamed) > 0:
+                source.stream(ColumnDataSource.from_df(streamed), rollover=len(plotted))
+            elif len(source.data[pos]) != len(plotted):
+                source.data = ColumnDataSource.from_df(plotted)
+        else:
+            source.data = ColumnDataSource.from_df(plotted)
+    if self._ylim_from_data:
+        fig.y_range.update(start=self.ylim[0], end=self.ylim[1], bounds=self.ylim)
+    from bokeh.io import push_notebook
+    push_notebook(handle=handle)
@@ -3,30 +3,47 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/04_utils.ipynb.
 
 # %% auto 0
-__all__ = ['strand_dict', 'download_file', 'is_gzipped_file', 'default_open_gz', 'extract_attribute', 'extract_all_attributes',
-           'extract_attributes', 'get_attributes', 'attributes_to_columns', 'set_positions', 'EmptyDataFrame',
-           'parse_gff', 'available_feature_types', 'available_attributes', 'parse_fasta', 'regions_overlap',
-           'add_z_order', 'get_cds_unique_name', 'get_cds_name', 'seqRecord_to_df', 'parse_recs', 'parse_genbank',
-           'inspect_feature_types', 'in_wsl', 'add_extension']
+__all__ = ['strand_dict', 'standard_code', 'iupac_codes', 'profile_logger', 'render_cache', 'download_file', 'is_gzipped_file',
+           'default_open_gz', 'extract_attribute', 'extract_all_attributes', 'extract_attributes', 'get_attributes',
+           'AttributeRow', 'AttributeStore', 'get_attribute_values', 'update_attributes', 'gff_attribute_store',
+           'attributes_to_columns', 'set_positions', 'EmptyDataFrame', 'parse_gff', 'available_feature_types',
+           'available_attributes', 'parse_fasta', 'regions_overlap', 'IntervalIndex', 'interval_join', 'add_z_order',
+           'get_cds_unique_name', 'get_cds_name', 'seqRecord_to_df', 'parse_recs', 'parse_genbank',
+           'inspect_feature_types', 'iter_bed', 'interval_coverage', 'feature_density', 'density_pyramid',
+           'sequence_content', 'content_pyramid', 'find_runs', 'matrix_pyramid', 'rasterize_points', 'raster_pyramid',
+           'find_orfs', 'reverse_complement', 'expand_iupac', 'AhoCorasick', 'find_motifs', 'merge_intervals',
+           'index_by_id', 'gene_models', 'with_gene_models', 'RegionQuery', 'iter_bedgraph', 'iter_wig',
+           'read_track_file', 'vcf_samples', 'iter_vcf', 'read_arrow_track', 'StageProfiler', 'estimate_payload',
+           'in_wsl', 'add_extension', 'content_hash', 'RenderCache']
 
 # %% ../nbs/API/04_utils.ipynb 5
 import numpy as np
 import pandas as pd
 import io
+import itertools
+import json
+import hashlib
+import pickle
 
 from collections import defaultdict, OrderedDict
+from collections.abc import Mapping
 import warnings
 import gzip
 import urllib.request
 import os
 import re
+import time
+import threading
+import logging
+from contextlib import contextmanager
 from platform import uname
 
-from Bio import SeqIO
-from Bio.Seq import Seq
+from typing import List, Optional, Dict, Tuple, Iterable, Iterator, Union, Any, Sequence
+from typing import TYPE_CHECKING
 
-from typing import List, Optional, Dict, Tuple
-from IPython.display import display, HTML
+if TYPE_CHECKING: # Biopython is only imported when parsing fasta or genbank files
+    from Bio.Seq import Seq
+    from Bio.SeqRecord import SeqRecord
 
 
 
@@ -112,6 +129,245 @@ def get_attributes(df: pd.DataFrame, #a features DataFrame with at least a "type
     return attr_list
 
 # %% ../nbs/API/04_utils.ipynb 17
+def _code_dtype(n_values: int):
+    """Smallest signed integer type that can store the codes of n_values unique values and -1 for missing values"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_values < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+_last_rank = np.iinfo(np.int64).max # rank of the attributes added after the features were read
+
+class AttributeRow(Mapping):
+    """Read-only mapping of the attributes of one feature stored in an AttributeStore"""
+    __slots__ = ("store", "index")
+    def __init__(self, store: "AttributeStore", index: int):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        code = self.store.codes[key][self.index]
+        if code < 0:
+            raise KeyError(key)
+        return self.store.values[key][code]
+
+    def __iter__(self):
+        # the attributes are returned in their order in the feature, attributes added afterwards come last
+        keys = [key for key, codes in self.store.codes.items() if codes[self.index] >= 0]
+        if len(self.store.ranks) > 0:
+            keys.sort(key=lambda key: self.store.rank(key, self.index))
+        return iter(keys)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def copy(self)->OrderedDict:
+        return OrderedDict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+class AttributeStore:
+    def __init__(self, 
+                 n: int, # number of features
+                ):
+        """Columnar storage of the attributes of n features. For each attribute, `codes[key]` is an array of integer codes 
+        (-1 for features without the attribute) into `values[key]`, the array of unique values of the attribute.
+        `ranks[key]` is the position of the attribute among the attributes of each feature, when it was read from a file."""
+        self.n = n
+        self.codes = {}
+        self.values = {}
+        self.ranks = {}
+
+    def __len__(self):
+        return self.n
+
+    def keys(self)->List[str]:
+        return list(self.codes)
+
+    def set(self, 
+            key: str, # name of the attribute
+            values: np.ndarray, # values of the attribute for all the features, None or NaN for missing values
+           ):
+        values = np.asarray(values, dtype=object)
+        present = ~pd.isna(values)
+        codes, uniques = pd.factorize(values[present])
+        self.codes[key] = np.full(self.n, -1, dtype=_code_dtype(len(uniques)))
+        self.codes[key][present] = codes
+        self.values[key] = np.asarray(uniques, dtype=object)
+        self.ranks.pop(key, None)
+
+    def rank(self, 
+             key: str, # name of the attribute
+             index: int, # index of the feature
+            )->int:
+        """Position of the attribute among the attributes of the feature, attributes without a position rank last"""
+        ranks = self.ranks.get(key)
+        if ranks is None or ranks[index] == np.iinfo(ranks.dtype).max:
+            return _last_rank
+        return int(ranks[index])
+
+    def ranks_of(self, 
+                 key: str, # name of the attribute
+                 rows: np.ndarray, # indices of the features
+                )->np.ndarray:
+        """Vectorized `rank` of the attribute for several features"""
+        ranks = self.ranks.get(key)
+        if ranks is None:
+            return np.full(len(rows), _last_rank, dtype=np.int64)
+        out = ranks[rows].astype(np.int64)
+        out[out == np.iinfo(ranks.dtype).max] = _last_rank
+        return out
+
+    def get(self, 
+            key: str, # name of the attribute
+            default: Any = None, # value returned for the features that do not have the attribute
+           )->np.ndarray:
+        """Returns an array with the value of the attribute for all the features"""
+        out = np.full(self.n, default, dtype=object)
+        if key in self.codes:
+            codes = self.codes[key]
+            present = codes >= 0
+            out[present] = self.values[key][codes[present]]
+        return out
+
+    def update(self,
+               key: str, # name of the attribute
+               rows: np.ndarray, # indices of the features to update
+               values: np.ndarray, # new values, None or NaN values do not modify the attribute
+              ):
+        column = self.get(key)
+        values = np.asarray(values, dtype=object)
+        present = ~pd.isna(values)
+        column[np.asarray(rows)[present]] = values[present]
+        ranks = self.ranks.get(key)
+        had_key = self.codes[key] >= 0 if key in self.codes else None
+        self.set(key, column)
+        if ranks is not None:
+            # the features that did not have the attribute get it last
+            ranks = ranks.copy()
+            ranks[(self.codes[key] >= 0) & ~had_key] = np.iinfo(ranks.dtype).max
+            self.ranks[key] = ranks
+
+    def copy(self)->"AttributeStore":
+        """Returns a copy of the store that shares the arrays of the attributes, which are replaced rather than modified by `set` and `update`"""
+        store = AttributeStore(self.n)
+        store.codes = self.codes.copy()
+        store.values = self.values.copy()
+        store.ranks = self.ranks.copy()
+        return store
+
+    def rows(self)->np.ndarray:
+        """Returns an object array of the AttributeRow of each feature, which can be used as the attributes column of a DataFrame"""
+        # np.fromiter does not try to unpack the rows, which are mappings
+        return np.fromiter((AttributeRow(self, i) for i in range(self.n)), dtype=object, count=self.n)
+
+    @classmethod
+    def from_matches(cls, 
+                     n: int, # number of features
+                     rows: np.ndarray, # index of the feature of each (key, value) pair
+                     keys: np.ndarray, # attribute names
+                     values: np.ndarray, # attribute values
+                    )->"AttributeStore":
+        """Creates a store from (row, key, value) triplets. Attributes are stored in the order in which they first appear, 
+        and the order of the triplets of each row is kept as the order of the attributes of the feature."""
+        store = cls(n)
+        rows = np.asarray(rows, dtype=np.int64)
+        values = np.asarray(values, dtype=object)
+        by_row = np.argsort(rows, kind="stable")
+        positions = np.empty(len(rows), dtype=np.int64)
+        positions[by_row] = np.arange(len(rows)) - np.searchsorted(rows[by_row], rows[by_row])
+        rank_dtype = _code_dtype(int(positions.max()) + 1 if len(rows) > 0 else 0)
+        key_codes, key_uniques = pd.factorize(np.asarray(keys, dtype=object))
+        order = np.argsort(key_codes, kind="stable")
+        splits = np.cumsum(np.bincount(key_codes, minlength=len(key_uniques)))[:-1]
+        for key, ix in zip(key_uniques, np.split(order, splits)):
+            column = np.full(n, None, dtype=object)
+            column[rows[ix]] = values[ix] # if a key is repeated for a feature the last value is kept
+            store.set(key, column)
+            ranks = np.full(n, np.iinfo(rank_dtype).max, dtype=rank_dtype)
+            ranks[rows[ix][::-1]] = positions[ix][::-1] # and its first position
+            store.ranks[key] = ranks
+        return store
+
+    @classmethod
+    def from_records(cls, 
+                     records: Iterable[Iterable[Tuple[str, Any]]], # for each feature an iterable of (key, value) pairs, such as dict.items()
+                    )->"AttributeStore":
+        rows, keys, values = [], [], []
+        n = 0
+        for i, record in enumerate(records):
+            for key, value in record:
+                rows.append(i)
+                keys.append(key)
+                values.append(value)
+            n = i + 1
+        return cls.from_matches(n, rows, keys, values)
+
+# %% ../nbs/API/04_utils.ipynb 18
+def _shared_store(attributes: Sequence)->Optional[Tuple[AttributeStore, np.ndarray]]:
+    """If all the attributes are rows of the same AttributeStore, returns the store and the indices of the rows"""
+    attributes = list(attributes)
+    if len(attributes) == 0 or not isinstance(attributes[0], AttributeRow):
+        return None
+    store = attributes[0].store
+    if not all(type(a) is AttributeRow and a.store is store for a in attributes):
+        return None
+    return store, np.fromiter((a.index for a in attributes), dtype=np.int64, count=len(attributes))
+
+def get_attribute_values(attributes: Sequence[Mapping], # attributes of the features, e.g. the attributes column of a features DataFrame
+                         key: str, # name of the attribute
+                         default: Any = None, # value used for the features that do not have the attribute
+                        )->np.ndarray:
+    """Returns an array with the value of the attribute key for each feature. This is vectorized when the attributes are rows of an AttributeStore."""
+    shared = _shared_store(attributes)
+    if shared is not None:
+        store, ix = shared
+        return store.get(key, default)[ix]
+    out = np.full(len(attributes), default, dtype=object)
+    for i, a in enumerate(attributes):
+        out[i] = a.get(key, default)
+    return out
+
+def update_attributes(attributes: Sequence[Mapping], # attributes of the features, e.g. the attributes column of a features DataFrame
+                      data: pd.DataFrame, # one row per feature and one column per attribute to set, missing values do not modify the attributes
+                     )->list:
+    """Returns the attributes of the features updated with the values of data, without modifying the original attributes"""
+    shared = _shared_store(attributes)
+    if shared is not None:
+        store, ix = shared
+        store = store.copy()
+        for column in data.columns:
+            store.update(column, ix, data[column].values)
+        return np.fromiter((AttributeRow(store, i) for i in ix), dtype=object, count=len(ix))
+    out = list(attributes)
+    for i, record in enumerate(data.to_dict(orient="records")):
+        record = {k: v for k, v in record.items() if not pd.isna(v)}
+        if len(record) > 0:
+            out[i] = OrderedDict(out[i])
+            out[i].update(record)
+    return out
+
+# %% ../nbs/API/04_utils.ipynb 21
+_attribute_pattern = r"(?P<key>\w+[-\w]*)=(?P<value>[^;]+)"
+
+def gff_attribute_store(df: pd.DataFrame, #a features DataFrame with at least a "type" column and an "attributes_str" column
+                        attributes: Optional[Dict[str, List]] = None # a dictionary with feature types as keys and a list of attributes to extract as values 
+                       )->AttributeStore:
+    """Extracts the attributes of all the features at once into an AttributeStore, keeping the attributes listed for each feature type in the attributes dictionary.
+    Feature types that are not in the dictionary, or whose value is None, keep all their attributes."""
+    matches = df["attributes_str"].reset_index(drop=True).str.extractall(_attribute_pattern)
+    rows = matches.index.get_level_values(0).values
+    keys = matches["key"].values
+    keep = np.ones(len(rows), dtype=bool)
+    if attributes is not None:
+        types = df["type"].values[rows]
+        for feature_type, attrs in attributes.items():
+            if attrs is not None:
+                keep &= ~((types == feature_type) & ~np.isin(keys, attrs))
+    return AttributeStore.from_matches(len(df), rows[keep], keys[keep], matches["value"].values[keep])
+
+# %% ../nbs/API/04_utils.ipynb 24
 def attributes_to_columns(features: pd.DataFrame):
     attr_dicts=features.attributes.apply(extract_all_attributes)
     all_keys=list(set().union(*[d.keys() for d in attr_dicts]))
@@ -125,7 +381,7 @@ def attributes_to_columns(features: pd.DataFrame):
     return features
     
 
-# %% ../nbs/API/04_utils.ipynb 18
+# %% ../nbs/API/04_utils.ipynb 25
 def set_positions(annotation: pd.DataFrame, # an annotation DataFrame extracted from a gff file
                             ) ->  pd.DataFrame:
     """Sets left and right as the position of the feature on the sequence, left is always lower than right.
@@ -147,11 +403,11 @@ def set_positions(annotation: pd.DataFrame, # an annotation DataFrame extracted
     
     return annotation
 
-# %% ../nbs/API/04_utils.ipynb 19
+# %% ../nbs/API/04_utils.ipynb 26
 class EmptyDataFrame(Exception):
     pass
 
-# %% ../nbs/API/04_utils.ipynb 20
+# %% ../nbs/API/04_utils.ipynb 27
 def parse_gff(gff_path:str, # path to the gff file
               seq_id: Optional[str] = None, # sequence id (first column of the gff), if not None, then return only the annotations for the seq_id with this name
               first: bool = True, # if True then return only the annotations for the first sequence (or the first with seq_id)
@@ -160,7 +416,7 @@ def parse_gff(gff_path:str, # path to the gff file
               attributes: Optional[Dict[str, List]] = None, # a dictionary with feature types as keys and a list of attributes to extract as values 
              )->List[pd.DataFrame]:
     """ Parses a GFF3 file and returns a list of Pandas DataFrames with the data for a specific contig. 
-    If seq_id is None then only the first contig is parsed.
+    If seq_id is None then only the first contig is parsed, or all the contigs (one DataFrame each) if first is False.
     If feature_types is None then all feature types are extracted."""
 
     if attributes is None:
@@ -176,7 +432,7 @@ def parse_gff(gff_path:str, # path to the gff file
             df=pd.read_csv(file_buffer,sep="\t",header=None)
             df.columns=["seq_id", "source","type","start","end","score","strand","phase","attributes_str"]
             #df=attributes_to_columns(df)
-            df["attributes"] = get_attributes(df, attributes)
+            df["attributes"] = gff_attribute_store(df, attributes).rows()
             df.drop(columns=["attributes_str"], inplace=True)
             df=set_positions(df)
         return df
@@ -190,37 +446,37 @@ def parse_gff(gff_path:str, # path to the gff file
         buffer_empty = True
         last_seq_id = None
         for line in gff_file:
+            if line.startswith("##FASTA"): # the end of the file contains sequences
+                break
             if line[0]=="#":
                 continue
             else:
                 r=line.split('\t')
                 current_line_seqid = r[0]
                 if last_seq_id is not None and current_line_seqid != last_seq_id: #seeing a new segment of the gff
-                    if not buffer_empty:
-                        if seq_id is None or seq_id == last_seq_id:
-                            out.append(_slurp_buffer(file_buffer, buffer_empty))
-                            file_buffer = io.StringIO()
-                            buffer_empty = True
-                            if first is not None or seq_id is not None:
-                                break
+                    if not buffer_empty: # the buffer only contains lines of the requested sequences
+                        out.append(_slurp_buffer(file_buffer, buffer_empty))
+                        file_buffer = io.StringIO()
+                        buffer_empty = True
+                        if first or seq_id is not None:
+                            break
                 last_seq_id = current_line_seqid
-                if seq_id is None: #
+                if seq_id is None and first:
                     seq_id = current_line_seqid
-                if r[0]==seq_id:
+                if seq_id is None or r[0]==seq_id:
                     if feature_types==None or r[2] in feature_types:
                         if bounds==None or (int(r[3])<bounds[1] and int(r[4])>bounds[0]):
                             # Write each line to the file buffer
                             file_buffer.write(line)
                             buffer_empty=False
         if not buffer_empty:
-            if seq_id is None or seq_id == last_seq_id:
-                out.append(_slurp_buffer(file_buffer, buffer_empty))
+            out.append(_slurp_buffer(file_buffer, buffer_empty))
     
     if len(out) == 0:
         raise EmptyDataFrame("The annotation DataFrame is empty. Check that the feature_types and seq_id are correct, and that bounds (if specified) fall within the size of your genome.")
     return out
 
-# %% ../nbs/API/04_utils.ipynb 29
+# %% ../nbs/API/04_utils.ipynb 37
 def available_feature_types(gff_path):
     ftypes=set()
     with default_open_gz(gff_path) as handle:
@@ -231,14 +487,15 @@ def available_feature_types(gff_path):
                     ftypes.add(r[2])
     return ftypes
 
-# %% ../nbs/API/04_utils.ipynb 31
+# %% ../nbs/API/04_utils.ipynb 39
 def available_attributes(gff_path):
     features=parse_gff(gff_path)[0]
     return features.columns
 
-# %% ../nbs/API/04_utils.ipynb 33
+# %% ../nbs/API/04_utils.ipynb 41
 def parse_fasta(genome_path, seq_id):
     """Retrieves the Biopython SeqRecord object that matches the seq_id in a fasta file"""
+    from Bio import SeqIO
 
     rec_found=False
     with open(genome_path,'r') as f:
@@ -253,7 +510,7 @@ def parse_fasta(genome_path, seq_id):
     
     return rec.seq
 
-# %% ../nbs/API/04_utils.ipynb 35
+# %% ../nbs/API/04_utils.ipynb 43
 def regions_overlap(region1, region2, min_overlap_fraction=0.0):
     """
         regions are tuples of start and stop coordinates
@@ -306,10 +563,111 @@ def regions_overlap(region1, region2, min_overlap_fraction=0.0):
     return False
     
 
-# %% ../nbs/API/04_utils.ipynb 37
+# %% ../nbs/API/04_utils.ipynb 45
+class IntervalIndex:
+    def __init__(self, 
+                 left: np.ndarray, # left positions of the intervals
+                 right: np.ndarray, # right positions of the intervals
+                ):
+        """Index of intervals sorted by left position with the running maximum of their right positions.
+        The intervals overlapping a region are found with two binary searches."""
+        left, right = np.asarray(left), np.asarray(right)
+        self.order = np.argsort(left, kind="stable")
+        self.left = left[self.order]
+        self.right = right[self.order]
+        self.right_max = np.maximum.accumulate(self.right) if len(self.right) > 0 else self.right
+
+    def __len__(self):
+        return len(self.order)
+
+    def query(self, 
+              start, # start of the region
+              end, # end of the region
+             )->np.ndarray:
+        """Returns the positions of the intervals such that left < end and right > start, sorted by left position"""
+        begin = np.searchsorted(self.right_max, start, side="right")
+        stop = np.searchsorted(self.left, end, side="left")
+        candidates = np.arange(begin, max(begin, stop))
+        return self.order[candidates[self.right[candidates] > start]]
+
+    def take(self, 
+             positions: np.ndarray, # positions of the intervals to keep
+            )->"IntervalIndex":
+        """Returns the index of the intervals at positions, numbered in the order of positions, without sorting them again"""
+        rank = np.full(len(self), -1)
+        rank[positions] = np.arange(len(positions))
+        kept = rank[self.order] >= 0
+        index = IntervalIndex.__new__(IntervalIndex)
+        index.order = rank[self.order][kept]
+        index.left = self.left[kept]
+        index.right = self.right[kept]
+        index.right_max = np.maximum.accumulate(index.right) if len(index.right) > 0 else index.right
+        return index
+
+    def query_many(self, 
+                   starts: np.ndarray, # starts of the regions
+                   ends: np.ndarray, # ends of the regions
+                  )->Tuple[np.ndarray, np.ndarray]:
+        """Queries several regions at once. Returns the positions of the regions and of the intervals of each overlapping pair, 
+        such that left < end and right > start."""
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        begins = np.searchsorted(self.right_max, starts, side="right")
+        counts = np.maximum(np.searchsorted(self.left, ends, side="left") - begins, 0)
+        query_ix = np.repeat(np.arange(len(starts)), counts)
+        candidates = np.repeat(begins, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        keep = self.right[candidates] > starts[query_ix]
+        return query_ix[keep], self.order[candidates[keep]]
+
+# %% ../nbs/API/04_utils.ipynb 47
+def interval_join(left: pd.DataFrame, # first table of intervals
+                  right: pd.DataFrame, # second table of intervals
+                  left_cols: Tuple[str, str] = ("left", "right"), # names of the columns containing the start and end positions of the intervals of left
+                  right_cols: Tuple[str, str] = ("left", "right"), # names of the columns containing the start and end positions of the intervals of right
+                  min_overlap_fraction: float = 0.0, # minimum fraction of each interval of right that must be covered by the interval of left
+                  strand: Optional[str] = None, # "same" or "opposite" to only join intervals on the same or on opposite strands, None to ignore the strands
+                  strand_col: str = "strand", # name of the column containing the strands in both tables
+                  by: Optional[str] = None, # name of a column that must be equal in both tables, e.g. "seq_id"
+                 )->pd.DataFrame:
+    """Finds all the pairs of overlapping intervals of left and right. Intervals are closed, as in GFF files: [1, 10] and [10, 20] overlap by 1 bp.
+    Returns a DataFrame with the columns left_ix and right_ix (row positions in left and right) and overlap (size of the overlap in bp), sorted by left_ix.
+    right is indexed with an `IntervalIndex`, so that the join takes O((n+m) log m + k) for k candidate pairs."""
+    pairs = []
+    if by is None:
+        groups = [(np.arange(len(left)), np.arange(len(right)))]
+    else:
+        left_groups = pd.Series(np.arange(len(left))).groupby(left[by].values).indices
+        right_groups = pd.Series(np.arange(len(right))).groupby(right[by].values).indices
+        groups = [(ix, right_groups[key]) for key, ix in left_groups.items() if key in right_groups]
+    for left_rows, right_rows in groups:
+        starts = left[left_cols[0]].values[left_rows]
+        ends = left[left_cols[1]].values[left_rows]
+        index = IntervalIndex(right[right_cols[0]].values[right_rows], right[right_cols[1]].values[right_rows])
+        query_ix, found = index.query_many(starts - 1, ends + 1) # closed intervals
+        pairs.append((left_rows[query_ix], right_rows[found]))
+    left_ix = np.concatenate([p[0] for p in pairs]).astype(np.int64) if len(pairs) > 0 else np.zeros(0, dtype=np.int64)
+    right_ix = np.concatenate([p[1] for p in pairs]).astype(np.int64) if len(pairs) > 0 else np.zeros(0, dtype=np.int64)
+
+    right_starts = right[right_cols[0]].values[right_ix]
+    right_ends = right[right_cols[1]].values[right_ix]
+    overlap = (np.minimum(left[left_cols[1]].values[left_ix], right_ends) 
+               - np.maximum(left[left_cols[0]].values[left_ix], right_starts) + 1)
+    keep = overlap >= min_overlap_fraction*(right_ends - right_starts + 1)
+    if strand is not None:
+        left_strands = left[strand_col].values[left_ix]
+        right_strands = right[strand_col].values[right_ix]
+        if strand == "same":
+            keep &= left_strands == right_strands
+        elif strand == "opposite":
+            keep &= ((left_strands == "+") & (right_strands == "-")) | ((left_strands == "-") & (right_strands == "+"))
+        else:
+            raise ValueError(f"strand must be None, 'same' or 'opposite', not {strand}")
+    joined = pd.DataFrame({"left_ix": left_ix[keep], "right_ix": right_ix[keep], "overlap": overlap[keep]})
+    return joined.sort_values(["left_ix", "right_ix"], kind="stable", ignore_index=True)
+
+# %% ../nbs/API/04_utils.ipynb 50
 from collections import defaultdict
 
-# %% ../nbs/API/04_utils.ipynb 38
+# %% ../nbs/API/04_utils.ipynb 51
 def add_z_order(features, 
                 prescedence = ["source", "CDS", "repeat_region", "ncRNA", "rRNA", "tRNA","exon"]):
     """
@@ -322,32 +680,34 @@ def add_z_order(features,
     type_order.update({t: i for i, t in enumerate(prescedence)})
     features.sort_values(by="start", inplace=True)
     features.sort_values(by="type", inplace=True, key=lambda x: x.map(type_order))
-    z_order = []
-    added = []
+    # features only need to be compared with the features placed before them that overlap them
+    query_ix, found = IntervalIndex(features["left"].values, features["right"].values).query_many(
+        features["left"].values - 1, features["right"].values + 1)
+    before = found < query_ix
+    query_ix, found = query_ix[before], found[before]
+    order = np.argsort(query_ix, kind="stable")
+    neighbors = np.split(found[order], np.searchsorted(query_ix[order], np.arange(1, len(features))))
+    type_orders = features["type"].map(type_order).values
+    z_order = np.zeros(len(features), dtype=np.int64)
     all_z = {0}
-    for index, row in features.iterrows():
-        left, right = row["left"], row["right"]
-        z = 0
+    for i in range(len(features)):
         z_found = set()
-        for (l_a, r_a, z_a, z_o) in added:
-            if regions_overlap((left, right), (l_a, r_a)):
-                if type_order[row["type"]] > z_o:
-                    for i in range(z_a+1):
-                        z_found.add(i)
-                else:
-                    z_found.add(z_a)
+        for j in neighbors[i]:
+            if type_orders[i] > type_orders[j]:
+                z_found.update(range(z_order[j]+1))
+            else:
+                z_found.add(z_order[j])
         if len(z_found) == len(all_z):
             z = max(all_z) + 1
             all_z.add(z)
         else:
             z = min(all_z - z_found)
-        z_order.append(z)
-        added.append((left, right, z, type_order[row["type"]]))
+        z_order[i] = z
     features["z_order"] = z_order
 
     features.sort_values(by="start", inplace=True)
 
-# %% ../nbs/API/04_utils.ipynb 40
+# %% ../nbs/API/04_utils.ipynb 53
 #### Code from Domainator
 def get_cds_unique_name(feature):
     """
@@ -369,26 +729,29 @@ def get_cds_name(feature): #(contig_id, feature):
         return get_cds_unique_name(feature)
 #### End code from Domainator
 
-# %% ../nbs/API/04_utils.ipynb 41
-from Bio import SeqRecord
-
-# %% ../nbs/API/04_utils.ipynb 42
+# %% ../nbs/API/04_utils.ipynb 54
 strand_dict = {1: "+", -1: "-"}
 
-def seqRecord_to_df(rec: SeqRecord,
+def seqRecord_to_df(rec: "SeqRecord",
                     feature_types: Optional[List[str]] = None, # if None then get all features, otherwise only those with type in FeatureTypes.
-                    attributes: Optional[Dict[str,List]] = None 
+                    attributes: Optional[Dict[str,List]] = None, 
                     # if None, then get all attributes of all feature types. If dict, then only get attributes of feature types keys. If value is None, get all
+                    bounds: Optional[tuple] = None, # (left limit, right limit), features outside of the bounds are skipped before their attributes are read
                     )->pd.DataFrame:
                     
     feature_lists = []
+    attribute_records = []
     for feature in rec.features:
         if feature_types is None or feature.type in feature_types:
+            if bounds is not None and (feature.location.end <= bounds[0] or feature.location.start+1 >= bounds[1]):
+                continue
             if attributes is None:
                 attrs = None
             else:
                 attrs=attributes.get(feature.type, None)
             for part in feature.location.parts:
+                if bounds is not None and (part.end <= bounds[0] or part.start+1 >= bounds[1]):
+                    continue
                 attributes_list = []#[("ID", get_cds_name(feature)),]
                 for key, value in feature.qualifiers.items():
                     if key == "translation":
@@ -401,30 +764,30 @@ def seqRecord_to_df(rec: SeqRecord,
                         else:
                             attributes_list.append((key, "; ".join(value)))
 
-                attributes_dict = OrderedDict( attributes_list )
-                feature_lists.append([rec.id, 'Genbank', feature.type, part.start+1, part.end, '.', strand_dict.get(part.strand, "."), ".", attributes_dict])
+                attribute_records.append(attributes_list)
+                feature_lists.append([rec.id, 'Genbank', feature.type, part.start+1, part.end, '.', strand_dict.get(part.strand, "."), "."])
         
-    df=pd.DataFrame(feature_lists, columns=["seq_id", "source", "type", "start", "end", "score", "strand", "phase", "attributes"])
+    df=pd.DataFrame(feature_lists, columns=["seq_id", "source", "type", "start", "end", "score", "strand", "phase"])
+    df=df.astype({"start": np.int64, "end": np.int64}) # keeps integer positions when no feature is within bounds
+    df["attributes"] = AttributeStore.from_records(attribute_records).rows()
     return df
 
-# %% ../nbs/API/04_utils.ipynb 45
+# %% ../nbs/API/04_utils.ipynb 57
 def parse_recs(recs, # iterator over Bio.SeqRecord.SeqRecord
                    seq_id: Optional[str] = None, # sequence id (first column of the gff), if not None, then return only the annotations for the seq_id with this name
                    first = True, # if True then return only the annotations for the first sequence (or the first with seq_id)
                    bounds: Optional[tuple] = None, # (left limit, right limit)
                    feature_types: Optional[list] = None, # list of feature types to extract
                    attributes: Optional[Dict[str, List]] = None, # a dictionary with feature types as keys and a list of attributes to extract as values 
-               )->Tuple[List[Seq], List[pd.DataFrame]]:
+               )->Tuple[List["Seq"], List[pd.DataFrame]]:
 
     # read genbank file(s)
     feature_dfs = [] # list of dataframes, one for each seq record used if seq_id == "all"
     seqs = [] # list of Seqs
     for rec in recs:
         if seq_id == rec.id or seq_id is None:
-            df = seqRecord_to_df(rec, feature_types=feature_types, attributes=attributes)
-            if bounds is not None:
-                df = df.loc[(df.end>bounds[0]) & (df.start<bounds[1])]
-            
+            df = seqRecord_to_df(rec, feature_types=feature_types, attributes=attributes, bounds=bounds)
+
             df = set_positions(df)
             feature_dfs.append(df)
             seqs.append(rec.seq)
@@ -435,25 +798,26 @@ def parse_recs(recs, # iterator over Bio.SeqRecord.SeqRecord
         raise EmptyDataFrame("The annotation DataFrame is empty. Check that the feature_types and seq_id are correct, and that bounds (if specified) fall within the size of your genome.")
     return seqs, feature_dfs
 
-# %% ../nbs/API/04_utils.ipynb 46
+# %% ../nbs/API/04_utils.ipynb 58
 def parse_genbank(gb_path, # path to the genbank file
                   seq_id: Optional[str] = None, # sequence id (first column of the gff), if not None, then return only the annotations for the seq_id with this name
                   first = True, # if True then return only the annotations for the first sequence (or the first with seq_id)
                   bounds: Optional[tuple] = None, # (left limit, right limit)
                   feature_types: Optional[list] = None, # list of feature types to extract
                   attributes: Optional[Dict[str, List]] = None, # a dictionary with feature types as keys and a list of attributes to extract as values 
-                  )->Tuple[List[Seq], List[pd.DataFrame]]:
-
+                  )->Tuple[List["Seq"], List[pd.DataFrame]]:
+    from Bio import SeqIO
     with open(gb_path,"r") as f:
         recs = parse_recs(SeqIO.parse(f, "genbank"), seq_id, first, bounds, feature_types, attributes)
     return recs
 
 
-# %% ../nbs/API/04_utils.ipynb 49
+# %% ../nbs/API/04_utils.ipynb 61
 def inspect_feature_types(file_path: str, 
                           frmt: str #gff or genbank
                           ):
     """Outputs a table that recapitulates the feature types and attributes available in the file."""
+    from IPython.display import display, HTML
     
     if frmt == "genbank":
         _, dfs=parse_genbank(file_path)
@@ -474,36 +838,1168 @@ def inspect_feature_types(file_path: str,
     df_output = pd.DataFrame(table_data, columns=["feature_type", "attributes"])
     display(HTML(df_output.to_html(index=False)))
 
-# %% ../nbs/API/04_utils.ipynb 54
+# %% ../nbs/API/04_utils.ipynb 64
+import importlib.util
+
+def _is_installed(module: str)->bool:
+    """True if the optional module (pysam or pyBigWig) is installed, checked without importing it: it is imported by the functions that use it"""
+    return importlib.util.find_spec(module) is not None
+
+# %% ../nbs/API/04_utils.ipynb 65
+def _count_header_lines(file_path):
+    """Counts the "track", "browser" and comment lines at the top of a BED-like file"""
+    n=0
+    with default_open_gz(file_path) as handle:
+        for line in handle:
+            if line.startswith(("track", "browser", "#")) or not line.strip():
+                n+=1
+            else:
+                break
+    return n
+
+def _tabix_index(file_path):
+    """Returns the path to the tabix index of a file if there is one and pysam is installed"""
+    if not _is_installed("pysam"):
+        return None
+    for ext in [".tbi", ".csi"]:
+        if os.path.exists(file_path+ext):
+            return file_path+ext
+    return None
+
+def _iter_tabular(file_path: str, # path to a tab separated file with the seq_id, left and right positions in the first three columns
+                  names: List[str], # names of the first columns of the file to read
+                  dtype: dict, # types of the columns
+                  seq_id: Optional[str] = None, # if not None, only the lines on the sequence with this id are returned
+                  bounds: Optional[tuple] = None, # (left limit, right limit), only the lines that overlap the bounds are returned
+                  chunksize: int = 10**6, # number of lines read at once
+                 )->Iterator[pd.DataFrame]:
+    """Streams the first columns of a BED-like file in chunks. If the file has a tabix index, only the lines of the region are read."""
+    read_args = dict(sep="\t", header=None, usecols=list(range(len(names))), names=names, dtype=dtype, comment="#")
+    index = _tabix_index(file_path)
+    if index is not None and seq_id is not None:
+        def _chunks():
+            import pysam
+            with pysam.TabixFile(file_path, index=index) as tbx:
+                if seq_id not in tbx.contigs:
+                    return
+                lines = tbx.fetch(seq_id, int(bounds[0]), int(bounds[1])) if bounds is not None else tbx.fetch(seq_id)
+                while True:
+                    block = list(itertools.islice(lines, chunksize))
+                    if len(block)==0:
+                        return
+                    yield pd.read_csv(io.StringIO("\n".join(block)), **read_args)
+        reader = _chunks()
+    else:
+        reader = pd.read_csv(file_path, 
+                             skiprows=_count_header_lines(file_path),
+                             compression="gzip" if is_gzipped_file(file_path) else None,
+                             chunksize=chunksize, 
+                             **read_args)
+    for chunk in reader:
+        flt = np.ones(len(chunk), dtype=bool)
+        if seq_id is not None:
+            flt &= (chunk["seq_id"] == seq_id).values
+        if bounds is not None:
+            flt &= (chunk["right"] > bounds[0]).values & (chunk["left"] < bounds[1]).values
+        if flt.any():
+            yield chunk.loc[flt]
+
+def iter_bed(bed_path: str, # path to a BED file (also accepts gzip files)
+             seq_id: Optional[str] = None, # if not None, only the intervals on the sequence with this id are returned
+             bounds: Optional[tuple] = None, # (left limit, right limit), only the intervals that overlap the bounds are returned
+             chunksize: int = 10**6, # number of lines read at once
+            )->Iterator[pd.DataFrame]:
+    """Streams a BED file and yields DataFrames with the columns seq_id, left and right for each chunk of the file.
+    Intervals are kept as in the BED file: 0-based and half-open."""
+    return _iter_tabular(bed_path, ["seq_id","left","right"], {"seq_id":str, "left":np.int64, "right":np.int64}, seq_id, bounds, chunksize)
+
+# %% ../nbs/API/04_utils.ipynb 69
+def _reduce_events(pos: np.ndarray, # positions at which the coverage changes
+                   delta: np.ndarray, # change of coverage at each position
+                  )->Tuple[np.ndarray, np.ndarray]:
+    """Sums the changes of coverage happening at the same position and returns them sorted by position"""
+    pos, inverse = np.unique(pos, return_inverse=True)
+    delta = np.bincount(inverse, weights=delta, minlength=len(pos)).astype(np.int64)
+    return pos, delta
+
+def interval_coverage(intervals: Union[pd.DataFrame, Iterable[pd.DataFrame]], # DataFrame of intervals or iterable over chunks of intervals (e.g. from `iter_bed`)
+                      left_col: str = "left", # name of the column containing the start positions of the intervals
+                      right_col: str = "right", # name of the column containing the end positions of the intervals
+                      bounds: Optional[tuple] = None, # (left limit, right limit), the intervals are clipped to the bounds
+                      bin_size: Optional[int] = None, # if not None, the mean coverage is computed over bins of bin_size bp
+                     )->pd.DataFrame:
+    """Computes the coverage of half-open intervals [left, right) with a sparse difference array. 
+    Returns a DataFrame with the columns pos and coverage that only contains the positions at which the coverage changes,
+    the coverage being constant until the next position."""
+    if isinstance(intervals, pd.DataFrame):
+        intervals = [intervals]
+
+    pos, delta = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pending = []
+    for chunk in intervals:
+        lefts = chunk[left_col].values.astype(np.int64)
+        rights = chunk[right_col].values.astype(np.int64)
+        if bounds is not None:
+            lefts, rights = np.clip(lefts, *bounds), np.clip(rights, *bounds)
+        keep = rights > lefts
+        lefts, rights = lefts[keep], rights[keep]
+        pending.append(_reduce_events(np.concatenate([lefts, rights]), 
+                                      np.repeat(np.array([1, -1], dtype=np.int64), len(lefts))))
+        if sum(len(p) for p, _ in pending) > len(pos): # merging when the pending events outgrow the merged ones keeps memory proportional to the number of distinct positions
+            pos, delta = _reduce_events(np.concatenate([pos]+[p for p, _ in pending]), np.concatenate([delta]+[d for _, d in pending]))
+            pending = []
+    if len(pending) > 0:
+        pos, delta = _reduce_events(np.concatenate([pos]+[p for p, _ in pending]), np.concatenate([delta]+[d for _, d in pending]))
+
+    keep = delta != 0
+    pos, coverage = pos[keep], np.cumsum(delta[keep])
+
+    start, end = bounds if bounds is not None else (pos[0] if len(pos) else 0, pos[-1] if len(pos) else 0)
+    if bin_size is not None:
+        # integral of the coverage at each change point, which is linear in between
+        integral = np.concatenate([[0], np.cumsum(coverage[:-1] * np.diff(pos))]) if len(pos) else np.zeros(0)
+        edges = np.append(np.arange(start, end, bin_size), end)
+        cumulated = np.interp(edges, pos, integral) if len(pos) else np.zeros(len(edges))
+        pos, coverage = edges[:-1], np.diff(cumulated) / np.diff(edges)
+        keep = np.concatenate([[True], coverage[1:] != coverage[:-1]])
+        pos, coverage = pos[keep], coverage[keep]
+    elif len(pos)==0 or pos[0] > start:
+        pos, coverage = np.concatenate([[start], pos]), np.concatenate([[0], coverage])
+
+    return pd.DataFrame({"pos": pos, "coverage": coverage})
+
+# %% ../nbs/API/04_utils.ipynb 73
+def feature_density(features: pd.DataFrame, # DataFrame of features with the columns type, left and right (GFF coordinates: 1-based, inclusive)
+                    bounds: tuple, # (left limit, right limit) of the region summarized
+                    bin_size: int, # size of the bins in bp
+                    feature_types: Optional[List[str]] = None, # feature types to summarize, if None all the types present in features are used
+                   )->pd.DataFrame:
+    """Returns a DataFrame with one row per bin and the columns left, right and, for each feature type, 
+    n_{type}: the number of features overlapping the bin and cov_{type}: the mean coverage of the bin by features of this type"""
+    edges = np.append(np.arange(bounds[0], bounds[1], bin_size), bounds[1]).astype(np.int64)
+    density = {"left": edges[:-1], "right": edges[1:]}
+    if feature_types is None:
+        feature_types = list(pd.unique(features["type"]))
+    for feature_type in feature_types:
+        flt = (features["type"] == feature_type).values
+        lefts = np.sort(features["left"].values[flt].astype(np.int64) - 1) # half-open [left-1, right)
+        rights = np.sort(features["right"].values[flt].astype(np.int64))
+        density[f"n_{feature_type}"] = np.searchsorted(lefts, edges[1:]) - np.searchsorted(rights, edges[:-1], side="right")
+        # integral of the coverage up to each edge: sum over the features of the covered bp before the edge
+        started = np.searchsorted(lefts, edges)
+        ended = np.searchsorted(rights, edges)
+        integral = (started*edges - np.concatenate([[0], np.cumsum(lefts)])[started] 
+                    - ended*edges + np.concatenate([[0], np.cumsum(rights)])[ended])
+        density[f"cov_{feature_type}"] = np.diff(integral) / np.diff(edges)
+    return pd.DataFrame(density)
+
+def density_pyramid(features: pd.DataFrame, # DataFrame of features with the columns type, left and right
+                    bounds: tuple, # (left limit, right limit) of the region summarized
+                    min_bin_size: int, # size of the bins of the finest level
+                    max_bins: int = 1000, # the coarsest level has at most max_bins bins
+                    factor: int = 4, # ratio between the bin sizes of consecutive levels
+                    feature_types: Optional[List[str]] = None, # feature types to summarize, if None all the types present in features are used
+                   )->List[Tuple[int, pd.DataFrame]]:
+    """Computes `feature_density` at several resolutions, from bins of min_bin_size bp to bins covering the bounds with at most max_bins bins.
+    Returns a list of (bin_size, density) from the finest to the coarsest level."""
+    if feature_types is None:
+        feature_types = list(pd.unique(features["type"]))
+    bin_size = max(int(min_bin_size), 1)
+    levels = [(bin_size, feature_density(features, bounds, bin_size, feature_types))]
+    while (bounds[1]-bounds[0])/bin_size > max_bins:
+        bin_size *= factor
+        levels.append((bin_size, feature_density(features, bounds, bin_size, feature_types)))
+    return levels
+
+# %% ../nbs/API/04_utils.ipynb 77
+def _base_counts(seq, # sequence (str or Bio.Seq.Seq)
+                 edges: np.ndarray, # limits of the bins, relative to the start of seq
+                )->np.ndarray:
+    """Returns an array with one row per bin and the number of G, C, A or T, and other letters in each bin"""
+    codes = np.frombuffer(str(seq).encode("ascii", errors="replace"), dtype=np.uint8) & 0xDF # upper case
+    counts = np.zeros((len(edges)-1, 4), dtype=np.int64)
+    if len(codes) == 0:
+        return counts
+    for col, letters in enumerate([b"G", b"C", b"AT"]):
+        counts[:, col] = np.add.reduceat(np.isin(codes, np.frombuffer(letters, dtype=np.uint8)), edges[:-1], dtype=np.int64)
+    counts[:, 3] = np.diff(edges) - counts[:, :3].sum(axis=1)
+    return counts
+
+def _content_from_counts(edges: np.ndarray, counts: np.ndarray, start: int)->pd.DataFrame:
+    g, c, at, other = counts.T
+    gc, acgt = g + c, g + c + at
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pd.DataFrame({"left": edges[:-1] + start,
+                             "right": edges[1:] + start,
+                             "pos": (edges[:-1] + edges[1:])/2 + start,
+                             "gc": np.where(acgt > 0, gc/acgt, np.nan),
+                             "gc_skew": np.where(gc > 0, (g - c)/gc, 0.),
+                             "cumulative_skew": np.cumsum(g - c),
+                             "n": other/np.diff(edges)})
+
+def sequence_content(seq, # sequence (str or Bio.Seq.Seq)
+                     bin_size: int, # size of the bins in bp
+                     start: int = 0, # position of the first base of seq on the genome
+                    )->pd.DataFrame:
+    """Returns a DataFrame with one row per bin and the columns left, right, pos (middle of the bin), 
+    gc: fraction of G and C among the A, C, G and T of the bin, gc_skew: (G-C)/(G+C), 
+    cumulative_skew: sum of G-C from the start of seq to the end of the bin and n: fraction of other letters (e.g. N)"""
+    edges = np.append(np.arange(0, len(seq), bin_size), len(seq)).astype(np.int64)
+    return _content_from_counts(edges, _base_counts(seq, edges), start)
+
+def content_pyramid(seq, # sequence (str or Bio.Seq.Seq)
+                    min_bin_size: int, # size of the bins of the finest level
+                    max_bins: int = 1000, # the coarsest level has at most max_bins bins
+                    factor: int = 4, # ratio between the bin sizes of consecutive levels
+                    start: int = 0, # position of the first base of seq on the genome
+                   )->List[Tuple[int, pd.DataFrame]]:
+    """Computes `sequence_content` at several resolutions, from bins of min_bin_size bp to bins covering the sequence with at most max_bins bins.
+    Returns a list of (bin_size, content) from the finest to the coarsest level."""
+    bin_size = max(int(min_bin_size), 1)
+    edges = np.append(np.arange(0, len(seq), bin_size), len(seq)).astype(np.int64)
+    counts = _base_counts(seq, edges)
+    levels = [(bin_size, _content_from_counts(edges, counts, start))]
+    while len(seq)/bin_size > max_bins:
+        bin_size *= factor
+        # each bin of the next level sums factor bins of the current level
+        ix = np.arange(0, len(counts), factor)
+        counts = np.add.reduceat(counts, ix, axis=0)
+        edges = np.append(edges[ix], len(seq))
+        levels.append((bin_size, _content_from_counts(edges, counts, start)))
+    return levels
+
+# %% ../nbs/API/04_utils.ipynb 80
+def find_runs(seq, # sequence (str or Bio.Seq.Seq)
+              letters: str = "N", # letters of the runs
+              min_length: int = 1, # minimum length of the runs
+              start: int = 0, # position of the first base of seq on the genome
+             )->pd.DataFrame:
+    """Returns the runs of consecutive letters of seq (case insensitive) as a DataFrame of half-open intervals [left, right)"""
+    codes = np.frombuffer(str(seq).encode("ascii", errors="replace"), dtype=np.uint8) & 0xDF
+    in_run = np.isin(codes, np.frombuffer(letters.upper().encode(), dtype=np.uint8)).astype(np.int8)
+    changes = np.diff(np.concatenate([[0], in_run, [0]]))
+    lefts, rights = np.flatnonzero(changes == 1), np.flatnonzero(changes == -1)
+    keep = rights - lefts >= min_length
+    return pd.DataFrame({"left": lefts[keep] + start, "right": rights[keep] + start})
+
+# %% ../nbs/API/04_utils.ipynb 83
+def _bin_means(sums: np.ndarray, counts: np.ndarray)->np.ndarray:
+    means = np.full(sums.shape, np.nan, dtype=np.float32)
+    np.divide(sums, counts, out=means, where=counts > 0, casting="unsafe")
+    return means
+
+def matrix_pyramid(positions, # positions of the rows of values
+                   values, # matrix of values with one row per position and one column per sample, NaN for missing values
+                   bounds: tuple, # (start, end) of the region binned
+                   min_bin_size: int, # size of the bins of the finest level
+                   max_bins: int = 1000, # the coarsest level has at most max_bins bins
+                   factor: int = 4, # ratio between the bin sizes of consecutive levels
+                  )->List[Tuple[int, np.ndarray]]:
+    """Mean of each column of values in bins of the region at several resolutions, from bins of min_bin_size bp to bins covering the region with at most max_bins bins.
+    Returns a list of (bin_size, means) from the finest to the coarsest level, where means is a float32 array with one row per bin and one column per sample 
+    (NaN for bins without values). Bin i of a level covers [start + i*bin_size, start + (i+1)*bin_size)."""
+    positions = np.asarray(positions)
+    values = np.asarray(values, dtype=np.float64).reshape(len(positions), -1)
+    start, end = bounds
+    bin_size = max(int(min_bin_size), 1)
+    n_bins = max(int(np.ceil((end - start)/bin_size)), 1)
+    keep = (positions >= start) & (positions < end)
+    bins = ((positions[keep] - start)//bin_size).astype(np.int64)
+    present = ~np.isnan(values[keep])
+    sums = np.stack([np.bincount(bins, weights=np.where(present[:, j], values[keep, j], 0), minlength=n_bins) 
+                     for j in range(values.shape[1])], axis=1)
+    counts = np.stack([np.bincount(bins, weights=present[:, j], minlength=n_bins) for j in range(values.shape[1])], axis=1)
+    levels = [(bin_size, _bin_means(sums, counts))]
+    while (end - start)/bin_size > max_bins:
+        bin_size *= factor
+        # each bin of the next level sums factor bins of the current level
+        n_bins = int(np.ceil(len(sums)/factor))
+        padding = ((0, n_bins*factor - len(sums)), (0, 0))
+        sums = np.pad(sums, padding).reshape(n_bins, factor, -1).sum(axis=1)
+        counts = np.pad(counts, padding).reshape(n_bins, factor, -1).sum(axis=1)
+        levels.append((bin_size, _bin_means(sums, counts)))
+    return levels
+
+# %% ../nbs/API/04_utils.ipynb 85
+def rasterize_points(x, # x coordinates of the points
+                     y, # y coordinates of the points
+                     x_range: tuple, # (start, end) of the x axis covered by the grid
+                     y_range: tuple, # (start, end) of the y axis covered by the grid
+                     width: int, # number of columns of the grid
+                     height: int, # number of rows of the grid
+                     values = None, # values aggregated by "mean" and "max"
+                     agg: str = "count", # "count" (number of points), "mean" or "max" (of values) in each pixel
+                    )->np.ndarray:
+    """Aggregates the points in a grid of pixels. Returns a float32 array with one row per pixel row (from the bottom) and one column per pixel column, 
+    NaN for pixels without points. `raster_pyramid` computes the same grids at several resolutions for `Track.scatter`."""
+    if agg not in ("count", "mean", "max"):
+        raise ValueError(f"agg must be count, mean or max, not {agg}")
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    cols = np.floor((x - x_range[0])/(x_range[1] - x_range[0])*width)
+    rows = np.floor((y - y_range[0])/(y_range[1] - y_range[0])*height)
+    inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+    pixels = (rows[inside]*width + cols[inside]).astype(np.int64)
+    counts = np.bincount(pixels, minlength=width*height).astype(np.float64)
+    if agg == "count":
+        grid = counts
+    else:
+        values = np.asarray(values, dtype=np.float64)[inside]
+        present = ~np.isnan(values)
+        pixels, values = pixels[present], values[present]
+        counts = np.bincount(pixels, minlength=width*height).astype(np.float64)
+        if agg == "mean":
+            grid = np.bincount(pixels, weights=values, minlength=width*height)/np.maximum(counts, 1)
+        else:
+            grid = np.full(width*height, -np.inf)
+            np.maximum.at(grid, pixels, values)
+    return np.where(counts > 0, grid, np.nan).astype(np.float32).reshape(height, width)
+
+# %% ../nbs/API/04_utils.ipynb 87
+def _raster_grid(totals: np.ndarray, counts: np.ndarray, agg: str)->np.ndarray:
+    grid = totals/np.maximum(counts, 1) if agg == "mean" else totals
+    return np.where(counts > 0, grid, np.nan).astype(np.float32)
+
+def raster_pyramid(x, # positions of the points
+                   y, # y coordinates of the points
+                   bounds: tuple, # (start, end) of the region binned
+                   y_range: tuple, # (start, end) of the y axis covered by the grids
+                   height: int, # number of rows of the grids
+                   min_bin_size: int, # size of the bins of the finest level
+                   values = None, # values aggregated by "mean" and "max"
+                   agg: str = "count", # "count" (number of points), "mean" or "max" (of values) in each pixel
+                   max_bins: int = 1000, # the coarsest level has at most max_bins bins
+                   factor: int = 4, # ratio between the bin sizes of consecutive levels
+                  )->List[Tuple[int, np.ndarray]]:
+    """Aggregates the points in grids of pixels with one column per bin of the region, at several resolutions from bins of min_bin_size bp to bins covering the region with at most max_bins bins.
+    Returns a list of (bin_size, grid) from the finest to the coarsest level, where grid is a float32 array like the grids of `rasterize_points`, 
+    with height rows (from the bottom) and one column per bin. Bin i of a level covers [start + i*bin_size, start + (i+1)*bin_size). 
+    The points on the upper limit of y_range are counted in the top row."""
+    if agg not in ("count", "mean", "max"):
+        raise ValueError(f"agg must be count, mean or max, not {agg}")
+    start, end = bounds
+    bin_size = max(int(min_bin_size), 1)
+    n_bins = max(int(np.ceil((end - start)/bin_size)), 1)
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    y_size = (y_range[1] - y_range[0]) or 1
+    cols = np.floor((x - start)/bin_size)
+    rows = np.where(y == y_range[1], height - 1, np.floor((y - y_range[0])/y_size*height))
+    inside = (cols >= 0) & (cols < n_bins) & (rows >= 0) & (rows < height)
+    if agg != "count":
+        values = np.asarray(values, dtype=np.float64)
+        inside &= ~np.isnan(values)
+        values = values[inside]
+    pixels = (rows[inside]*n_bins + cols[inside]).astype(np.int64)
+    counts = np.bincount(pixels, minlength=height*n_bins).reshape(height, n_bins)
+    if agg == "count":
+        totals = counts
+    elif agg == "mean":
+        totals = np.bincount(pixels, weights=values, minlength=height*n_bins).reshape(height, n_bins)
+    else:
+        totals = np.full(height*n_bins, -np.inf)
+        np.maximum.at(totals, pixels, values)
+        totals = totals.reshape(height, n_bins)
+    levels = [(bin_size, _raster_grid(totals, counts, agg))]
+    while (end - start)/bin_size > max_bins:
+        bin_size *= factor
+        # each bin of the next level aggregates factor bins of the current level
+        n_bins = int(np.ceil(counts.shape[1]/factor))
+        padding = ((0, 0), (0, n_bins*factor - counts.shape[1]))
+        counts = np.pad(counts, padding).reshape(height, n_bins, factor).sum(axis=2)
+        if agg == "count":
+            totals = counts
+        elif agg == "mean":
+            totals = np.pad(totals, padding).reshape(height, n_bins, factor).sum(axis=2)
+        else:
+            totals = np.pad(totals, padding, constant_values=-np.inf).reshape(height, n_bins, factor).max(axis=2)
+        levels.append((bin_size, _raster_grid(totals, counts, agg)))
+    return levels
+
+# %% ../nbs/API/04_utils.ipynb 90
+standard_code = "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG" # amino acids of the 64 codons in TCAG order
+
+_base_numbers = np.full(256, 4, dtype=np.int64)
+for _i, _b in enumerate(b"TCAG"):
+    _base_numbers[_b] = _base_numbers[_b + 32] = _i # upper and lower case
+
+def _codon_numbers(codes: np.ndarray)->np.ndarray:
+    """Number of the codon starting at each position of a byte view of a sequence, 64 when the codon contains a letter other than TCAG"""
+    bases = _base_numbers[codes]
+    numbers = 16*bases[:-2] + 4*bases[1:-1] + bases[2:]
+    numbers[(bases[:-2] == 4) | (bases[1:-1] == 4) | (bases[2:] == 4)] = 64
+    return numbers
+
+def _codon_lookup(codons: List[str])->np.ndarray:
+    lookup = np.zeros(65, dtype=bool)
+    lookup[_codon_numbers(np.frombuffer("".join(codons).encode(), dtype=np.uint8))[::3]] = True
+    return lookup
+
+def find_orfs(seq, # sequence (str or Bio.Seq.Seq)
+              min_length: int = 300, # minimum length of the ORFs in bp, including the stop codon
+              start: int = 0, # position of the first base of seq on the genome
+              start_codons: List[str] = ("ATG", "GTG", "TTG"), # codons starting the ORFs
+              genetic_code: str = standard_code, # amino acids of the 64 codons in TCAG order, stop codons are "*"
+             )->pd.DataFrame:
+    """Finds the open reading frames of the six frames of seq: from the first start codon following a stop codon (or the start of seq) to the next stop codon.
+    Returns a DataFrame with the columns left, right (half-open coordinates on the genome), strand, frame (+1, +2, +3, -1, -2 or -3, 
+    such that the codons of frame ±k start at positions p with p % 3 == k-1) and length (in bp), sorted by left."""
+    codes = np.frombuffer(str(seq).encode("ascii", errors="replace"), dtype=np.uint8)
+    complement = np.arange(256, dtype=np.uint8)
+    for a, b in zip(b"ACGTacgt", b"TGCAtgca"):
+        complement[a] = b
+    is_stop = np.append(np.frombuffer(genetic_code.encode(), dtype=np.uint8) == ord("*"), False)
+    is_start = _codon_lookup(list(start_codons))
+    n = len(codes)
+    orfs = []
+    for strand, strand_codes in [("+", codes), ("-", complement[codes[::-1]])]:
+        numbers = _codon_numbers(strand_codes) if n >= 3 else np.zeros(0, dtype=np.int64)
+        for offset in range(3):
+            codons = numbers[offset::3]
+            stops = np.flatnonzero(is_stop[codons])
+            starts = np.flatnonzero(is_start[codons])
+            if len(stops) == 0 or len(starts) == 0:
+                continue
+            # the first start codon after the previous stop codon
+            previous = np.concatenate([[0], stops[:-1] + 1])
+            first = np.searchsorted(starts, previous)
+            first_start = starts[np.minimum(first, len(starts)-1)]
+            keep = (first < len(starts)) & (first_start < stops)
+            lefts = offset + 3*first_start[keep]
+            rights = offset + 3*stops[keep] + 3
+            if strand == "-":
+                lefts, rights = n - rights, n - lefts
+            orfs.append(pd.DataFrame({"left": lefts + start, "right": rights + start, "strand": strand}))
+    orfs = pd.concat(orfs, ignore_index=True) if len(orfs) > 0 else pd.DataFrame({"left": np.zeros(0, dtype=np.int64), "right": np.zeros(0, dtype=np.int64), "strand": ""})
+    orfs["length"] = orfs.right - orfs.left
+    orfs = orfs[orfs.length >= min_length]
+    orfs.insert(3, "frame", np.where(orfs.strand == "+", "+", "-") + (orfs.left % 3 + 1).astype(str))
+    return orfs.sort_values("left", kind="stable", ignore_index=True)
+
+# %% ../nbs/API/04_utils.ipynb 94
+iupac_codes = {"A": "A", "C": "C", "G": "G", "T": "T", "U": "T", "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC", 
+               "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT"}
+
+_motif_alphabet = "ACGT"
+_motif_codes = np.full(256, len(_motif_alphabet), dtype=np.uint8) # letters other than ACGT reset the automaton
+for _i, _b in enumerate(_motif_alphabet.encode()):
+    _motif_codes[_b] = _motif_codes[_b + 32] = _i # upper and lower case
+
+def reverse_complement(seq: str)->str:
+    """Reverse complement of a DNA sequence, which can contain IUPAC codes"""
+    return seq.upper().translate(str.maketrans("ACGTURYSWKMBDHVN", "TGCAAYRSWMKVHDBN"))[::-1]
+
+def expand_iupac(motif: str, # motif, which can contain IUPAC codes
+                 max_variants: int = 10**4, # a ValueError is raised if the motif matches more sequences
+                )->List[str]:
+    """Returns all the sequences of A, C, G and T matched by the motif"""
+    motif = motif.upper()
+    unknown = set(motif) - set(iupac_codes)
+    if len(unknown) > 0:
+        raise ValueError(f"{motif} contains letters that are not IUPAC codes: {''.join(sorted(unknown))}")
+    if np.prod([len(iupac_codes[c]) for c in motif], dtype=float) > max_variants:
+        raise ValueError(f"{motif} matches more than {max_variants} sequences, split it or increase max_variants")
+    return ["".join(p) for p in itertools.product(*(iupac_codes[c] for c in motif))]
+
+class AhoCorasick:
+    """Aho-Corasick automaton finding all the occurrences of a set of patterns of A, C, G and T in one pass over a sequence"""
+    def __init__(self, patterns: List[str]):
+        n_letters = len(_motif_alphabet) + 1
+        goto = [{}]
+        outputs = [[]]
+        for pattern_ix, pattern in enumerate(patterns):
+            state = 0
+            for code in _motif_codes[np.frombuffer(pattern.encode(), dtype=np.uint8)]:
+                if code not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][code] = len(goto) - 1
+                state = goto[state][code]
+            outputs[state].append(pattern_ix)
+        # dense transition table built in breadth first order, entries are premultiplied by n_letters to save a multiplication per letter
+        fail = [0]*len(goto)
+        delta = [0]*(len(goto)*n_letters)
+        queue = [0]
+        for state in queue:
+            for code in range(n_letters):
+                child = goto[state].get(code)
+                if child is None:
+                    delta[state*n_letters + code] = delta[fail[state]*n_letters + code] if state > 0 else 0
+                else:
+                    fail[child] = delta[fail[state]*n_letters + code]//n_letters if state > 0 else 0
+                    outputs[child] = outputs[child] + outputs[fail[child]]
+                    delta[state*n_letters + code] = child*n_letters
+                    queue.append(child)
+        self.patterns = list(patterns)
+        self.n_letters = n_letters
+        self.delta = delta
+        # patterns ending at each state, as a CSR array
+        self.output_counts = np.array([len(out) for out in outputs], dtype=np.int64)
+        self.output_starts = np.concatenate([[0], np.cumsum(self.output_counts)[:-1]])
+        self.output_patterns = np.array([pattern_ix for out in outputs for pattern_ix in out], dtype=np.int64)
+
+    def find(self, seq)->Tuple[np.ndarray, np.ndarray]:
+        """Returns the end positions (exclusive) and the pattern indices of all the occurrences of the patterns in seq"""
+        codes = _motif_codes[np.frombuffer(str(seq).encode("ascii", errors="replace"), dtype=np.uint8)].tolist()
+        delta = self.delta
+        # the only loop in Python: one table lookup per letter, the occurrences are then read from the states with numpy
+        states = np.fromiter(itertools.accumulate(codes, lambda state, code: delta[state + code], initial=0), 
+                             dtype=np.int64, count=len(codes)+1)[1:] // self.n_letters
+        ends = np.flatnonzero(self.output_counts[states] > 0)
+        counts = self.output_counts[states[ends]]
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        hits = self.output_patterns[np.repeat(self.output_starts[states[ends]], counts) + offsets]
+        return np.repeat(ends, counts) + 1, hits
+
+def find_motifs(seq, # sequence (str or Bio.Seq.Seq)
+                motifs: Union[List[str], Dict[str, str]], # motifs (which can contain IUPAC codes), or dictionary of motifs by name
+                start: int = 0, # position of the first base of seq on the genome
+                reverse_complement: bool = True, # if True the occurrences on the - strand are also returned
+                max_variants: int = 10**4, # maximum number of sequences matched by each motif, see `expand_iupac`
+               )->pd.DataFrame:
+    """Finds all the occurrences of the motifs in seq, in a single pass over the sequence whatever the number of motifs.
+    Returns a DataFrame with the columns left, right (half-open coordinates on the genome), strand, motif (name of the motif) and match (sequence found), sorted by left. 
+    Occurrences of palindromic motifs are only reported on the + strand."""
+    if not isinstance(motifs, Mapping):
+        motifs = {motif: motif for motif in motifs}
+    strands = [("+", lambda m: m)] + ([("-", globals()["reverse_complement"])] if reverse_complement else [])
+    patterns, pattern_motifs, pattern_strands = [], [], []
+    for motif_ix, motif in enumerate(motifs.values()):
+        for strand, transform in strands:
+            variants = expand_iupac(transform(motif), max_variants=max_variants)
+            patterns += variants
+            pattern_motifs += [motif_ix]*len(variants)
+            pattern_strands += [strand]*len(variants)
+    ends, hits = AhoCorasick(patterns).find(seq)
+    lengths = np.array([len(p) for p in patterns], dtype=np.int64)[hits]
+    motif_ixs = np.array(pattern_motifs, dtype=np.int64)[hits]
+    is_minus = (np.array(pattern_strands) == "-")[hits]
+    # keeps one occurrence per position and motif, on the + strand for palindromes
+    order = np.lexsort((is_minus, motif_ixs, ends - lengths))
+    keys = np.stack([(ends - lengths)[order], motif_ixs[order]])
+    order = order[np.concatenate([[True], (np.diff(keys, axis=1) != 0).any(axis=0)])] if len(order) > 0 else order
+    return pd.DataFrame({"left": ends[order] - lengths[order] + start, "right": ends[order] + start,
+                         "strand": np.where(is_minus[order], "-", "+").astype(object),
+                         "motif": pd.Categorical.from_codes(motif_ixs[order], list(motifs)),
+                         "match": np.array(patterns)[hits[order]].astype(object)})
+
+# %% ../nbs/API/04_utils.ipynb 97
+def merge_intervals(data: pd.DataFrame, # DataFrame of intervals
+                    left_col: str = "left", # name of the column containing the start positions of the intervals
+                    right_col: str = "right", # name of the column containing the end positions of the intervals
+                    max_gap: float = 0, # intervals separated by at most max_gap bp are merged
+                    by: Optional[List[str]] = None, # only intervals with the same values in these columns are merged
+                   )->pd.DataFrame:
+    """Merges the overlapping or close intervals. Returns a DataFrame with the columns left_col, right_col, the columns in by 
+    and n: the number of intervals merged in each row, sorted by left_col."""
+    by = [] if by is None else list(by)
+    if len(data) == 0:
+        return pd.DataFrame(columns=[left_col, right_col, "n"] + by)
+    lefts = data[left_col].values
+    rights = data[right_col].values
+    groups = data.groupby(by, sort=False).ngroup().values if len(by) > 0 else np.zeros(len(data), dtype=np.int64)
+    order = np.lexsort((lefts, groups))
+    # the groups are shifted apart by more than max_gap so that a single running maximum can be used for all the groups
+    span = rights.max() - lefts.min() + max_gap + 1
+    offsets = groups[order]*span - lefts.min()
+    shifted_lefts = lefts[order] + offsets
+    shifted_rights = np.maximum.accumulate(rights[order] + offsets)
+    # a new interval starts when its left is further than max_gap from all the previous rights
+    starts = np.flatnonzero(np.concatenate([[True], shifted_lefts[1:] > shifted_rights[:-1] + max_gap]))
+    ends = np.append(starts[1:], len(order)) - 1
+    merged = pd.DataFrame({left_col: shifted_lefts[starts] - offsets[starts], 
+                           right_col: shifted_rights[ends] - offsets[ends], 
+                           "n": ends - starts + 1})
+    for col in by:
+        merged[col] = data[col].values[order[starts]]
+    return merged.sort_values(left_col, kind="stable", ignore_index=True)
+
+# %% ../nbs/API/04_utils.ipynb 101
+def index_by_id(features: pd.DataFrame, # DataFrame of features with an attributes column
+                key: str = "ID", # attribute used as the identifier of the features
+               )->pd.Series:
+    """Returns a Series mapping the identifiers of the features to their row positions in features. 
+    Features without identifier are not indexed, and only the first feature is indexed when several features share an identifier (e.g. a CDS split over several lines)."""
+    ids = get_attribute_values(features["attributes"], key)
+    has_id = ~pd.isna(ids)
+    index = pd.Series(np.flatnonzero(has_id), index=ids[has_id])
+    return index[~index.index.duplicated()]
+
+def _split_blocks(blocks: pd.DataFrame, n_models: int)->np.ndarray:
+    """Splits the blocks (columns model, left and right) into an object array with one (n, 2) array of (left, right) per model"""
+    blocks = blocks.sort_values(["model", "left"], kind="stable")
+    boundaries = np.searchsorted(blocks["model"].values, np.arange(1, n_models))
+    out = np.empty(n_models, dtype=object)
+    out[:] = np.split(blocks[["left", "right"]].values.astype(np.int64), boundaries)
+    return out
+
+def _model_hierarchy(features: pd.DataFrame, part_types: Sequence[str]):
+    """Returns the row positions of the parts, of the transcript of each part, of the transcripts and of the gene of each transcript"""
+    index = index_by_id(features)
+    parents = pd.Series(get_attribute_values(features["attributes"], "Parent"))
+
+    # a part can belong to several transcripts: Parent=transcript1,transcript2
+    is_part = np.isin(features["type"].values, part_types) & parents.notna().values
+    part_parents = parents[is_part].str.split(",").explode()
+    transcript_rows = index.reindex(part_parents.values).values
+    found = ~np.isnan(transcript_rows)
+    part_rows = part_parents.index.values[found].astype(np.int64)
+    transcript_rows = transcript_rows[found].astype(np.int64)
+
+    transcripts = np.unique(transcript_rows)
+    gene_rows = index.reindex(parents.values[transcripts]).values # transcripts with several parents are not supported
+    gene_rows = np.where(np.isnan(gene_rows), transcripts, gene_rows).astype(np.int64)
+    return part_rows, transcript_rows, transcripts, gene_rows
+
+def gene_models(features: pd.DataFrame, # DataFrame of features with an attributes column, e.g. from `parse_gff`
+                collapse: bool = False, # if True, the transcripts of each gene are merged into a single model
+                part_types: Sequence[str] = ("exon", "CDS"), # feature types that are parts of the transcripts
+               )->pd.DataFrame:
+    """Builds gene models from the ID and Parent attributes of the features. The parts are grouped by their parent transcript 
+    and the transcripts are linked to their parent gene. 
+    Returns a DataFrame with one row per transcript (or per gene if collapse is True) and the columns of features plus:
+    gene_id, transcript_id, n_transcripts, exons and cds, where exons and cds are (n, 2) arrays of (left, right) blocks.
+    Parts whose parent is a gene (e.g. the CDS of prokaryotic annotations) make a model with a single transcript: the gene.
+    Transcripts without exons use their CDS as exons."""
+    part_rows, transcript_rows, transcripts, gene_rows = _model_hierarchy(features, part_types)
+    ids = get_attribute_values(features["attributes"], "ID")
+
+    if collapse:
+        model_rows, model_ix = np.unique(gene_rows, return_inverse=True)
+        n_transcripts = np.bincount(model_ix, minlength=len(model_rows))
+        part_models = model_ix[np.searchsorted(transcripts, transcript_rows)]
+    else:
+        model_rows = transcripts
+        n_transcripts = np.ones(len(transcripts), dtype=np.int64)
+        part_models = np.searchsorted(transcripts, transcript_rows)
+
+    parts = pd.DataFrame({"model": part_models, "type": features["type"].values[part_rows],
+                          "left": features["left"].values[part_rows], "right": features["right"].values[part_rows]})
+    # adjacent blocks ([a, b] and [b+1, c]) and the blocks shared by several transcripts are merged
+    blocks = merge_intervals(parts, max_gap=1, by=["model", "type"])
+    exons = _split_blocks(blocks.loc[blocks["type"] != "CDS"], len(model_rows))
+    cds = _split_blocks(blocks.loc[blocks["type"] == "CDS"], len(model_rows))
+    no_exons = np.array([len(e) == 0 for e in exons], dtype=bool)
+    exons[no_exons] = cds[no_exons]
+
+    models = features.iloc[model_rows].copy()
+    models["gene_id"] = ids[model_rows] if collapse else ids[gene_rows]
+    models["transcript_id"] = None if collapse else ids[model_rows]
+    models["n_transcripts"] = n_transcripts
+    models["exons"] = exons
+    models["cds"] = cds
+    return models
+
+# %% ../nbs/API/04_utils.ipynb 102
+def with_gene_models(features: pd.DataFrame, # DataFrame of features with an attributes column, e.g. from `parse_gff`
+                     collapse: bool = False, # if True, the transcripts of each gene are merged into a single model
+                     feature_types: Optional[List[str]] = None, # types of the features that are not part of a gene model to keep, if None all are kept
+                    )->pd.DataFrame:
+    """Replaces the genes, transcripts and parts of features by their gene models (see `gene_models`) and keeps the other features of feature_types.
+    When the transcripts are not collapsed, they get a z_order column that stacks the transcripts of each gene."""
+    part_types = ("exon", "CDS")
+    models = gene_models(features, collapse=collapse, part_types=part_types)
+    # the features that are parts, transcripts or genes of a model are replaced by the models
+    part_rows, _, transcripts, gene_rows = _model_hierarchy(features, part_types)
+    in_model = np.zeros(len(features), dtype=bool)
+    in_model[np.concatenate([part_rows, transcripts, gene_rows])] = True
+    others = features.loc[~in_model]
+    if feature_types is not None:
+        others = others.loc[others["type"].isin(feature_types)]
+    if not collapse:
+        models["z_order"] = models.groupby("gene_id", sort=False).cumcount().values
+        others = others.assign(z_order=0)
+    return pd.concat([models, others]).sort_values("left", kind="stable", ignore_index=True)
+
+# %% ../nbs/API/04_utils.ipynb 106
+class RegionQuery:
+    def __init__(self,
+                 gff_path: str = None, # path to a GFF3 file (also accepts gzip files)
+                 gb_path: str = None, # path to a GenBank file, which provides both the features and the sequences
+                 fasta_path: str = None, # path to a FASTA file with the sequences
+                 feature_types: Optional[list] = None, # list of feature types to extract, if None all the types are extracted
+                 attributes: Optional[Dict[str, List]] = None, # a dictionary with feature types as keys and a list of attributes to extract as values 
+                 cache_size: int = 1024, # number of query results kept in memory
+                ):
+        """Answers many region queries with features and sequences from a set of annotation and sequence files. 
+        The files are parsed once, on the first query: the features of each sequence are indexed with an `IntervalIndex` 
+        and the sequences are kept as strings."""
+        if gff_path is not None and gb_path is not None:
+            raise ValueError("Provide either gff_path or gb_path, not both")
+        self.gff_path = gff_path
+        self.gb_path = gb_path
+        self.fasta_path = fasta_path
+        self.feature_types = feature_types
+        self.attributes = attributes
+        self.cache_size = cache_size
+        self._features = None # DataFrame of features by seq_id
+        self._indexes = {} # IntervalIndex by seq_id
+        self._sequences = {} # sequences by seq_id, loaded on demand
+        self._fasta_index = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load_features(self):
+        if self._features is not None:
+            return
+        dfs = []
+        if self.gff_path is not None:
+            dfs = parse_gff(self.gff_path, first=False, feature_types=self.feature_types, attributes=self.attributes)
+        elif self.gb_path is not None:
+            seqs, dfs = parse_genbank(self.gb_path, first=False, feature_types=self.feature_types, attributes=self.attributes)
+            self._sequences.update({df.seq_id.iloc[0]: str(seq) for seq, df in zip(seqs, dfs) if len(df) > 0})
+        self._features = {}
+        for df in dfs:
+            if len(df) > 0:
+                seq_id = df.seq_id.iloc[0]
+                df = df.reset_index(drop=True)
+                self._features[seq_id] = df
+                self._indexes[seq_id] = IntervalIndex(df["left"].values, df["right"].values)
+
+    def _load_sequence(self, seq_id: str)->Optional[str]:
+        if seq_id not in self._sequences and self.fasta_path is not None:
+            from Bio import SeqIO
+            if self._fasta_index is None:
+                if is_gzipped_file(self.fasta_path): # gzip files cannot be indexed, all the records are read
+                    with default_open_gz(self.fasta_path) as handle:
+                        self._fasta_index = {rec.id: rec for rec in SeqIO.parse(handle, "fasta")}
+                else: # only the offsets of the records are read
+                    self._fasta_index = SeqIO.index(self.fasta_path, "fasta")
+            if seq_id in self._fasta_index:
+                self._sequences[seq_id] = str(self._fasta_index[seq_id].seq)
+        return self._sequences.get(seq_id)
+
+    @property
+    def seq_ids(self)->List[str]:
+        "ids of the sequences with features"
+        self._load_features()
+        return list(self._features)
+
+    def features(self, 
+                 seq_id: str, # id of the sequence
+                 start: int, # start of the region
+                 end: int, # end of the region
+                )->pd.DataFrame:
+        """Returns the features of seq_id overlapping [start, end) (0-based, as in `sequence`), sorted by left position. 
+        The result is a copy, which can be modified without affecting later queries."""
+        key = ("features", seq_id, start, end)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key].copy()
+        self._load_features()
+        if seq_id in self._indexes:
+            # left is the 1-based start of the features: they overlap the 0-based region if left - 1 < end
+            out = self._features[seq_id].iloc[self._indexes[seq_id].query(start, end + 1)]
+        else:
+            out = pd.DataFrame(columns=["seq_id", "source", "type", "start", "end", "score", "strand", "phase", "attributes", "left", "right", "middle"])
+        with self._lock:
+            self._cache[key] = out
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return out.copy()
+
+    def sequence(self, 
+                 seq_id: str, # id of the sequence
+                 start: int, # start of the region (0-based)
+                 end: int, # end of the region (excluded)
+                )->Optional[str]:
+        """Returns the sequence of seq_id between start and end, or None if the sequence is not available"""
+        self._load_features() # GenBank files provide the sequences
+        seq = self._load_sequence(seq_id)
+        return None if seq is None else seq[max(start, 0):max(end, 0)]
+
+    def query(self, 
+              regions: Union[pd.DataFrame, Iterable[tuple]], # DataFrame with the columns seq_id, start and end or iterable of (seq_id, start, end)
+              sequence: bool = True, # if True the sequences of the regions are returned
+              threads: Optional[int] = None, # if not None, the regions of different sequences are processed in a pool of threads
+             )->List[Tuple[pd.DataFrame, Optional[str]]]:
+        """Returns a (features, sequence) tuple for each region, in the order of regions. 
+        The regions are sorted so that the features and sequence of each seq_id are loaded once."""
+        if not isinstance(regions, pd.DataFrame):
+            regions = pd.DataFrame(list(regions), columns=["seq_id", "start", "end"])
+        regions = regions[["seq_id", "start", "end"]].reset_index(drop=True)
+        self._load_features()
+        if sequence:
+            for seq_id in pd.unique(regions["seq_id"]):
+                self._load_sequence(seq_id)
+        
+        def query_group(group):
+            return [(i, self.features(seq_id, start, end), self.sequence(seq_id, start, end) if sequence else None)
+                    for i, seq_id, start, end in group.sort_values("start").itertuples()]
+        
+        groups = [group for _, group in regions.groupby("seq_id", sort=True)]
+        if threads is None:
+            results = map(query_group, groups)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(threads) as pool:
+                results = list(pool.map(query_group, groups))
+        out = [None]*len(regions)
+        for group_results in results:
+            for i, features, seq in group_results:
+                out[i] = (features, seq)
+        return out
+
+    def query_features(self, 
+                       regions: Union[pd.DataFrame, Iterable[tuple]], # DataFrame with the columns seq_id, start and end or iterable of (seq_id, start, end)
+                       threads: Optional[int] = None, # if not None, the regions of different sequences are processed in a pool of threads
+                      )->pd.DataFrame:
+        """Returns the features of all the regions in a single DataFrame, with a region column holding the position of the region in regions"""
+        results = self.query(regions, sequence=False, threads=threads)
+        if len(results) == 0:
+            return pd.DataFrame()
+        return pd.concat([features.assign(region=i) for i, (features, _) in enumerate(results)], ignore_index=True)
+
+# %% ../nbs/API/04_utils.ipynb 109
+def iter_bedgraph(bedgraph_path: str, # path to a bedGraph file (also accepts gzip files)
+                  seq_id: Optional[str] = None, # if not None, only the intervals on the sequence with this id are returned
+                  bounds: Optional[tuple] = None, # (left limit, right limit), only the intervals that overlap the bounds are returned
+                  chunksize: int = 10**6, # number of lines read at once
+                 )->Iterator[pd.DataFrame]:
+    """Streams a bedGraph file and yields DataFrames with the columns seq_id, left, right and value for each chunk of the file."""
+    return _iter_tabular(bedgraph_path, ["seq_id","left","right","value"], 
+                         {"seq_id":str, "left":np.int64, "right":np.int64, "value":np.float64}, 
+                         seq_id, bounds, chunksize)
+
+# %% ../nbs/API/04_utils.ipynb 110
+def _wig_chunk(chrom, lefts, span, values, bounds):
+    lefts = np.array(lefts, dtype=np.int64)
+    chunk = pd.DataFrame({"seq_id": chrom, "left": lefts, "right": lefts+span, "value": np.asarray(values, dtype=np.float64)})
+    if bounds is not None:
+        chunk = chunk.loc[(chunk["right"] > bounds[0]) & (chunk["left"] < bounds[1])]
+    return chunk
+
+def iter_wig(wig_path: str, # path to a WIG file (also accepts gzip files)
+             seq_id: Optional[str] = None, # if not None, only the data on the sequence with this id is returned
+             bounds: Optional[tuple] = None, # (left limit, right limit), only the data that overlaps the bounds is returned
+             chunksize: int = 10**6, # maximum number of data lines per chunk
+            )->Iterator[pd.DataFrame]:
+    """Streams a WIG file (fixedStep and variableStep sections) and yields DataFrames with the columns seq_id, left, right and value.
+    Positions are converted to 0-based half-open intervals. The lines of the sections on other sequences are skipped without being parsed."""
+    chrom, fixed, keep = None, True, False
+    start, step, span = 0, 1, 1
+    lefts, values = [], []
+    with default_open_gz(wig_path) as handle:
+        for line in handle:
+            if line.startswith(("fixedStep", "variableStep")):
+                if len(lefts) > 0:
+                    yield _wig_chunk(chrom, lefts, span, values, bounds)
+                    lefts, values = [], []
+                fields = dict(f.split("=") for f in line.split()[1:])
+                chrom = fields["chrom"]
+                fixed = line.startswith("fixedStep")
+                start = int(fields.get("start", 1)) - 1
+                step = int(fields.get("step", 1))
+                span = int(fields.get("span", 1))
+                keep = seq_id is None or chrom == seq_id
+            elif not keep or line.startswith(("track", "browser", "#")) or not line.strip():
+                continue
+            elif fixed:
+                if bounds is None or bounds[0] - span < start < bounds[1]:
+                    lefts.append(start)
+                    values.append(line)
+                start += step
+            else:
+                pos, value = line.split()
+                lefts.append(int(pos) - 1)
+                values.append(value)
+
+            if len(lefts) >= chunksize:
+                yield _wig_chunk(chrom, lefts, span, values, bounds)
+                lefts, values = [], []
+    if len(lefts) > 0:
+        yield _wig_chunk(chrom, lefts, span, values, bounds)
+
+# %% ../nbs/API/04_utils.ipynb 113
+_track_file_formats = {".bedgraph": "bedgraph", ".bdg": "bedgraph", ".wig": "wig", ".bw": "bigwig", ".bigwig": "bigwig"}
+
+def _read_bigwig(bigwig_path, seq_id=None, bounds=None):
+    try: #pyBigWig cannot be installed on Windows
+        import pyBigWig
+    except ImportError:
+        raise ImportError("pyBigWig is required to read bigWig files")
+    bw = pyBigWig.open(bigwig_path)
+    chroms = bw.chroms()
+    seq_id = seq_id if seq_id is not None else next(iter(chroms))
+    intervals = []
+    if seq_id in chroms:
+        start, end = bounds if bounds is not None else (0, chroms[seq_id])
+        intervals = bw.intervals(seq_id, max(int(start), 0), min(int(end), chroms[seq_id])) or []
+    bw.close()
+    intervals = np.array(intervals, dtype=np.float64).reshape(-1, 3)
+    return pd.DataFrame({"seq_id": seq_id, 
+                         "left": intervals[:, 0].astype(np.int64), 
+                         "right": intervals[:, 1].astype(np.int64), 
+                         "value": intervals[:, 2]})
+
+def read_track_file(file_path: str, # path to a bedGraph, WIG or bigWig file (bedGraph and WIG files can be gzipped)
+                    seq_id: Optional[str] = None, # if not None, only the data on the sequence with this id is returned
+                    bounds: Optional[tuple] = None, # (left limit, right limit), only the data that overlaps the bounds is returned
+                    file_format: Optional[str] = None, # bedgraph, wig or bigwig. If None, the format is guessed from the file extension
+                    chunksize: int = 10**6, # number of lines read at once
+                   )->pd.DataFrame:
+    """Reads the data of a bedGraph, WIG or bigWig file that falls on seq_id and within bounds. 
+    Files are streamed so that memory stays proportional to the region. bigWig files, and bedGraph files indexed with tabix when pysam is installed, are read through their index.
+    Returns a DataFrame with the columns seq_id, left, right, pos and value, where pos is the middle of each interval."""
+    if file_format is None:
+        base_name, ext = os.path.splitext(file_path[:-3] if file_path.endswith(".gz") else file_path)
+        if ext.lower() not in _track_file_formats:
+            raise ValueError(f"Cannot guess the format of {file_path}, please specify file_format")
+        file_format = _track_file_formats[ext.lower()]
+    
+    if file_format == "bigwig":
+        df = _read_bigwig(file_path, seq_id, bounds)
+    elif file_format in ["bedgraph", "wig"]:
+        iter_file = iter_bedgraph if file_format == "bedgraph" else iter_wig
+        chunks = list(iter_file(file_path, seq_id=seq_id, bounds=bounds, chunksize=chunksize))
+        df = pd.concat(chunks, ignore_index=True) if len(chunks) > 0 else pd.DataFrame(columns=["seq_id","left","right","value"])
+    else:
+        raise ValueError(f"file_format must be bedgraph, wig or bigwig, not {file_format}")
+
+    if len(df)==0:
+        raise EmptyDataFrame("No data was found in the file. Check that the seq_id is correct, and that bounds (if specified) overlap the data.")
+    df["pos"] = (df["left"] + df["right"]) / 2
+    return df
+
+# %% ../nbs/API/04_utils.ipynb 119
+_vcf_columns = ["seq_id", "pos", "id", "ref", "alt", "qual", "filter", "info", "format"]
+
+def vcf_samples(vcf_path: str, # path to a VCF file (also accepts gzip and bgzip files)
+               )->List[str]:
+    """Returns the names of the samples of a VCF file"""
+    with default_open_gz(vcf_path) as handle:
+        for line in handle:
+            if line.startswith("#CHROM"):
+                return line.rstrip("\n").split("\t")[9:]
+            if not line.startswith("##"):
+                break
+    return []
+
+def _vcf_header_lines(vcf_path):
+    n = 0
+    with default_open_gz(vcf_path) as handle:
+        for line in handle:
+            if not line.startswith("#"):
+                break
+            n += 1
+    return n
+
+def _genotype_codes(values: np.ndarray)->np.ndarray:
+    """Decodes the sample fields of a VCF (GT first) into -1 (missing), 0 (homozygous reference), 1 (heterozygous) or 2 (homozygous alternative)"""
+    gts, inverse = np.unique(values.astype(str), return_inverse=True)
+    codes = np.empty(len(gts), dtype=np.int8)
+    for i, gt in enumerate(gts):
+        alleles = re.split("[/|]", gt.split(":", 1)[0])
+        if "." in alleles or gt == "nan":
+            codes[i] = -1
+        elif all(a == "0" for a in alleles):
+            codes[i] = 0
+        else:
+            codes[i] = 1 if len(set(alleles)) > 1 else 2
+    return codes[inverse].reshape(values.shape)
+
+def iter_vcf(vcf_path: str, # path to a VCF file (also accepts gzip and bgzip files)
+             seq_id: Optional[str] = None, # if not None, only the variants on the sequence with this id are returned
+             bounds: Optional[tuple] = None, # (left limit, right limit), only the variants that overlap the bounds are returned
+             samples: Optional[List[str]] = None, # samples whose genotypes are returned, if None all the samples are returned
+             chunksize: int = 10**5, # number of lines read at once
+            )->Iterator[pd.DataFrame]:
+    """Streams a VCF file and yields DataFrames with the columns seq_id, pos (1-based as in the VCF), id, ref, alt, qual, filter, 
+    left and right (0-based half-open interval of the reference allele) and one int8 column gt_{sample} per sample (see above).
+    If the file is bgzipped with a tabix index and pysam is installed, only the lines of the region are read."""
+    all_samples = vcf_samples(vcf_path)
+    samples = all_samples if samples is None else list(samples)
+    missing = set(samples) - set(all_samples)
+    if len(missing) > 0:
+        raise ValueError(f"samples not found in {vcf_path}: {', '.join(sorted(missing))}")
+    sample_cols = [9 + all_samples.index(s) for s in samples]
+    read_args = dict(sep="\t", header=None, usecols=list(range(7)) + sample_cols, dtype=str, comment=None, quoting=3)
+    index = _tabix_index(vcf_path)
+    if index is not None and seq_id is not None:
+        def _chunks():
+            import pysam
+            with pysam.TabixFile(vcf_path, index=index) as tbx:
+                if seq_id not in tbx.contigs:
+                    return
+                lines = tbx.fetch(seq_id, int(bounds[0]), int(bounds[1])) if bounds is not None else tbx.fetch(seq_id)
+                while True:
+                    block = list(itertools.islice(lines, chunksize))
+                    if len(block)==0:
+                        return
+                    yield pd.read_csv(io.StringIO("\n".join(block)), **read_args)
+        reader = _chunks()
+    else:
+        reader = pd.read_csv(vcf_path, skiprows=_vcf_header_lines(vcf_path), chunksize=chunksize,
+                             compression="gzip" if is_gzipped_file(vcf_path) else None, **read_args)
+    for chunk in reader:
+        chunk = chunk[list(range(7)) + sample_cols] # usecols keeps the file order, the samples are returned in the requested order
+        chunk.columns = _vcf_columns[:7] + [f"gt_{s}" for s in samples]
+        chunk["pos"] = chunk["pos"].astype(np.int64)
+        chunk["left"] = chunk["pos"] - 1
+        chunk["right"] = chunk["left"] + chunk["ref"].str.len()
+        flt = np.ones(len(chunk), dtype=bool)
+        if seq_id is not None:
+            flt &= (chunk["seq_id"] == seq_id).values
+        if bounds is not None:
+            flt &= (chunk["right"] > bounds[0]).values & (chunk["left"] < bounds[1]).values
+        if not flt.any():
+            continue
+        chunk = chunk.loc[flt]
+        variants = chunk[_vcf_columns[:7] + ["left", "right"]].copy()
+        variants["qual"] = pd.to_numeric(variants["qual"], errors="coerce")
+        if len(samples) > 0:
+            codes = _genotype_codes(chunk[[f"gt_{s}" for s in samples]].values)
+            for j, s in enumerate(samples):
+                variants[f"gt_{s}"] = codes[:, j]
+        yield variants.reset_index(drop=True)
+
+# %% ../nbs/API/04_utils.ipynb 123
+def read_arrow_track(source, # path to a Parquet file or directory of Parquet files, pyarrow Table or pyarrow Dataset
+                     pos: str, # name of the column containing the positions
+                     columns: Optional[List[str]] = None, # other columns to read
+                     seq_id: Optional[str] = None, # if not None and the data has a seq_id_col column, only the rows on this sequence are read
+                     seq_id_col: str = "seq_id", # name of the column (or partition key) containing the sequence ids
+                     bounds: Optional[tuple] = None, # (left limit, right limit), only the rows with pos within the bounds are read
+                    )->pd.DataFrame:
+    """Reads the columns pos and columns of the rows on seq_id and within bounds, sorted by pos. 
+    The numeric columns share the buffers of the Arrow table when it holds a single chunk without missing values."""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError("pyarrow is required to read Parquet files and Arrow data")
+    if isinstance(source, ds.Dataset):
+        dataset = source
+    elif isinstance(source, (pa.Table, pa.RecordBatch)):
+        dataset = ds.dataset(source)
+    else:
+        dataset = ds.dataset(source, format="parquet", partitioning="hive")
+    names = dataset.schema.names
+    columns = list(dict.fromkeys([pos] + [c for c in (columns or []) if c])) # removes duplicates and None
+    missing = [c for c in columns if c not in names]
+    if len(missing) > 0:
+        raise ValueError(f"Columns {missing} are not in the data, available columns are {names}")
+
+    condition = None
+    if bounds is not None:
+        condition = (ds.field(pos) >= bounds[0]) & (ds.field(pos) <= bounds[1])
+    if seq_id is not None and seq_id_col in names:
+        on_seq = ds.field(seq_id_col) == seq_id
+        condition = on_seq if condition is None else condition & on_seq
+    table = dataset.to_table(columns=columns, filter=condition)
+    if table.num_rows == 0:
+        raise EmptyDataFrame("No data was found. Check that the seq_id is correct, and that bounds (if specified) overlap the data.")
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    if not df[pos].is_monotonic_increasing:
+        df = df.sort_values(pos, ignore_index=True)
+    return df
+
+# %% ../nbs/API/04_utils.ipynb 125
+profile_logger = logging.getLogger("genomenotebook.profile")
+
+class StageProfiler:
+    def __init__(self, 
+                 enabled: bool = False, # if False, stages are not recorded
+                ):
+        """Records the duration, number of rows and payload size in bytes of the stages of the construction and rendering of a browser.
+        Records are also emitted at the INFO level to the "genomenotebook.profile" logger."""
+        self.enabled = enabled
+        self.records = []
+
+    @contextmanager
+    def stage(self, 
+              name: str, # name of the stage
+              rows: Optional[int] = None, # number of rows processed by the stage
+              nbytes: Optional[int] = None, # size of the payload produced by the stage
+             ):
+        """Context manager timing a stage. It yields a dictionary in which "rows" and "bytes" can be set while the stage runs."""
+        if not self.enabled:
+            yield {}
+            return
+        record = {"stage": name, "seconds": None, "rows": rows, "bytes": nbytes}
+        self.records.append(record)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - t0
+            profile_logger.info("%s: %.3f s, rows=%s, bytes=%s", name, record["seconds"], record["rows"], record["bytes"])
+
+    def to_df(self)->pd.DataFrame:
+        """Returns the records as a DataFrame with one row per stage, in the order in which the stages started"""
+        return pd.DataFrame(self.records, columns=["stage", "seconds", "rows", "bytes"])
+
+    def reset(self):
+        self.records = []
+
+# %% ../nbs/API/04_utils.ipynb 129
+def _estimate_column_bytes(values, sample_size: int = 1000)->int:
+    n = len(values)
+    if n == 0:
+        return 2
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        itemsize = values.dtype.itemsize
+        if values.dtype.kind in "iu" and itemsize == 8 and np.abs(values).max() < 2**31:
+            itemsize = 4 # Bokeh converts 64 bits integers to 32 bits when possible
+        return int(values.size*itemsize*4/3) + 100 # numerical arrays, including the 2D arrays of images, are serialized in base64
+    if isinstance(values, (list, tuple)) and all(isinstance(v, np.ndarray) and v.dtype.kind in "biuf" for v in values):
+        return sum(_estimate_column_bytes(v) for v in values) # columns of images
+    ix = np.linspace(0, n-1, min(n, sample_size)).astype(int)
+    sample = [values[i] for i in ix]
+    return int(len(json.dumps(sample, default=str))*n/len(sample))
+
+def estimate_payload(data: Union[pd.DataFrame, Dict[str, Iterable], str, None], # DataFrame or dict of columns as passed to a ColumnDataSource, or a string
+                     sample_size: int = 1000, # number of values of each non numerical column that are serialized to extrapolate its size
+                    )->int:
+    """Estimates the size in bytes of data once serialized in a Bokeh document. 
+    Numerical numpy arrays are serialized in base64, other columns as JSON lists whose size is extrapolated from a sample of their values."""
+    if data is None:
+        return 0
+    if isinstance(data, str):
+        return len(data) + 2
+    if isinstance(data, pd.DataFrame):
+        columns = {"index": data.index.values} # ColumnDataSource adds the index of DataFrames as a column
+        columns.update((c, data[c].values) for c in data.columns)
+    else:
+        columns = data
+    return sum(len(str(name)) + _estimate_column_bytes(values, sample_size) for name, values in columns.items())
+
+# %% ../nbs/API/04_utils.ipynb 134
 def in_wsl() -> bool:
     return 'microsoft-standard' in uname().release
 
-# %% ../nbs/API/04_utils.ipynb 56
+# %% ../nbs/API/04_utils.ipynb 136
 def add_extension(filename,extension="svg"):
     base_name, ext = os.path.splitext(filename)
     if ext.lower() != '.'+extension:
         filename += '.'+extension
     return filename
 
-# %% ../nbs/API/04_utils.ipynb 60
+# %% ../nbs/API/04_utils.ipynb 140
 from bokeh.plotting import show as bk_show
 from bokeh.layouts import column, row
 from bokeh.io import output_notebook, reset_output
 from bokeh.plotting import save as bk_save #Need to rename the bokeh show function so that there is no confusion with GenomeBrowser.show
 from bokeh.plotting import output_file as bk_output_file #Need to rename the bokeh show function so that there is no confusion with GenomeBrowser.show
-from bokeh.io import output_notebook, reset_output, export_png, export_svgs, export_svg
-from svgutils import compose
 import os
 import warnings
-from selenium.webdriver.chrome.options import Options
-from selenium import webdriver
 
-# %% ../nbs/API/04_utils.ipynb 61
+# %% ../nbs/API/04_utils.ipynb 141
 def _save(elements, heights, width, fname:str, title:str="Genome Plot"):
     base_name, ext = os.path.splitext(fname)
     ext = ext.lower()
     if ext not in {".svg", ".png"}:
         raise ValueError(f"filename must end in svg or png, not {ext}")
+
+    # the export machinery is only imported when exporting, so that importing genomenotebook stays fast
+    from bokeh.io import export_png, export_svgs
+    from svgutils import compose
+    from selenium.webdriver.chrome.options import Options
+    from selenium import webdriver
+    try: #for wsl and/or conda
+        import chromedriver_binary
+    except:
+        pass
     
     reset_output()
     bk_output_file(filename=fname, title=title)
@@ -559,16 +2055,148 @@ def _save(elements, heights, width, fname:str, title:str="Genome Plot"):
     
     reset_output()
 
-# %% ../nbs/API/04_utils.ipynb 65
+# %% ../nbs/API/04_utils.ipynb 145
 def _save_html(elements, fname:str, title:str):
     reset_output()
     bk_output_file(filename=fname, title=title, mode='inline')
     bk_save(column(elements))
     reset_output()
 
-# %% ../nbs/API/04_utils.ipynb 66
-def _gb_show(elements):
+# %% ../nbs/API/04_utils.ipynb 146
+def _gb_show(elements, notebook_handle=False):
     reset_output()
     output_notebook(hide_banner=True)
-    bk_show(column(elements))
+    handle = bk_show(column(elements), notebook_handle=notebook_handle) # the handle is used to update the plot with push_notebook
+    reset_output()
+    return handle
+
+# %% ../nbs/API/04_utils.ipynb 148
+class _Uncacheable(Exception):
+    pass
+
+def _hash_update(h, obj, exclude: Sequence[str] = ()):
+    """Feeds a canonical representation of obj to the hash h, skipping the keys and attributes in exclude at any depth. 
+    Raises _Uncacheable for objects whose content cannot be hashed reliably"""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes, np.generic)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, pd.DataFrame):
+        h.update(f"DataFrame{obj.shape}:".encode() + pickle.dumps(obj.index, protocol=4))
+        for name, column in obj.items():
+            _hash_update(h, name)
+            _hash_update(h, column.values)
+    elif isinstance(obj, pd.Series):
+        h.update(b"Series:" + pickle.dumps(obj.index, protocol=4))
+        _hash_update(h, [obj.name, obj.values])
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind in "biufcmM":
+        h.update(f"ndarray:{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).data)
+    elif isinstance(obj, np.ndarray) and obj.ndim == 1 and pd.api.types.infer_dtype(obj, skipna=False) == "string":
+        # vectorized hash of the strings, much faster than pickling them
+        h.update(f"strings[{len(obj)}]".encode())
+        h.update(pd.util.hash_array(obj, categorize=False).data)
+    elif (isinstance(obj, np.ndarray) and obj.ndim == 1 and len(obj) > 0 and isinstance(obj[0], AttributeRow) 
+          and all(isinstance(row, AttributeRow) and row.store is obj[0].store for row in obj)):
+        # attributes parsed from files: the columns of the store are hashed once
+        h.update(b"attribute rows:")
+        _hash_update(h, [obj[0].store, np.fromiter((row.index for row in obj), dtype=np.int64, count=len(obj))], exclude)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        h.update(f"{type(obj).__name__}[{len(obj)}]".encode())
+        for item in (sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj):
+            _hash_update(h, item, exclude)
+    elif isinstance(obj, Mapping):
+        items = [(key, value) for key, value in obj.items() if key not in exclude]
+        h.update(f"{type(obj).__name__}{{{len(items)}}}".encode())
+        for key, value in items:
+            _hash_update(h, key, exclude)
+            _hash_update(h, value, exclude)
+    elif callable(obj) and hasattr(obj, "__code__"):
+        # functions defined outside of genomenotebook can depend on any global state
+        if not (obj.__module__ or "").startswith("genomenotebook"): # __module__ is None for functions created with exec
+            raise _Uncacheable(f"{obj.__qualname__} is defined outside of genomenotebook")
+        code = obj.__code__
+        h.update(f"function:{obj.__module__}.{obj.__qualname__}".encode() + code.co_code)
+        _hash_update(h, [c for c in code.co_consts if not hasattr(c, "co_code")], exclude)
+        _hash_update(h, [obj.__defaults__, obj.__kwdefaults__], exclude)
+        _hash_update(h, [cell.cell_contents for cell in obj.__closure__ or []], exclude)
+    elif (type(obj).__module__ or "").startswith("genomenotebook") and hasattr(obj, "__dict__"):
+        h.update(f"object:{type(obj).__qualname__}".encode())
+        _hash_update(h, vars(obj), exclude)
+    else:
+        try:
+            h.update(f"{type(obj).__qualname__}:".encode() + pickle.dumps(obj, protocol=4))
+        except Exception as e:
+            raise _Uncacheable(f"objects of type {type(obj).__qualname__} cannot be hashed") from e
+
+def content_hash(obj, # object to hash: DataFrames, arrays, sequences, containers, genomenotebook objects and their render functions
+                 exclude: Sequence[str] = (), # attributes or keys that are not hashed
+                )->Optional[str]:
+    """Returns a hash of the content of obj, or None if obj contains objects whose content cannot be hashed reliably.
+    Equal contents always have the same hash, different contents have different hashes (up to the hash collisions of blake2b)."""
+    h = hashlib.blake2b(digest_size=20)
+    try:
+        _hash_update(h, obj, exclude)
+    except _Uncacheable:
+        return None
+    return h.hexdigest()
+
+class RenderCache:
+    """Least recently used cache of serialized plots. Entries larger than max_bytes are not stored."""
+    def __init__(self, 
+                 max_bytes: int = 2**28, # maximum total size of the entries, 0 disables the cache
+                ):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @property
+    def nbytes(self)->int:
+        return sum(len(value) for entry in self.entries.values() for value in entry)
+
+    def get(self, key: Optional[str])->Optional[tuple]:
+        """Returns the entry stored for key, or None"""
+        with self.lock:
+            entry = self.entries.get(key) if key is not None else None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Optional[str], entry: tuple):
+        """Stores a tuple of strings or bytes and evicts the least recently used entries above max_bytes"""
+        if key is None or sum(len(value) for value in entry) > self.max_bytes:
+            return
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while self.nbytes > self.max_bytes:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+render_cache = RenderCache()
+
+# %% ../nbs/API/04_utils.ipynb 150
+def _notebook_content(elements)->Tuple[str, str, str, str]:
+    """Serializes the elements for a notebook output. Returns the script, the div, the id of the div and the id of the root model"""
+    from bokeh.embed.notebook import notebook_content
+    layout = column(elements)
+    script, div, _ = notebook_content(layout)
+    return script, div, re.search('id="([^"]+)"', div).group(1), layout.id
+
+def _publish_notebook_content(script: str, div: str, element_id: str, root_id: str):
+    """Displays serialized elements in the notebook, under a new div id so that the same content can be displayed several times"""
+    from bokeh.io.notebook import publish_display_data, HTML_MIME_TYPE, JS_MIME_TYPE, EXEC_MIME_TYPE
+    from bokeh.util.serialization import make_globally_unique_id
+    reset_output()
+    output_notebook(hide_banner=True) # loads BokehJS if needed
     reset_output()
+    new_id = make_globally_unique_id()
+    publish_display_data({HTML_MIME_TYPE: div.replace(element_id, new_id)})
+    publish_display_data({JS_MIME_TYPE: script.replace(element_id, new_id), EXEC_MIME_TYPE: ""}, metadata={EXEC_MIME_TYPE: {"id": root_id}})